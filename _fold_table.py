@@ -0,0 +1,19 @@
+# _fold_table.py
+# Sinh tự động bởi slugify._write_fold_table (make fold-table), không sửa tay.
+"""
+Bảng gập code point -> ASCII dựng sẵn cho slugify (ngoài ASCII).
+
+Mỗi đoạn (lo, hi, giá trị): giá trị của lo..hi-1 nối bằng slugify._FOLD_SEP;
+một chuỗi mỗi đoạn nên import không phải biên dịch dict lớn.
+"""
+UNIDATA_VERSION = '14.0.0'
+FOLD_RANGES = (
+    (0x0080, 0x0250, '\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80 \x80\x80\x80\x80\x80\x80\x80\x80 \x80\x80a\x80\x80\x80\x80\x80 \x80\x80\x802\x803\x80 \x80\x80\x80\x80 \x801\x80o\x80\x8014\x8012\x8034\x80\x80A\x80A\x80A\x80A\x80A\x80A\x80\x80C\x80E\x80E\x80E\x80E\x80I\x80I\x80I\x80I\x80\x80N\x80O\x80O\x80O\x80O\x80O\x80\x80\x80U\x80U\x80U\x80U\x80Y\x80\x80\x80a\x80a\x80a\x80a\x80a\x80a\x80\x80c\x80e\x80e\x80e\x80e\x80i\x80i\x80i\x80i\x80\x80n\x80o\x80o\x80o\x80o\x80o\x80\x80\x80u\x80u\x80u\x80u\x80y\x80\x80y\x80A\x80a\x80A\x80a\x80A\x80a\x80C\x80c\x80C\x80c\x80C\x80c\x80C\x80c\x80D\x80d\x80D\x80d\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80G\x80g\x80G\x80g\x80G\x80g\x80G\x80g\x80H\x80h\x80\x80\x80I\x80i\x80I\x80i\x80I\x80i\x80I\x80i\x80I\x80\x80IJ\x80ij\x80J\x80j\x80K\x80k\x80\x80L\x80l\x80L\x80l\x80L\x80l\x80L\x80l\x80\x80\x80N\x80n\x80N\x80n\x80N\x80n\x80n\x80\x80\x80O\x80o\x80O\x80o\x80O\x80o\x80\x80\x80R\x80r\x80R\x80r\x80R\x80r\x80S\x80s\x80S\x80s\x80S\x80s\x80S\x80s\x80T\x80t\x80T\x80t\x80\x80\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80W\x80w\x80Y\x80y\x80Y\x80Z\x80z\x80Z\x80z\x80Z\x80z\x80s\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80O\x80o\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80U\x80u\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80DZ\x80Dz\x80dz\x80LJ\x80Lj\x80lj\x80NJ\x80Nj\x80nj\x80A\x80a\x80I\x80i\x80O\x80o\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80\x80A\x80a\x80A\x80a\x80\x80\x80\x80\x80G\x80g\x80K\x80k\x80O\x80o\x80O\x80o\x80\x80\x80j\x80DZ\x80Dz\x80dz\x80G\x80g\x80\x80\x80N\x80n\x80A\x80a\x80\x80\x80\x80\x80A\x80a\x80A\x80a\x80E\x80e\x80E\x80e\x80I\x80i\x80I\x80i\x80O\x80o\x80O\x80o\x80R\x80r\x80R\x80r\x80U\x80u\x80U\x80u\x80S\x80s\x80T\x80t\x80\x80\x80H\x80h\x80\x80\x80\x80\x80\x80\x80A\x80a\x80E\x80e\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80Y\x80y\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'),
+    (0x0300, 0x0370, '\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'),
+    (0x1e00, 0x1f00, 'A\x80a\x80B\x80b\x80B\x80b\x80B\x80b\x80C\x80c\x80D\x80d\x80D\x80d\x80D\x80d\x80D\x80d\x80D\x80d\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80F\x80f\x80G\x80g\x80H\x80h\x80H\x80h\x80H\x80h\x80H\x80h\x80H\x80h\x80I\x80i\x80I\x80i\x80K\x80k\x80K\x80k\x80K\x80k\x80L\x80l\x80L\x80l\x80L\x80l\x80L\x80l\x80M\x80m\x80M\x80m\x80M\x80m\x80N\x80n\x80N\x80n\x80N\x80n\x80N\x80n\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80P\x80p\x80P\x80p\x80R\x80r\x80R\x80r\x80R\x80r\x80R\x80r\x80S\x80s\x80S\x80s\x80S\x80s\x80S\x80s\x80S\x80s\x80T\x80t\x80T\x80t\x80T\x80t\x80T\x80t\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80V\x80v\x80V\x80v\x80W\x80w\x80W\x80w\x80W\x80w\x80W\x80w\x80W\x80w\x80X\x80x\x80X\x80x\x80Y\x80y\x80Z\x80z\x80Z\x80z\x80Z\x80z\x80h\x80t\x80w\x80y\x80a\x80s\x80\x80\x80\x80\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80A\x80a\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80E\x80e\x80I\x80i\x80I\x80i\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80O\x80o\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80U\x80u\x80Y\x80y\x80Y\x80y\x80Y\x80y\x80Y\x80y\x80\x80\x80\x80\x80\x80'),
+    (0x2000, 0x2070, ' \x80 \x80 \x80 \x80 \x80 \x80 \x80 \x80 \x80 \x80 \x80\x80\x80\x80\x80\x80-\x80-\x80-\x80-\x80-\x80-\x80\x80 \x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80.\x80..\x80...\x80\x80\x80\x80\x80\x80\x80\x80\x80 \x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80!!\x80\x80 \x80\x80\x80\x80\x80-\x80\x80\x80\x80??\x80?!\x80!?\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80 \x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80\x80'),
+    (0x2212, 0x2213, '-'),
+    (0xfe58, 0xfe59, '-'),
+    (0xfe63, 0xfe64, '-'),
+    (0xff0d, 0xff0e, '-'),
+)
@@ -1,15 +1,284 @@
 # app.py
+import csv
+import os
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, messagebox, filedialog
 
 try:
-    from slugify import slugify_tieng_viet
+    from slugify import Slugifier, slugify_tieng_viet
 except Exception as e:
     slugify_tieng_viet = None
     _import_error = e
 else:
     _import_error = None
 
+_DEBOUNCE_MS = 200       # gõ dừng bao lâu thì mới preview
+_POLL_MS = 50            # chu kỳ UI đọc kết quả từ thread nền
+_INLINE_CHARS = 2000     # đầu vào ngắn hơn thì preview ngay trên thread UI
+_BULK_CHUNK = 2048       # số dòng mỗi lần slugify ở chế độ hàng loạt
+_ROW_HEIGHT = 22
+
+
+def _read_titles(path):
+    """
+    Các tiêu đề trong file. CSV: cột "title" nếu dòng đầu có cột đó (dòng đầu
+    là header), không thì cột đầu tiên của mọi dòng. File khác: mỗi dòng một tiêu đề.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if not path.lower().endswith(".csv"):
+            return f.read().splitlines()
+        rows = csv.reader(f)
+        header = next(rows, None)
+        if header is None:
+            return []
+        if "title" in header:
+            idx = header.index("title")
+            return [row[idx] if idx < len(row) else "" for row in rows]
+        return [header[0] if header else ""] + [row[0] if row else "" for row in rows]
+
+
+class BulkJob:
+    """
+    Slugify cả file trên thread nền, theo từng chunk.
+
+    Thread UI chỉ đọc các thuộc tính (done/total/state) và rows(); thread
+    nền không chạm widget. cancel() dừng sau chunk đang chạy.
+    """
+
+    def __init__(self, path, slugifier, chunksize=_BULK_CHUNK):
+        self.path = path
+        self.titles = []
+        self.slugs = []
+        self.total = 0
+        self.state = "pending"    # pending -> reading -> running -> done | cancelled | error
+        self.error = None
+        self._slugifier = slugifier
+        self._chunksize = chunksize
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="slugify-bulk", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    @property
+    def done(self):
+        return len(self.slugs)
+
+    @property
+    def finished(self):
+        return self.state in ("done", "cancelled", "error")
+
+    def row(self, i):
+        return self.titles[i], self.slugs[i]
+
+    def _run(self):
+        try:
+            self.state = "reading"
+            titles = _read_titles(self.path)
+            self.titles, self.total = titles, len(titles)
+            self.state = "running"
+            for lo in range(0, len(titles), self._chunksize):
+                if self._cancel.is_set():
+                    self.state = "cancelled"
+                    return
+                # list.extend là một thao tác nguyên tử với thread UI đang đọc
+                self.slugs.extend(self._slugifier.many(titles[lo:lo + self._chunksize]))
+            self.state = "done"
+        except Exception as e:  # báo lên UI thay vì chết lặng trong thread
+            self.error = e
+            self.state = "error"
+
+
+class VirtualList(ttk.Frame):
+    """
+    Danh sách ảo: Treeview chỉ giữ đúng số dòng đang hiện, cuộn bằng cách
+    đổi giá trị các dòng đó nên 100k+ dòng vẫn mượt (không insert từng dòng).
+    """
+
+    def __init__(self, master, columns):
+        super().__init__(master)
+        ttk.Style(self).configure("Virtual.Treeview", rowheight=_ROW_HEIGHT)
+        self.tree = ttk.Treeview(
+            self, columns=[c for c, _ in columns], show="headings",
+            selectmode="none", height=1, style="Virtual.Treeview",
+        )
+        for col, title in columns:
+            self.tree.heading(col, text=title, anchor="w")
+            self.tree.column(col, anchor="w", stretch=True, width=200)
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scroll.grid(row=0, column=1, sticky="ns")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self._count = 0
+        self._top = 0
+        self._rows = 1
+        self._get_row = None
+        self._items = []
+
+        self.tree.bind("<Configure>", self._on_resize)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+
+    def set_source(self, count, get_row):
+        """count dòng, get_row(i) trả về tuple giá trị của dòng i."""
+        self._count = count
+        self._get_row = get_row
+        self._top = max(0, min(self._top, count - self._rows))
+        self._render()
+
+    def _render(self):
+        n = max(0, min(self._rows, self._count - self._top))
+        while len(self._items) < n:
+            self._items.append(self.tree.insert("", "end"))
+        while len(self._items) > n:
+            self.tree.delete(self._items.pop())
+        for k, item in enumerate(self._items):
+            self.tree.item(item, values=self._get_row(self._top + k))
+        if self._count:
+            self.scroll.set(self._top / self._count, (self._top + n) / self._count)
+        else:
+            self.scroll.set(0, 1)
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, self._count - self._rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(value) * self._count))
+        elif action == "scroll":
+            step = int(value) * (self._rows - 1 if unit == "pages" else 1)
+            self._scroll_to(self._top + step)
+
+    def _on_wheel(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._scroll_to(self._top + (-3 if up else 3))
+        return "break"
+
+    def _on_resize(self, event):
+        # Trừ một dòng cho heading
+        rows = max(1, event.height // _ROW_HEIGHT - 1)
+        if rows != self._rows:
+            self._rows = rows
+            self._top = max(0, min(self._top, self._count - rows))
+            self._render()
+
+
+class BulkWindow(tk.Toplevel):
+    """Chế độ hàng loạt: mở file text/CSV, slugify nền, có tiến độ và nút Hủy."""
+
+    def __init__(self, master, make_slugifier):
+        super().__init__(master)
+        self.title("Slugify hàng loạt")
+        self.geometry("760x480")
+        self.minsize(520, 300)
+        self._make_slugifier = make_slugifier
+        self.job = None
+
+        bar = ttk.Frame(self, padding=(12, 12, 12, 6))
+        bar.pack(fill="x")
+        self.open_btn = ttk.Button(bar, text="Mở file…", command=self.on_open)
+        self.cancel_btn = ttk.Button(bar, text="Hủy", command=self.on_cancel, state="disabled")
+        self.save_btn = ttk.Button(bar, text="Lưu kết quả…", command=self.on_save, state="disabled")
+        self.open_btn.pack(side="left")
+        self.cancel_btn.pack(side="left", padx=(8, 0))
+        self.save_btn.pack(side="left", padx=(8, 0))
+        self.progress = ttk.Progressbar(bar, mode="determinate", maximum=1)
+        self.progress.pack(side="left", fill="x", expand=True, padx=(12, 0))
+
+        self.status_var = tk.StringVar(value="Chưa có file")
+        ttk.Label(self, textvariable=self.status_var, padding=(12, 0)).pack(fill="x")
+
+        self.table = VirtualList(self, [("title", "Đầu vào"), ("slug", "Slug")])
+        self.table.pack(fill="both", expand=True, padx=12, pady=(6, 12))
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_open(self):
+        path = filedialog.askopenfilename(
+            parent=self, title="Chọn file tiêu đề",
+            filetypes=[("Text/CSV", "*.txt *.csv"), ("Tất cả", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            slugifier = self._make_slugifier()
+        except ValueError as e:
+            messagebox.showerror("Cấu hình sai", str(e), parent=self)
+            return
+        self.on_cancel()
+        self.job = BulkJob(path, slugifier).start()
+        self.open_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.save_btn.configure(state="disabled")
+        self.table.set_source(0, None)
+        self._poll()
+
+    def on_cancel(self):
+        if self.job is not None and not self.job.finished:
+            self.job.cancel()
+
+    def _poll(self):
+        job = self.job
+        if job is None or not self.winfo_exists():
+            return
+        self.progress.configure(maximum=max(job.total, 1), value=job.done)
+        self.table.set_source(job.done, job.row)
+        name = os.path.basename(job.path)
+        if job.state == "reading":
+            self.status_var.set(f"Đang đọc {name}…")
+        elif job.state == "running":
+            self.status_var.set(f"{name}: {job.done:,}/{job.total:,} dòng")
+        elif job.state == "done":
+            self.status_var.set(f"{name}: xong {job.done:,} dòng")
+        elif job.state == "cancelled":
+            self.status_var.set(f"{name}: đã hủy sau {job.done:,}/{job.total:,} dòng")
+        elif job.state == "error":
+            self.status_var.set(f"{name}: lỗi — {job.error}")
+        if not job.finished:
+            self.after(_POLL_MS, self._poll)
+            return
+        self.open_btn.configure(state="normal")
+        self.cancel_btn.configure(state="disabled")
+        self.save_btn.configure(state="normal" if job.done else "disabled")
+
+    def on_save(self):
+        job = self.job
+        if job is None or not job.done:
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self, title="Lưu kết quả", defaultextension=".csv",
+            filetypes=[("CSV (đầu vào, slug)", "*.csv"), ("Text (mỗi dòng một slug)", "*.txt")],
+        )
+        if not path:
+            return
+        n = job.done
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if path.lower().endswith(".csv"):
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(["title", "slug"])
+                writer.writerows(zip(job.titles[:n], job.slugs[:n]))
+            else:
+                f.writelines(s + "\n" for s in job.slugs[:n])
+        self.status_var.set(f"Đã lưu {n:,} dòng vào {os.path.basename(path)}")
+
+    def on_close(self):
+        self.on_cancel()
+        self.destroy()
+
 
 class SlugifyApp(ttk.Frame):
     def __init__(self, master):
@@ -24,6 +293,14 @@ class SlugifyApp(ttk.Frame):
         self.maxlen_var = tk.StringVar()
         self.suffix_mode_var = tk.StringVar(value="none")
         self.config_visible = tk.BooleanVar(value=False)
+        self._preview_after = None      # id của after() đang chờ (debounce)
+        self._preview_future = None
+        self._preview_key = None        # khóa của job preview đang chạy
+        self._preview_again = False     # đầu vào đổi trong lúc job đang chạy
+        self._preview_force = False     # lần chạy lại đó do Submit: bỏ qua _last_key
+        self._last_key = None           # (đầu vào, max_len, suffix) của kết quả đang hiện
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slugify-preview")
+        self._bulk = None
 
         # Layout
         self.columnconfigure(1, weight=1)
@@ -56,7 +333,7 @@ class SlugifyApp(ttk.Frame):
             self.cfg_frame,
             textvariable=self.suffix_mode_var,
             state="readonly",
-            values=["none", "random4", "random6", "date", "datetime"],
+            values=["none", "random4", "random6", "date", "datetime", "hash4", "hash8"],
             width=12
         )
         self.suffix_combo.grid(row=0, column=3, sticky="w", pady=6)
@@ -64,10 +341,12 @@ class SlugifyApp(ttk.Frame):
         # Actions (row 4)
         btns = ttk.Frame(self)
         btns.grid(row=4, column=1, sticky="e", pady=(8, 0))
+        self.bulk_btn = ttk.Button(btns, text="Hàng loạt…", command=self.open_bulk)
         self.submit_btn = ttk.Button(btns, text="Submit", command=self.on_submit)
         self.clear_btn = ttk.Button(btns, text="Xóa", command=self.on_clear, state="disabled")
-        self.submit_btn.grid(row=0, column=0, padx=(0, 8))
-        self.clear_btn.grid(row=0, column=1)
+        self.bulk_btn.grid(row=0, column=0, padx=(0, 8))
+        self.submit_btn.grid(row=0, column=1, padx=(0, 8))
+        self.clear_btn.grid(row=0, column=2)
 
         # Import warning
         if slugify_tieng_viet is None:
@@ -81,6 +360,9 @@ class SlugifyApp(ttk.Frame):
         self.in_entry.focus()
 
         self.out_var.trace_add("write", lambda *_: self._update_clear_state())
+        # Preview khi gõ: debounce, chỉ chạy khi gõ dừng _DEBOUNCE_MS
+        for var in (self.in_var, self.maxlen_var, self.suffix_mode_var):
+            var.trace_add("write", lambda *_: self._schedule_preview())
 
     def toggle_config(self):
         if self.config_visible.get():
@@ -100,16 +382,77 @@ class SlugifyApp(ttk.Frame):
         if slugify_tieng_viet is None:
             messagebox.showerror("Lỗi import", f"Không tìm thấy slugify_tieng_viet\nChi tiết: {_import_error}")
             return
+        self._parse_maxlen()  # báo max_len sai (preview thì bỏ qua lặng lẽ)
+        # Submit luôn tính lại (suffix ngẫu nhiên/theo giờ đổi mỗi lần bấm)
+        self._start_preview(force=True)
 
+    def _current_key(self):
         src = self.in_var.get().strip()
-        maxlen = self._parse_maxlen()
         suffix_mode = self.suffix_mode_var.get().strip().lower() or "none"
+        return src, self._parse_maxlen(quiet=True), suffix_mode
 
-        out = slugify_tieng_viet(src, max_len=maxlen, suffix_mode=suffix_mode)
+    def _schedule_preview(self):
+        if slugify_tieng_viet is None:
+            return
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+        self._preview_after = self.after(_DEBOUNCE_MS, self._start_preview)
+
+    def _start_preview(self, force=False):
+        if self._preview_after is not None:
+            self.after_cancel(self._preview_after)
+            self._preview_after = None
+        key = self._current_key()
+        if key == self._last_key and not force:
+            return  # đầu vào không đổi: giữ kết quả cũ
+        if self._preview_future is not None:
+            # Chạy lại khi job hiện tại xong; Submit bấm lúc này không được mất
+            self._preview_again = True
+            self._preview_force = self._preview_force or force
+            return
+        src, maxlen, suffix_mode = key
+        if len(src) <= _INLINE_CHARS:
+            self._show_preview(key, slugify_tieng_viet(src, max_len=maxlen, suffix_mode=suffix_mode))
+            return
+        # Văn bản dài: slugify trên thread nền để UI không bị đơ
+        self._preview_key = key
+        self._preview_future = self._executor.submit(
+            slugify_tieng_viet, src, max_len=maxlen, suffix_mode=suffix_mode
+        )
+        self.after(_POLL_MS, self._poll_preview)
+
+    def _poll_preview(self):
+        future = self._preview_future
+        if not future.done():
+            self.after(_POLL_MS, self._poll_preview)
+            return
+        self._preview_future = None
+        self._show_preview(self._preview_key, future.result())
+        if self._preview_again:
+            force, self._preview_again, self._preview_force = self._preview_force, False, False
+            self._start_preview(force)
+
+    def _show_preview(self, key, out):
+        self._last_key = key
         self.out_entry.configure(state="normal")
         self.out_var.set(out)
         self.out_entry.configure(state="readonly")
 
+    def open_bulk(self):
+        if slugify_tieng_viet is None:
+            messagebox.showerror("Lỗi import", f"Không tìm thấy slugify_tieng_viet\nChi tiết: {_import_error}")
+            return
+        if self._bulk is not None and self._bulk.winfo_exists():
+            self._bulk.lift()
+            return
+
+        def make_slugifier():
+            # Dùng cấu hình max_len/suffix hiện tại của cửa sổ chính
+            _, maxlen, suffix_mode = self._current_key()
+            return Slugifier(max_len=maxlen, suffix_mode=suffix_mode)
+
+        self._bulk = BulkWindow(self.master, make_slugifier)
+
     def on_clear(self):
         self.in_var.set("")
         self.out_entry.configure(state="normal")
@@ -122,7 +465,7 @@ class SlugifyApp(ttk.Frame):
     def _update_clear_state(self):
         self.clear_btn.configure(state="normal" if self.out_var.get() else "disabled")
 
-    def _parse_maxlen(self):
+    def _parse_maxlen(self, quiet=False):
         raw = self.maxlen_var.get().strip()
         if not raw:
             return None
@@ -132,7 +475,8 @@ class SlugifyApp(ttk.Frame):
                 return None
             return val
         except ValueError:
-            messagebox.showwarning("Cấu hình sai", "max_len phải là số nguyên không âm hoặc để trống.")
+            if not quiet:
+                messagebox.showwarning("Cấu hình sai", "max_len phải là số nguyên không âm hoặc để trống.")
             return None
 
 
@@ -0,0 +1,39 @@
+# benchmarks/bench_allocator.py
+"""
+Đo thời gian cấp phát và bộ nhớ của UniqueSlugAllocator (quy về mỗi 1 triệu slug).
+
+Chạy: python -m benchmarks.bench_allocator --n 1000000
+"""
+from __future__ import annotations
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.corpus import vietnamese_titles
+from registry import UniqueSlugAllocator
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--max-len", type=int, default=None)
+    ap.add_argument("--distinct", type=int, default=100_000, help="số tiêu đề khác nhau (còn lại là trùng)")
+    args = ap.parse_args()
+
+    distinct = vietnamese_titles(args.distinct)
+    titles = [distinct[i % args.distinct] for i in range(args.n)]
+
+    for mode in ("counter", "random4", "random6"):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        alloc = UniqueSlugAllocator(max_len=args.max_len, mode=mode)
+        for title in titles:
+            alloc.allocate(title)
+        dt = time.perf_counter() - t0
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        per_million = current / len(alloc) * 1_000_000 / (1 << 20)
+        print(f"{mode:>8}: {len(alloc):,} slug, {len(alloc) / dt:,.0f} slug/s, "
+              f"{per_million:,.1f} MiB / 1 triệu slug")
+
+if __name__ == "__main__":
+    main()
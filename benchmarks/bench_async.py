@@ -0,0 +1,67 @@
+# benchmarks/bench_async.py
+"""
+Tải giả lập cho API async: C client đồng thời, mỗi client gửi K yêu cầu.
+So sánh gọi đồng bộ trên loop, asyncio.to_thread từng lời gọi và aslugify
+(gom batch); in thông lượng và độ trễ lớn nhất của event loop (stall).
+
+Chạy: python -m benchmarks.bench_async --clients 200 --requests 200
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+
+from benchmarks.corpus import article_bodies, vietnamese_titles
+from slugify import slugify_tieng_viet
+from slugify_async import aslugify
+
+async def _sync(text: str) -> str:
+    return slugify_tieng_viet(text)
+
+async def _to_thread(text: str) -> str:
+    return await asyncio.to_thread(slugify_tieng_viet, text)
+
+_MODES = {"đồng bộ": _sync, "to_thread": _to_thread, "aslugify": aslugify}
+
+async def _ticker(stop: asyncio.Event, period: float, stalls: list) -> None:
+    """Đo độ trễ thức dậy của một task ngủ định kỳ = thời gian loop bị chặn."""
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(period)
+        stalls.append(time.perf_counter() - t0 - period)
+
+async def _run(fn, data, clients: int, requests: int) -> tuple:
+    stop = asyncio.Event()
+    stalls: list = []
+    ticker = asyncio.ensure_future(_ticker(stop, 0.001, stalls))
+
+    async def client(i: int) -> None:
+        for j in range(requests):
+            await fn(data[(j * clients + i) % len(data)])
+            await asyncio.sleep(0)  # nhường loop như một handler thật
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    dt = time.perf_counter() - t0
+    stop.set()
+    await ticker
+    return clients * requests / dt, max(stalls, default=0.0)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--clients", type=int, default=200)
+    ap.add_argument("--requests", type=int, default=100)
+    ap.add_argument("--long-ratio", type=int, default=50, help="cứ N yêu cầu có 1 bài viết dài")
+    args = ap.parse_args()
+
+    data = vietnamese_titles(5000)
+    for i, body in enumerate(article_bodies(100, paragraphs=100)):
+        data[i * args.long_ratio % len(data)] = body
+
+    print(f"{'chế độ':>10} {'yêu cầu/s':>12} {'stall lớn nhất':>15}")
+    for name, fn in _MODES.items():
+        rate, stall = asyncio.run(_run(fn, data, args.clients, args.requests))
+        print(f"{name:>10} {rate:>12,.0f} {stall * 1000:>12.2f} ms")
+
+if __name__ == "__main__":
+    main()
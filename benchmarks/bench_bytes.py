@@ -0,0 +1,67 @@
+# benchmarks/bench_bytes.py
+"""
+Slugify từng dòng của file mmap: decode sang str rồi slugify và encode lại,
+so với slugify_bytes nhận thẳng dòng bytes.
+
+Chạy: python -m benchmarks.bench_bytes --n 200000
+"""
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.corpus import ascii_titles, vietnamese_titles
+from slugify import Slugifier
+
+def _decode_lines(mm: mmap.mmap, slugifier: Slugifier) -> int:
+    n = 0
+    for raw in iter(mm.readline, b""):
+        slugifier(raw.decode("utf-8").rstrip("\r\n")).encode("ascii")
+        n += 1
+    return n
+
+def _bytes_lines(mm: mmap.mmap, slugifier: Slugifier) -> int:
+    # '\r\n' cuối dòng không phải chữ/số nên không cần cắt trước
+    n = 0
+    for raw in iter(mm.readline, b""):
+        slugifier.slugify_bytes(raw)
+        n += 1
+    return n
+
+def _measure(fn, path: str, slugifier: Slugifier) -> tuple:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        t0 = time.perf_counter()
+        n = fn(mm, slugifier)
+        dt = time.perf_counter() - t0
+        mm.seek(0)
+        tracemalloc.start()
+        fn(mm, slugifier)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return n / dt, peak
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--max-len", type=int, default=None)
+    args = ap.parse_args()
+
+    slugifier = Slugifier(max_len=args.max_len)
+    corpora = {"vietnamese_titles": vietnamese_titles, "ascii_titles": ascii_titles}
+    print(f"{'corpus':>18} {'cách':>7} {'dòng/s':>12} {'peak (KiB)':>11}")
+    for name, make in corpora.items():
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(make(args.n)))
+            for label, fn in (("decode", _decode_lines), ("bytes", _bytes_lines)):
+                rate, peak = _measure(fn, path, slugifier)
+                print(f"{name:>18} {label:>7} {rate:>12,.0f} {peak / 1024:>11,.1f}")
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    main()
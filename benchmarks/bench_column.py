@@ -0,0 +1,49 @@
+# benchmarks/bench_column.py
+"""
+Bộ nhớ mỗi slug: list[str] so với SlugColumn (thường và intern).
+
+Chạy: python -m benchmarks.bench_column --n 1000000 --distinct 100000
+"""
+from __future__ import annotations
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.corpus import vietnamese_titles
+from column import SlugColumn
+from slugify import slugify_many
+
+def _measure(build) -> tuple:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    dt = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current, dt
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--distinct", type=int, default=100_000, help="số tiêu đề khác nhau (còn lại là trùng)")
+    args = ap.parse_args()
+
+    distinct = slugify_many(vietnamese_titles(args.distinct))
+    # Chuỗi mới cho từng phần tử, như kết quả batch thật (không dùng chung đối tượng)
+    def slugs():
+        for i in range(args.n):
+            yield (distinct[i % args.distinct] + "-")[:-1]
+
+    cases = {
+        "list[str]": lambda: list(slugs()),
+        "SlugColumn": lambda: SlugColumn(slugs()),
+        "SlugColumn intern": lambda: SlugColumn(slugs(), intern=True),
+    }
+    print(f"{'kiểu':>18} {'byte/slug':>10} {'MiB':>8} {'dựng (s)':>9}")
+    for name, build in cases.items():
+        obj, mem, dt = _measure(build)
+        print(f"{name:>18} {mem / args.n:>10,.1f} {mem / (1 << 20):>8,.1f} {dt:>9.2f}")
+        del obj
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_import.py
+"""
+Thời gian import/khởi động cho script ngắn và serverless: đọc
+`python -X importtime` trong process mới, lấy trung vị nhiều lần chạy.
+
+Chạy: python -m benchmarks.bench_import --repeat 15
+(benchmarks.run cũng ghi case "import slugify (-X importtime)" vào baseline)
+"""
+from __future__ import annotations
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module nặng mà đường mặc định (suffix_mode="none") không được kéo vào
+_LAZY = ("re", "typing", "datetime", "secrets", "hashlib", "concurrent.futures", "threading", "translit")
+
+def _run(code: str) -> Tuple[str, float]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_ROOT, capture_output=True, text=True, check=True,
+    )
+    return proc.stderr, time.perf_counter() - t0
+
+def _parse(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) theo thứ tự trong output; tên giữ thụt lề (module con)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name[1:].rstrip(), int(self_us), int(cum_us)))  # bỏ một dấu cách sau '|'
+    return rows
+
+def import_time_us(code: str = "import slugify", module: str = "slugify", repeat: int = 7) -> float:
+    """Trung vị thời gian import tích lũy (µs) của module khi chạy code trong process mới."""
+    _run(code)  # lần đầu ghi .pyc (nếu được phép)
+    samples = []
+    for _ in range(repeat):
+        rows = _parse(_run(code)[0])
+        samples.append(sum(cum for name, _, cum in rows if name == module))
+    return statistics.median(samples)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--repeat", type=int, default=9)
+    ap.add_argument("--top", type=int, default=12, help="số module tốn nhất in ra")
+    args = ap.parse_args()
+
+    cases: Dict[str, Tuple[str, str]] = {
+        "import slugify": ("import slugify", "slugify"),
+        "import slugify + 1 slug": ("import slugify; slugify.slugify_tieng_viet('Xin chào')", "slugify"),
+        "import cli (python -m slugify)": ("import cli", "cli"),
+    }
+    print(f"{'case':<32} {'import (ms)':>12} {'process (ms)':>13}")
+    base_wall = statistics.median(_run("pass")[1] for _ in range(args.repeat))
+    print(f"{'python -c pass':<32} {'':>12} {base_wall * 1e3:>13.1f}")
+    for name, (code, module) in cases.items():
+        us = import_time_us(code, module, args.repeat)
+        wall = statistics.median(_run(code)[1] for _ in range(args.repeat))
+        print(f"{name:<32} {us / 1e3:>12.2f} {wall * 1e3:>13.1f}")
+
+    stderr, _ = _run("import slugify, sys; print(*sorted(sys.modules), sep='\\n', file=sys.stderr)")
+    loaded = set(stderr.splitlines())
+    eager = [m for m in _LAZY if m in loaded]
+    print(f"\nmodule lười bị import sớm: {', '.join(eager) if eager else 'không có'}")
+
+    rows = _parse(_run("import slugify")[0])
+    print(f"\n{args.top} module tốn nhất (self µs) khi import slugify:")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: -r[1])[:args.top]:
+        print(f"  {name.strip():<32} {self_us:>8} {cum_us:>10}")
+
+if __name__ == "__main__":
+    main()
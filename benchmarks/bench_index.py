@@ -0,0 +1,100 @@
+# benchmarks/bench_index.py
+"""
+SlugIndex: thời gian dựng, bộ nhớ (so với dict[str, list]), save/load (mmap)
+và độ trễ tra cứu, so với cách cũ là quét lại và slugify mọi tiêu đề.
+
+Chạy: python -m benchmarks.bench_index --n 1000000
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.corpus import vietnamese_titles
+from slugify import slugify_many
+from slugindex import SlugIndex
+
+def _latency_us(fn, queries) -> float:
+    t0 = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - t0) / len(queries) * 1e6
+
+def _traced(build) -> tuple:
+    tracemalloc.start()
+    obj = build()
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, mem
+
+def _as_dict(pairs) -> dict:
+    out: dict = {}
+    for slug, key in pairs:
+        out.setdefault(slug, []).append(key)
+    return out
+
+def _as_index(pairs) -> SlugIndex:
+    idx = SlugIndex()
+    idx.update(pairs)
+    idx.compact()
+    return idx
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--queries", type=int, default=10_000)
+    args = ap.parse_args()
+
+    titles = vietnamese_titles(args.n)
+    t0 = time.perf_counter()
+    slugs = slugify_many(titles)
+    t_slug = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    idx = _as_index(zip(slugs, titles))
+    t_index = time.perf_counter() - t0
+    print(f"n={args.n:,}, slug khác nhau={len(idx):,}")
+    print(f"dựng: slugify {t_slug:.2f} s + index {t_index:.2f} s ({args.n / t_index:,.0f} mục/s)")
+
+    del idx
+    # Slug và khóa (id) là chuỗi mới cho từng mục, như khi đọc từ database
+    def pairs():
+        for i, slug in enumerate(slugs):
+            yield (slug + "-")[:-1], f"post:{i}"
+    idx, mem_index = _traced(lambda: _as_index(pairs()))
+    ref, mem_dict = _traced(lambda: _as_dict(pairs()))
+    del ref
+    print(f"bộ nhớ (khóa là id): SlugIndex {mem_index / args.n:,.1f} B/mục (nbytes {idx.nbytes / (1 << 20):.1f} MiB),"
+          f" dict[str, list] {mem_dict / args.n:,.1f} B/mục")
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "slugs.idx")
+        t0 = time.perf_counter()
+        idx.save(path)
+        print(f"save: {time.perf_counter() - t0:.2f} s, {os.path.getsize(path) / (1 << 20):.1f} MiB")
+        del idx
+
+        t0 = time.perf_counter()
+        idx = SlugIndex.load(path)
+        print(f"load (mmap): {(time.perf_counter() - t0) * 1e3:.2f} ms")
+
+        rnd = random.Random(0)
+        queries = rnd.sample(slugs, min(args.queries, len(slugs)))
+        prefixes = [s[:rnd.randint(1, 12)] for s in queries]
+        t0 = time.perf_counter()
+        idx.get(queries[0])
+        print(f"truy vấn đầu tiên sau load: {(time.perf_counter() - t0) * 1e3:.2f} ms")
+        print(f"get:              {_latency_us(idx.get, queries):8.1f} µs")
+        print(f"prefix(limit=10): {_latency_us(lambda p: idx.prefix(p, 10), prefixes):8.1f} µs")
+        print(f"prefix_items(10): {_latency_us(lambda p: idx.prefix_items(p, 10), prefixes):8.1f} µs")
+        idx.close()
+
+    t0 = time.perf_counter()
+    target = queries[0]
+    [t for t, s in zip(titles, slugify_many(titles)) if s == target]
+    print(f"quét lại (cách cũ): {(time.perf_counter() - t0) * 1e6:,.0f} µs/truy vấn")
+
+if __name__ == "__main__":
+    main()
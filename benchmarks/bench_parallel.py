@@ -0,0 +1,33 @@
+# benchmarks/bench_parallel.py
+"""
+Đo thông lượng slugify_many theo số process (1..N).
+
+Chạy: python -m benchmarks.bench_parallel --n 1000000 --max-workers 8
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+
+from benchmarks.corpus import vietnamese_titles
+from slugify import slugify_many
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=1_000_000, help="số tiêu đề trong corpus")
+    ap.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunksize", type=int, default=8192)
+    args = ap.parse_args()
+
+    titles = vietnamese_titles(args.n)
+    baseline = None
+    print(f"{'workers':>7} {'giây':>8} {'slug/s':>12} {'tăng tốc':>9}")
+    for workers in range(1, args.max_workers + 1):
+        t0 = time.perf_counter()
+        slugify_many(titles, workers=workers, chunksize=args.chunksize)
+        dt = time.perf_counter() - t0
+        baseline = baseline or dt
+        print(f"{workers:>7} {dt:>8.2f} {args.n / dt:>12,.0f} {baseline / dt:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
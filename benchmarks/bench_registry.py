@@ -0,0 +1,45 @@
+# benchmarks/bench_registry.py
+"""
+Đo thông lượng SqliteSlugRegistry: giữ chỗ từng slug và theo lô.
+
+Chạy: python -m benchmarks.bench_registry --n 100000 --batch 1000
+"""
+from __future__ import annotations
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.corpus import vietnamese_titles
+from registry import SqliteSlugRegistry
+
+def _run(path: str, titles, batch: int) -> float:
+    with SqliteSlugRegistry(path, max_len=80) as reg:
+        t0 = time.perf_counter()
+        if batch == 1:
+            for title in titles:
+                reg.reserve(title)
+        else:
+            for i in range(0, len(titles), batch):
+                reg.reserve_many(titles[i:i + batch])
+        return time.perf_counter() - t0
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--single", type=int, default=10_000, help="số slug cho phép đo từng slug")
+    ap.add_argument("--batch", type=int, default=1000)
+    args = ap.parse_args()
+
+    titles = vietnamese_titles(args.n)
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, batch, data in (
+            ("từng slug", 1, titles[:args.single]),
+            (f"lô {args.batch}", args.batch, titles),
+        ):
+            path = os.path.join(tmp, f"bench-{batch}.db")
+            dt = _run(path, data, batch)
+            print(f"{label:>10}: {len(data):,} slug trong {dt:.2f}s ({len(data) / dt:,.0f} slug/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_server.py
+"""
+Máy tạo tải cục bộ cho server.py: N kết nối keep-alive, mỗi kết nối một thread.
+
+Chạy:
+    python -m benchmarks.bench_server                 # tự bật server trong process
+    python -m benchmarks.bench_server --url http://127.0.0.1:8765 --batch 500
+"""
+from __future__ import annotations
+import argparse
+import http.client
+import json
+import threading
+import time
+from typing import List
+from urllib.parse import quote, urlsplit
+
+from benchmarks.corpus import vietnamese_titles
+from server import SlugHTTPServer
+
+def _client(host: str, port: int, titles: List[str], requests: int, batch: int, latencies: list) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    for i in range(requests):
+        t0 = time.perf_counter()
+        if batch > 1:
+            start = (i * batch) % len(titles)
+            body = json.dumps({"texts": titles[start:start + batch]})
+            conn.request("POST", "/batch", body=body, headers={"Content-Type": "application/json"})
+        else:
+            conn.request("GET", "/slugify?text=" + quote(titles[i % len(titles)]))
+        resp = conn.getresponse()
+        resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}")
+        latencies.append(time.perf_counter() - t0)
+    conn.close()
+
+def _pct(values: List[float], p: float) -> float:
+    return values[min(int(p * len(values)), len(values) - 1)] * 1000
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--url", help="server có sẵn; bỏ trống để tự bật server")
+    ap.add_argument("--connections", type=int, default=8)
+    ap.add_argument("--requests", type=int, default=500, help="số request mỗi kết nối")
+    ap.add_argument("--batch", type=int, default=1, help="số phần tử mỗi request (>1: POST /batch)")
+    ap.add_argument("--workers", type=int, default=1, help="workers cho server tự bật")
+    args = ap.parse_args()
+
+    httpd = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        httpd = SlugHTTPServer(("127.0.0.1", 0), workers=args.workers)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        host, port = httpd.server_address[:2]
+
+    titles = vietnamese_titles(10_000)
+    latencies: list = []
+    threads = [
+        threading.Thread(target=_client, args=(host, port, titles, args.requests, args.batch, latencies))
+        for _ in range(args.connections)
+    ]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    dt = time.perf_counter() - t0
+
+    latencies.sort()
+    n = len(latencies)
+    print(f"{n:,} request ({n * args.batch:,} slug) trong {dt:.2f}s: "
+          f"{n / dt:,.0f} request/s, {n * args.batch / dt:,.0f} slug/s")
+    print(f"độ trễ ms: p50={_pct(latencies, 0.5):.2f} p90={_pct(latencies, 0.9):.2f} "
+          f"p99={_pct(latencies, 0.99):.2f}")
+    if httpd is not None:
+        httpd.shutdown()
+        httpd.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_stats.py
+"""
+Đo chi phí của đo đạc stage: chưa bật, đang bật, và sau khi tắt.
+
+Chạy: python -m benchmarks.bench_stats --n 20000
+"""
+from __future__ import annotations
+import argparse
+import time
+
+import slugify
+from benchmarks.corpus import vietnamese_titles
+
+def _best(fn, data, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for s in data:
+            fn(s)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=7)
+    args = ap.parse_args()
+
+    data = vietnamese_titles(args.n)
+    fn = lambda s: slugify.slugify_tieng_viet(s, max_len=60)
+    never = _best(fn, data, args.repeat)
+    slugify.enable_stats()
+    enabled = _best(fn, data, args.repeat)
+    slugify.disable_stats()
+    disabled = _best(fn, data, args.repeat)
+
+    for label, dt in (("chưa bật", never), ("đang bật", enabled), ("đã tắt", disabled)):
+        print(f"{label:>9}: {args.n / dt:>12,.0f} ops/s  (thời gian {dt / never - 1:+.1%} so với chưa bật)")
+
+if __name__ == "__main__":
+    main()
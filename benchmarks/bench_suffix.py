@@ -0,0 +1,43 @@
+# benchmarks/bench_suffix.py
+"""
+Thông lượng sinh suffix theo chế độ, so với cách cũ (secrets/strftime mỗi lần).
+
+Chạy: python -m benchmarks.bench_suffix --n 200000
+"""
+from __future__ import annotations
+import argparse
+import secrets
+import time
+from datetime import datetime
+
+from slugify import _SUFFIX_MAKERS
+
+_LEGACY = {
+    "random4": lambda text: secrets.token_hex(2),
+    "random6": lambda text: secrets.token_hex(3),
+    "date": lambda text: datetime.now().strftime("%Y%m%d"),
+    "datetime": lambda text: datetime.now().strftime("%Y%m%d%H%M"),
+}
+
+def _rate(fn, n: int) -> float:
+    text = "Tiêu đề mẫu cho suffix"
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn(text)
+    return n / (time.perf_counter() - t0)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=200_000)
+    args = ap.parse_args()
+
+    print(f"{'mode':>9} {'mới (op/s)':>14} {'cũ (op/s)':>14}")
+    for mode, maker in _SUFFIX_MAKERS.items():
+        if maker is None:
+            continue
+        legacy = _LEGACY.get(mode)
+        old = f"{_rate(legacy, args.n):>14,.0f}" if legacy else f"{'-':>14}"
+        print(f"{mode:>9} {_rate(maker, args.n):>14,.0f} {old}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_translit.py
+"""
+Chi phí chuyển tự: nạp bảng lần đầu (thời gian, bộ nhớ) và thông lượng theo
+script, so với tiêu đề tiếng Việt trên Slugifier mặc định.
+
+Chạy: python -m benchmarks.bench_translit --n 100000
+"""
+from __future__ import annotations
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.corpus import vietnamese_titles
+from slugify import Slugifier
+
+_SAMPLES = {
+    "cyrillic": "Новости экономики и политики России сегодня",
+    "greek": "Ελληνικά νέα για την οικονομία σήμερα",
+    "latin": "Łódź Straße Ærøskøbing Øresund łąka",
+    "cjk": "中文新闻标题 今日经济 ひらがな 한국어 뉴스",
+}
+
+def _corpus(sample: str, n: int) -> list:
+    rng = random.Random(0)
+    words = sample.split()
+    return [" ".join(rng.choices(words, k=6)) for _ in range(n)]
+
+def _rate(slugifier: Slugifier, texts: list) -> float:
+    t0 = time.perf_counter()
+    slugifier.many(texts)
+    return len(texts) / (time.perf_counter() - t0)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=100_000)
+    args = ap.parse_args()
+
+    vi = vietnamese_titles(args.n)
+    print(f"{'vietnamese (mặc định)':>24}: {_rate(Slugifier(), vi):>10,.0f} dòng/s")
+    print(f"{'vietnamese (translit)':>24}: {_rate(Slugifier(transliterate=True), vi):>10,.0f} dòng/s")
+    for name, sample in _SAMPLES.items():
+        s = Slugifier(transliterate=name)
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        s(sample)
+        load_ms = (time.perf_counter() - t0) * 1000
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rate = _rate(s, _corpus(sample, args.n))
+        print(f"{name:>24}: {rate:>10,.0f} dòng/s, nạp lần đầu {load_ms:.1f} ms / {current / 1024:,.0f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/bench_vectorized.py
+"""
+Slugify một cột: gọi slugify_tieng_viet từng dòng (kiểu .apply) so với slugify_array.
+
+Cần numpy (pandas nếu có thì đo thêm Series.apply).
+Chạy: python -m benchmarks.bench_vectorized --n 200000
+"""
+from __future__ import annotations
+import argparse
+import time
+
+from benchmarks.corpus import vietnamese_titles
+from slugify import slugify_tieng_viet
+from vectorized import slugify_array
+
+def _rate(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - t0)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--max-len", type=int, default=80)
+    args = ap.parse_args()
+    try:
+        import numpy as np
+    except ImportError:
+        raise SystemExit("Cần numpy: pip install numpy")
+
+    col = np.array(vietnamese_titles(args.n), dtype=object)
+    per_row = np.frompyfunc(lambda t: slugify_tieng_viet(t, max_len=args.max_len), 1, 1)
+    cases = {
+        "ndarray từng dòng": lambda: per_row(col),
+        "slugify_array": lambda: slugify_array(col, max_len=args.max_len),
+    }
+    try:
+        import pandas as pd
+    except ImportError:
+        pass
+    else:
+        series = pd.Series(col)
+        cases["Series.apply"] = lambda: series.apply(slugify_tieng_viet, max_len=args.max_len)
+        cases["slugify_array(Series)"] = lambda: slugify_array(series, max_len=args.max_len)
+
+    for name, fn in cases.items():
+        print(f"{name:>22}: {_rate(fn, args.n):>12,.0f} dòng/s")
+
+if __name__ == "__main__":
+    main()
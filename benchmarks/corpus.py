@@ -0,0 +1,77 @@
+# benchmarks/corpus.py
+"""Sinh corpus giả lập (tất định theo seed) cho benchmark."""
+from __future__ import annotations
+import random
+import unicodedata as ud
+from typing import List
+
+_WORDS = (
+    "tôi thấy hoa vàng trên cỏ xanh đường đua sài gòn hà nội đặc sản "
+    "thời sự kinh tế thể thao giải trí công nghệ điện thoại máy tính "
+    "người việt nam quốc gia bóng đá trận đấu tuyển thủ học sinh sinh viên "
+    "giáo dục sức khỏe bệnh viện thuốc mới nhất hôm nay ngày mai tuần sau "
+    "giá vàng xăng dầu chứng khoán bất động sản du lịch ẩm thực phở bún chả "
+    "mưa bão lũ lụt miền trung miền bắc miền nam khởi nghiệp ứng dụng"
+).split()
+
+_PUNCT = ("", "", "", ":", " –", "!", "?", ",", " —", "...")
+
+def vietnamese_titles(n: int, seed: int = 0) -> List[str]:
+    """n tiêu đề tiếng Việt ngắn (6–14 từ), có số và dấu câu."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        words = rng.choices(_WORDS, k=rng.randint(6, 14))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), str(rng.randint(1, 2030)))
+        title = " ".join(words).capitalize() + rng.choice(_PUNCT)
+        out.append(title)
+    return out
+
+def article_bodies(n: int, seed: int = 0, paragraphs: int = 20) -> List[str]:
+    """n bài viết dài (mỗi bài ~paragraphs đoạn, vài KB)."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        paras = [" ".join(vietnamese_titles(rng.randint(3, 6), seed=rng.random())) for _ in range(paragraphs)]
+        out.append("\n\n".join(paras))
+    return out
+
+def ascii_titles(n: int, seed: int = 0) -> List[str]:
+    """n tiêu đề thuần ASCII (tiếng Việt không dấu + tiếng Anh)."""
+    rng = random.Random(seed)
+    words = ("breaking news update review how to best top guide python release "
+             "gia vang hom nay tin moi nhat bong da viet nam").split()
+    punct = ("", "", ":", "!", "?", " -", "...")
+    return [" ".join(rng.choices(words, k=rng.randint(5, 12))).title() + rng.choice(punct)
+            for _ in range(n)]
+
+_EMOJI = ("🔥", "🌟", "😂", "❤️", "👍🏽", "🇻🇳", "👨‍👩‍👧‍👦", "🤯", "🎉", "🙏")
+
+def emoji_social(n: int, seed: int = 0) -> List[str]:
+    """n bài đăng mạng xã hội nhiều emoji, hashtag, @mention."""
+    rng = random.Random(seed)
+    out = []
+    for title in vietnamese_titles(n, seed):
+        tokens = title.split()
+        for _ in range(rng.randint(2, 6)):
+            tokens.insert(rng.randrange(len(tokens) + 1), "".join(rng.choices(_EMOJI, k=rng.randint(1, 3))))
+        tokens.append(f"#{rng.choice(_WORDS)} @{rng.choice(_WORDS)}")
+        out.append(" ".join(tokens))
+    return out
+
+def mixed_nfc_nfd(n: int, seed: int = 0) -> List[str]:
+    """n tiêu đề tiếng Việt trộn từ NFC và NFD."""
+    rng = random.Random(seed)
+    out = []
+    for title in vietnamese_titles(n, seed):
+        out.append(" ".join(ud.normalize(rng.choice(("NFC", "NFD")), w) for w in title.split()))
+    return out
+
+CORPORA = {
+    "titles": vietnamese_titles,
+    "articles": article_bodies,
+    "ascii": ascii_titles,
+    "emoji": emoji_social,
+    "mixed": mixed_nfc_nfd,
+}
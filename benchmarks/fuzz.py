@@ -0,0 +1,266 @@
+# benchmarks/fuzz.py
+"""
+Fuzz vi sai: so mọi đường nhanh của slugify.py với engine tham chiếu
+(benchmarks/reference.py) trên chuỗi ngẫu nhiên và chuỗi "khó", thu gọn
+đầu vào lỗi, rồi in thông lượng hai engine cạnh nhau.
+
+Chạy:
+    python -m benchmarks.fuzz --n 1000000 --seed 1
+    python -m benchmarks.fuzz --time-limit 60 --no-throughput
+Exit 1 nếu có khác biệt.
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+import unicodedata as ud
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.corpus import CORPORA
+from benchmarks.reference import base_slug, slugify_reference
+from slugify import (
+    _DASHLIKE, _HASH_BYTES, _HASH_KEY, _INCREMENTAL_MIN_LEN, _INCREMENTAL_STEP,
+    SlugCache, Slugifier, slugify_bytes, slugify_tieng_viet,
+)
+
+# -- sinh đầu vào -------------------------------------------------------------
+
+_COMBINING = [chr(cp) for r in ((0x0300, 0x0370), (0x1AB0, 0x1AC0), (0x1DC0, 0x1E00), (0x20D0, 0x20F1))
+              for cp in range(*r)] + ["\u3099", "\u309a"]
+_DASHES = sorted({chr(cp) for cp in range(0x10000) if ud.category(chr(cp)) == "Pd"} | _DASHLIKE | {"-"})
+_SPACES = [" ", "  ", "\t", "\n", "\r\n", "\xa0", "\u2009", "\u200b", "\u200d", "\u3000", "\u202f", "\x00", "\x7f", "\ufeff"]
+_EMOJI = ["👨‍👩‍👧‍👦", "🏳️‍🌈", "👩🏽‍💻", "🇻🇳", "❤️", "🧑‍🤝‍🧑", "1️⃣", "#️⃣", "👍🏿", "🤯", "☕", "©️"]
+_COMPAT = list("ﬁﬂ½①⑳Ａｂｃ１２㎏™ℌ²µÅΩKǅǈ㍻ｶﾞ")
+_SCRIPTS = ["Русский", "Ελληνικά", "中文", "한국어", "العربية", "עברית", "ไทย", "Łódź", "Straße", "Ærø"]
+_ASCII = [chr(cp) for cp in range(0x20, 0x7F)]
+_VI_BASES = "aăâeêioôơuưyAĂÂEÊIOÔƠUƯY"
+_VI_TONES = ["", "\u0300", "\u0301", "\u0303", "\u0309", "\u0323"]
+_VI_WORDS = ["Đường", "phố", "Hà", "Nội", "Sài", "Gòn", "tiếng", "Việt", "nghiêng", "khuỷu", "ướt", "đặc", "sản"]
+
+def _vi_syllable(rng: random.Random) -> str:
+    cons = rng.choice(["", "b", "đ", "ng", "nh", "tr", "kh", "Đ", "Q", "gi"])
+    return ud.normalize("NFC", cons + rng.choice(_VI_BASES) + rng.choice(_VI_TONES) + rng.choice(["", "n", "ng", "t", "c"]))
+
+def _form(rng: random.Random, s: str) -> str:
+    return ud.normalize(rng.choice(("NFC", "NFD", "NFKC", "NFKD")), s) if rng.random() < 0.5 else s
+
+def _piece(rng: random.Random) -> str:
+    r = rng.random()
+    if r < 0.25:
+        return _form(rng, rng.choice(_VI_WORDS) if rng.random() < 0.5 else _vi_syllable(rng))
+    if r < 0.40:
+        return "".join(rng.choices(_ASCII, k=rng.randint(1, 8)))
+    if r < 0.52:
+        return "".join(rng.choices(_SPACES, k=rng.randint(1, 3)))
+    if r < 0.64:
+        return "".join(rng.choices(_DASHES, k=rng.randint(1, 4)))
+    if r < 0.72:
+        return rng.choice(_EMOJI)
+    if r < 0.78:
+        return rng.choice(_COMPAT)
+    if r < 0.84:
+        return rng.choice(_SCRIPTS)
+    if r < 0.92:
+        # Bão dấu kết hợp trên một ký tự gốc
+        return rng.choice("aeoduAEOD1 -") + "".join(rng.choices(_COMBINING, k=rng.randint(1, 30)))
+    # Code point bất kỳ (kể cả surrogate lẻ, ký tự chưa gán)
+    return chr(rng.randrange(0x110000) if rng.random() < 0.3 else rng.randrange(0x80, 0x3000))
+
+def gen_text(rng: random.Random) -> str:
+    r = rng.random()
+    if r < 0.03:
+        return ""
+    if r < 0.08:
+        # Dài quanh ngưỡng cắt sớm và biên từng đoạn
+        target = rng.choice((_INCREMENTAL_MIN_LEN, 2 * _INCREMENTAL_STEP, 3 * _INCREMENTAL_STEP, 6000)) + rng.randint(-4, 4)
+        parts, size = [], 0
+        while size < target:
+            p = _piece(rng)
+            parts.append(p)
+            size += len(p)
+        return "".join(parts)[:target]
+    return "".join(_piece(rng) for _ in range(rng.randint(1, 24)))
+
+def _has_surrogate(text: str) -> bool:
+    return any(0xD800 <= ord(ch) < 0xE000 for ch in text)
+
+# -- các đường cần so ---------------------------------------------------------
+
+_FIXED_SUFFIX = {"random4": "a1b2", "random6": "c3d4e5", "date": "20240229", "datetime": "202402292359"}
+_MODES = ("none", "hash4", "hash8", "random4", "random6", "date", "datetime")
+
+def expected_suffix(mode: str, text: str) -> str:
+    if mode == "none":
+        return ""
+    if mode in _HASH_BYTES:
+        return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=_HASH_BYTES[mode], key=_HASH_KEY).hexdigest()
+    return _FIXED_SUFFIX[mode]
+
+@lru_cache(maxsize=4096)
+def _slugifier(max_len: Optional[int], mode: str, cached: bool = False) -> Slugifier:
+    s = Slugifier(max_len=max_len, suffix_mode=mode, cache=SlugCache(256) if cached else None)
+    if mode in _FIXED_SUFFIX:
+        # Suffix ngẫu nhiên/theo giờ: cố định để so được với tham chiếu
+        fixed = _FIXED_SUFFIX[mode]
+        s._suffix = lambda text: fixed
+    return s
+
+def _paths(max_len: Optional[int], mode: str) -> Dict[str, Callable[[str], str]]:
+    s = _slugifier(max_len, mode)
+    paths = {"call": s}
+    if mode not in _FIXED_SUFFIX:
+        paths["api"] = lambda t: slugify_tieng_viet(t, max_len=max_len, suffix_mode=mode)
+        paths["bytes"] = lambda t: slugify_bytes(t.encode("utf-8"), max_len=max_len, suffix_mode=mode, as_bytes=False)
+    cached = _slugifier(max_len, mode, True)
+    paths["cache"] = lambda t: (cached(t), cached(t))[1]  # lần hai trúng cache
+    paths["batch1"] = lambda t: s.many([t])[0]
+    return paths
+
+class Failure(NamedTuple):
+    path: str
+    text: str
+    max_len: Optional[int]
+    mode: str
+    got: str
+    expected: str
+
+def _max_len_choices(rng: random.Random, text: str, mode: str) -> List[Optional[int]]:
+    n = len(base_slug(text))
+    s = len(expected_suffix(mode, text))
+    # Quanh độ dài base và base-suffix, nơi _smart_cut đổi nhánh
+    around = [m for m in (0, 1, 2, n - 1, n, n + 1, n + s, n + s + 1, n + s + 2) if m >= 0]
+    return [None, rng.randint(0, n + s + 3)] + rng.sample(around, min(3, len(around)))
+
+def check_case(text: str, max_len: Optional[int], mode: str) -> List[Failure]:
+    expected = slugify_reference(text, max_len, expected_suffix(mode, text))
+    out = []
+    for name, fn in _paths(max_len, mode).items():
+        if name == "bytes" and _has_surrogate(text):
+            continue  # UTF-8 không mã hóa được surrogate lẻ
+        got = fn(text)
+        if got != expected:
+            out.append(Failure(name, text, max_len, mode, got, expected))
+    return out
+
+def check_batch(texts: List[str], max_len: Optional[int], mode: str) -> List[Failure]:
+    """Đường chunk ghép (Slugifier.many) trên cả block."""
+    got = _slugifier(max_len, mode).many(texts, chunksize=64)
+    out = []
+    for text, slug in zip(texts, got):
+        expected = slugify_reference(text, max_len, expected_suffix(mode, text))
+        if slug != expected:
+            out.append(Failure("batch", text, max_len, mode, slug, expected))
+    return out
+
+# -- thu gọn ------------------------------------------------------------------
+
+def minimize(text: str, fails: Callable[[str], bool]) -> str:
+    """ddmin trên danh sách ký tự, rồi thử thay từng ký tự bằng 'a'."""
+    chars = list(text)
+    n = 2
+    while len(chars) >= 2:
+        size = -(-len(chars) // n)
+        for i in range(0, len(chars), size):
+            cand = chars[:i] + chars[i + size:]
+            if fails("".join(cand)):
+                chars = cand
+                n = max(n - 1, 2)
+                break
+        else:
+            if n >= len(chars):
+                break
+            n = min(2 * n, len(chars))
+    for i, ch in enumerate(chars):
+        if ch != "a":
+            cand = chars[:i] + ["a"] + chars[i + 1:]
+            if fails("".join(cand)):
+                chars = cand
+    return "".join(chars)
+
+def minimize_failure(f: Failure) -> Failure:
+    def fails(t: str) -> bool:
+        if f.path == "batch":
+            return bool(check_batch([t], f.max_len, f.mode))
+        return any(x.path == f.path for x in check_case(t, f.max_len, f.mode))
+    text = minimize(f.text, fails)
+    if f.path == "batch":
+        return check_batch([text], f.max_len, f.mode)[0]
+    return next(x for x in check_case(text, f.max_len, f.mode) if x.path == f.path)
+
+# -- chạy ---------------------------------------------------------------------
+
+def run(n: int, seed: int = 0, time_limit: Optional[float] = None, max_failures: int = 10,
+        batch: int = 256) -> tuple:
+    """Sinh n đầu vào, trả về (số đầu vào đã chạy, số phép so, danh sách Failure)."""
+    rng = random.Random(seed)
+    failures: List[Failure] = []
+    checks = done = 0
+    deadline = time.monotonic() + time_limit if time_limit else None
+    while done < n and len(failures) < max_failures:
+        block = [gen_text(rng) for _ in range(min(batch, n - done))]
+        mode = rng.choice(_MODES)
+        failures += check_batch(block, rng.choice((None, 0, 8, 40, 80)), mode)
+        checks += len(block)
+        for text in block:
+            mode = rng.choice(_MODES)
+            for max_len in _max_len_choices(rng, text, mode):
+                failures += check_case(text, max_len, mode)
+                checks += len(_paths(max_len, mode))
+        done += len(block)
+        if deadline and time.monotonic() > deadline:
+            break
+    return done, checks, failures[:max_failures]
+
+def throughput(scale: float = 1.0, min_time: float = 0.5) -> List[tuple]:
+    """(corpus, ops/s tham chiếu, ops/s slugify_tieng_viet) trên các corpus benchmark."""
+    sizes = {"articles": 20}
+    rows = []
+    for name, make in CORPORA.items():
+        data = make(max(1, int(sizes.get(name, 2000) * scale)))
+        rates = []
+        for fn in (slugify_reference, slugify_tieng_viet):
+            count, t0 = 0, time.perf_counter()
+            while True:
+                for text in data:
+                    fn(text)
+                count += len(data)
+                dt = time.perf_counter() - t0
+                if dt >= min_time:
+                    break
+            rates.append(count / dt)
+        rows.append((name, *rates))
+    return rows
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=100_000, help="số đầu vào sinh ra")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--time-limit", type=float, default=None, help="dừng sau số giây này")
+    ap.add_argument("--max-failures", type=int, default=10)
+    ap.add_argument("--no-throughput", action="store_true")
+    ap.add_argument("--scale", type=float, default=1.0, help="hệ số kích thước corpus khi đo thông lượng")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    done, checks, failures = run(args.n, args.seed, args.time_limit, args.max_failures)
+    dt = time.perf_counter() - t0
+    print(f"{done:,} đầu vào, {checks:,} phép so trong {dt:.1f}s ({checks / dt:,.0f} phép so/s), "
+          f"{len(failures)} khác biệt")
+    for f in failures:
+        m = minimize_failure(f)
+        print(f"\n[{m.path}] max_len={m.max_len!r} suffix_mode={m.mode!r}")
+        print(f"  đầu vào (thu gọn từ {len(f.text)} ký tự): {m.text!r}")
+        print(f"  code point: {' '.join(f'U+{ord(ch):04X}' for ch in m.text)}")
+        print(f"  nhanh: {m.got!r}\n  chuẩn: {m.expected!r}")
+
+    if not args.no_throughput:
+        print(f"\n{'corpus':>10} {'tham chiếu (op/s)':>18} {'slugify (op/s)':>16} {'x':>6}")
+        for name, ref, fast in throughput(args.scale):
+            print(f"{name:>10} {ref:>18,.0f} {fast:>16,.0f} {fast / ref:>6.1f}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# benchmarks/run.py
+"""
+Bộ benchmark chính: ops/s và bộ nhớ đỉnh cho slugify_tieng_viet, từng stage
+riêng và các đường batch/song song, trên nhiều loại corpus; thêm thời gian
+import slugify trong process mới (benchmarks.bench_import).
+
+Chạy:
+    python -m benchmarks.run                          # in kết quả
+    python -m benchmarks.run --save baseline.json     # lưu baseline
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+        # exit 1 nếu ops/s của case nào giảm quá 20% so với baseline
+        # hoặc chưa có file baseline
+Luôn exit 1 nếu slugify_many/iter_slugify chậm hơn gọi slugify_tieng_viet
+từng chuỗi trên cùng corpus.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import slugify
+from benchmarks.bench_import import import_time_us
+from benchmarks.corpus import CORPORA
+
+# Số phần tử mỗi corpus (bài viết dài nên ít hơn)
+_SIZES = {"titles": 5000, "articles": 50, "ascii": 5000, "emoji": 5000, "mixed": 5000}
+
+Case = Tuple[str, int, Callable[[], object]]
+
+def _cases(scale: float, workers: int) -> List[Case]:
+    """(tên, số phần tử xử lý mỗi lần chạy, hàm chạy)."""
+    cases: List[Case] = []
+    for name, make in CORPORA.items():
+        data = make(max(int(_SIZES[name] * scale), 1))
+        ascii_data = [slugify._normalize_to_ascii(s) for s in data]
+        bases = [slugify._collapse_and_clean_tokens(s) for s in ascii_data]
+        n = len(data)
+        cases += [
+            (f"slugify_tieng_viet/{name}", n,
+             lambda d=data: [slugify.slugify_tieng_viet(s) for s in d]),
+            (f"slugify_tieng_viet[max_len=60]/{name}", n,
+             lambda d=data: [slugify.slugify_tieng_viet(s, max_len=60) for s in d]),
+            (f"_normalize_to_ascii/{name}", n,
+             lambda d=data: [slugify._normalize_to_ascii(s) for s in d]),
+            (f"_collapse_and_clean_tokens/{name}", n,
+             lambda d=ascii_data: [slugify._collapse_and_clean_tokens(s) for s in d]),
+            (f"_smart_cut/{name}", n,
+             lambda d=bases: [slugify._smart_cut(s, 40) for s in d]),
+            (f"slugify_many/{name}", n, lambda d=data: slugify.slugify_many(d)),
+            (f"iter_slugify/{name}", n, lambda d=data: list(slugify.iter_slugify(d))),
+        ]
+        if workers > 1:
+            cases.append((f"slugify_many[workers={workers}]/{name}", n,
+                          lambda d=data: slugify.slugify_many(d, workers=workers, chunksize=256)))
+    for mode in slugify._SUFFIX_MAKERS:
+        cases.append((f"_make_suffix/{mode}", 10000,
+                      lambda m=mode: [slugify._make_suffix(m, "Tiêu đề mẫu") for _ in range(10000)]))
+    return cases
+
+def _measure(items: int, fn: Callable[[], object], min_time: float, repeat: int) -> Dict[str, float]:
+    fn()  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        loops = 0
+        t0 = time.perf_counter()
+        while True:
+            fn()
+            loops += 1
+            dt = time.perf_counter() - t0
+            if dt >= min_time:
+                break
+        best = min(best, dt / loops)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ops_per_sec": items / best, "peak_kib": peak / 1024}
+
+def run(scale: float, min_time: float, repeat: int, workers: int, only: str) -> Dict[str, dict]:
+    results = {}
+    for name, items, fn in _cases(scale, workers):
+        if only and only not in name:
+            continue
+        results[name] = r = _measure(items, fn, min_time, repeat)
+        print(f"{name:<48} {r['ops_per_sec']:>14,.0f} ops/s {r['peak_kib']:>12,.1f} KiB", flush=True)
+    # Khởi động: số lần import/s trong process mới (so baseline như các case khác)
+    name = "import slugify (-X importtime)"
+    if not only or only in name:
+        us = import_time_us(repeat=max(repeat, 5))
+        results[name] = r = {"ops_per_sec": 1e6 / us, "peak_kib": 0.0}
+        print(f"{name:<48} {r['ops_per_sec']:>14,.0f} ops/s {us / 1e3:>12,.2f} ms", flush=True)
+    return results
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Các case có ops/s thấp hơn baseline quá threshold (tỉ lệ 0..1)."""
+    failures = []
+    for name, base in baseline.items():
+        cur = results.get(name)
+        if cur is None:
+            continue
+        ratio = cur["ops_per_sec"] / base["ops_per_sec"]
+        if ratio < 1 - threshold:
+            failures.append(f"{name}: {cur['ops_per_sec']:,.0f} ops/s "
+                            f"({ratio:.0%} baseline {base['ops_per_sec']:,.0f})")
+    return failures
+
+# Đường batch phải không chậm hơn vòng gọi từng chuỗi; chừa sai số đo
+_BATCH_NOISE = 0.1
+
+def batch_failures(results: Dict[str, dict]) -> List[str]:
+    """Các case batch (slugify_many, iter_slugify) chậm hơn gọi lẻ trên cùng corpus."""
+    failures = []
+    for name, r in results.items():
+        api, _, corpus = name.partition("/")
+        scalar = results.get(f"slugify_tieng_viet/{corpus}")
+        if api not in ("slugify_many", "iter_slugify") or scalar is None:
+            continue
+        ratio = r["ops_per_sec"] / scalar["ops_per_sec"]
+        if ratio < 1 - _BATCH_NOISE:
+            failures.append(f"{name}: {ratio:.2f}x slugify_tieng_viet/{corpus}")
+    return failures
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark slugify")
+    ap.add_argument("--scale", type=float, default=1.0, help="hệ số kích thước corpus")
+    ap.add_argument("--min-time", type=float, default=0.2, help="thời gian tối thiểu mỗi lần đo (s)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 4))
+    ap.add_argument("--only", default="", help="chỉ chạy case có tên chứa chuỗi này")
+    ap.add_argument("--save", metavar="JSON", help="lưu kết quả làm baseline")
+    ap.add_argument("--compare", metavar="JSON", help="so với baseline, exit 1 nếu chậm hơn ngưỡng")
+    ap.add_argument("--threshold", type=float, default=0.2, help="mức giảm ops/s cho phép (mặc định 0.2)")
+    args = ap.parse_args(argv)
+    if args.compare and not os.path.exists(args.compare):
+        # Không có gì để so thì không được coi là đạt (checkout mới/CI)
+        print(f"Chưa có baseline {args.compare}: tạo bằng --save (make bench-baseline)")
+        return 1
+
+    results = run(args.scale, args.min_time, args.repeat, args.workers, args.only)
+
+    if args.save:
+        meta = {"python": sys.version.split()[0], "platform": platform.platform()}
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2, sort_keys=True)
+        print(f"Đã lưu baseline: {args.save}")
+
+    status = 0
+    slow_batch = batch_failures(results)
+    if slow_batch:
+        print("\nBATCH CHẬM HƠN GỌI LẺ:")
+        for line in slow_batch:
+            print(f"  {line}")
+        status = 1
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        failures = compare(results, baseline, args.threshold)
+        if failures:
+            print(f"\nCHẬM HƠN BASELINE quá {args.threshold:.0%}:")
+            for line in failures:
+                print(f"  {line}")
+            return 1
+        print(f"\nKhông case nào chậm hơn baseline quá {args.threshold:.0%}.")
+    return status
+
+if __name__ == "__main__":
+    raise SystemExit(main())
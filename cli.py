@@ -0,0 +1,186 @@
+# cli.py
+"""
+Dòng lệnh slugify hàng loạt: python -m slugify [tùy chọn] [file ...]
+Dịch vụ HTTP: python -m slugify serve (xem server.py)
+
+Đọc text (mỗi dòng một tiêu đề), CSV (một cột) hoặc JSONL (một trường)
+từ stdin hoặc file, ghi kết quả ra stdout theo luồng, bộ nhớ không đổi.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import io
+import json
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from typing import Iterator, List, Optional
+
+from slugify import _BATCH_CHUNKSIZE, _SUFFIX_MAKERS, Slugifier
+
+_IO_BUFFER = 1 << 20          # 1 MiB cho đọc/ghi
+_MMAP_THRESHOLD = 64 << 20    # file >= 64 MiB thì đọc qua mmap
+
+def _iter_mmap_lines(path: str) -> Iterator[str]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b""):
+            yield raw.decode("utf-8")
+
+def _iter_lines(path: str) -> Iterator[str]:
+    """Các dòng của file (giữ ký tự xuống dòng), '-' là stdin."""
+    if path == "-":
+        stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+        yield from iter(stdin.readline, "")
+        return
+    size = os.path.getsize(path)
+    if size and size >= _MMAP_THRESHOLD:
+        yield from _iter_mmap_lines(path)
+        return
+    with open(path, encoding="utf-8", newline="", buffering=_IO_BUFFER) as f:
+        yield from f
+
+class _Rows:
+    """Đọc bản ghi và ghi kết quả cho từng định dạng."""
+
+    def __init__(self, args: argparse.Namespace, out) -> None:
+        self.args = args
+        self.out = out
+        self.writer = csv.writer(out, lineterminator="\n")
+        self.header_written = False
+
+    def records(self, lines: Iterator[str]) -> Iterator[tuple]:
+        """Sinh (bản ghi, chuỗi cần slugify)."""
+        for line in lines:
+            text = line.rstrip("\r\n")
+            yield text, text
+
+    def write(self, record, slug: str) -> None:
+        self.out.write(slug)
+        self.out.write("\n")
+
+class _CsvRows(_Rows):
+    def records(self, lines: Iterator[str]) -> Iterator[tuple]:
+        args = self.args
+        reader = csv.reader(lines)
+        col = args.column
+        if args.no_header:
+            if not col.isdigit():
+                raise SystemExit("--column phải là chỉ số cột (0, 1, ...) khi dùng --no-header")
+            idx = int(col)
+        else:
+            header = next(reader, None)
+            if header is None:
+                return
+            if col in header:
+                idx = header.index(col)
+            elif col.isdigit():
+                idx = int(col)
+            else:
+                raise SystemExit(f"Không có cột {col!r} trong header CSV")
+            if not self.header_written:
+                # Nhiều file: chỉ ghi header của file đầu tiên
+                self.writer.writerow(header + [args.out_field])
+                self.header_written = True
+        for row in reader:
+            yield row, row[idx] if idx < len(row) else ""
+
+    def write(self, record, slug: str) -> None:
+        record.append(slug)
+        self.writer.writerow(record)
+
+class _JsonlRows(_Rows):
+    def records(self, lines: Iterator[str]) -> Iterator[tuple]:
+        field = self.args.field
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as e:
+                raise SystemExit(f"JSON lỗi ở dòng {lineno}: {e}")
+            value = obj.get(field) if isinstance(obj, dict) else None
+            yield obj, value if isinstance(value, str) else ""
+
+    def write(self, record, slug: str) -> None:
+        if isinstance(record, dict):
+            record[self.args.out_field] = slug
+        self.out.write(json.dumps(record, ensure_ascii=False))
+        self.out.write("\n")
+
+_FORMATS = {"text": _Rows, "csv": _CsvRows, "jsonl": _JsonlRows}
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="python -m slugify",
+        description="Slugify tiếng Việt hàng loạt theo luồng (stdin/file -> stdout).",
+    )
+    p.add_argument("files", nargs="*", default=["-"], help="file đầu vào, '-' là stdin (mặc định)")
+    p.add_argument("-f", "--format", choices=sorted(_FORMATS), default="text")
+    p.add_argument("--column", default="0", help="CSV: tên cột hoặc chỉ số cột (mặc định 0)")
+    p.add_argument("--no-header", action="store_true", help="CSV: không có dòng header")
+    p.add_argument("--field", default="title", help="JSONL: trường cần slugify (mặc định title)")
+    p.add_argument("--out-field", default="slug", help="CSV/JSONL: tên cột/trường kết quả")
+    p.add_argument("--max-len", type=int, default=None)
+    p.add_argument("--suffix-mode", choices=list(_SUFFIX_MAKERS), default="none")
+    p.add_argument("--translit", default=None, metavar="SCRIPTS",
+                   help="chuyển tự chữ không phải Latin: all hoặc danh sách, vd: cyrillic,greek")
+    p.add_argument("-j", "--workers", type=int, default=1, help="số process (mặc định 1)")
+    p.add_argument("--chunksize", type=int, default=_BATCH_CHUNKSIZE)
+    p.add_argument("-q", "--quiet", action="store_true", help="không in thống kê ra stderr")
+    return p
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["serve"]:
+        from server import main as serve
+        return serve(argv[1:])
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunksize < 1:
+        parser.error("--workers và --chunksize phải >= 1")
+    try:
+        translit = args.translit
+        if translit is not None:
+            translit = True if translit == "all" else [t for t in translit.split(",") if t]
+        slugifier = Slugifier(max_len=args.max_len, suffix_mode=args.suffix_mode, transliterate=translit)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    out = open(sys.stdout.fileno(), "w", encoding="utf-8", newline="",
+               buffering=_IO_BUFFER, closefd=False)
+    rows = _FORMATS[args.format](args, out)
+
+    # Bản ghi chờ kết quả; iter_many chỉ đọc trước một số chunk giới hạn
+    pending: deque = deque()
+    def texts() -> Iterator[str]:
+        for path in args.files:
+            for record, text in rows.records(_iter_lines(path)):
+                pending.append(record)
+                yield text
+
+    n = 0
+    t0 = time.perf_counter()
+    try:
+        for slug in slugifier.iter_many(texts(), args.chunksize, args.workers):
+            rows.write(pending.popleft(), slug)
+            n += 1
+    except BrokenPipeError:
+        # stdout bị đóng sớm (vd: | head), không in traceback
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        try:
+            out.flush()
+        except BrokenPipeError:
+            pass
+    dt = time.perf_counter() - t0
+    if not args.quiet:
+        rate = n / dt if dt > 0 else float("inf")
+        print(f"{n:,} dòng trong {dt:.2f}s ({rate:,.0f} dòng/s)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+# column.py
+"""
+SlugColumn: cột slug gọn cho kết quả batch lớn.
+
+Mọi slug nằm trong một buffer ASCII liền mạch, kèm mảng offset (array)
+thay cho một đối tượng str mỗi phần tử.
+
+    col = slugify_many(titles, as_column=True)
+    col[0], col[-10:], list(col), col.write_to(f)
+    col = SlugColumn(slugs, intern=True)   # slug trùng chỉ lưu một lần
+"""
+from __future__ import annotations
+import io
+from array import array
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+_BLOCK = 4096                 # số phần tử xử lý mỗi lần khi extend/iter/write
+_OFFSET_MAX_32 = 0xFFFFFFFF   # buffer vượt 4 GiB thì offset chuyển sang 64 bit
+
+class SlugColumn:
+    """
+    Dãy slug bất biến với người đọc (chỉ append/extend), chiếm bộ nhớ
+    ~ tổng độ dài slug + 4 byte/phần tử (8 byte khi buffer > 4 GiB).
+
+    intern=True: slug trùng chỉ lưu một lần trong buffer, mỗi phần tử là
+    một mã (4 byte) trỏ vào danh sách slug khác nhau; trong lúc dựng cột
+    giữ thêm dict slug -> mã.
+    """
+
+    __slots__ = ("_data", "_offsets", "_codes", "_lookup")
+
+    def __init__(self, slugs: Iterable[str] = (), *, intern: bool = False) -> None:
+        self._data = bytearray()
+        self._offsets = array("I", [0])
+        self._codes: Optional[array] = array("I") if intern else None
+        self._lookup: Optional[dict] = {} if intern else None
+        self.extend(slugs)
+
+    # -- dựng cột --------------------------------------------------------
+
+    def _grow_offsets(self, end: int) -> None:
+        if end > _OFFSET_MAX_32 and self._offsets.typecode == "I":
+            self._offsets = array("Q", self._offsets)
+
+    def _add_unique(self, raw: bytes) -> int:
+        self._data += raw
+        end = len(self._data)
+        self._grow_offsets(end)
+        self._offsets.append(end)
+        return len(self._offsets) - 2
+
+    def append(self, slug: str) -> None:
+        raw = slug.encode("ascii")
+        if self._codes is None:
+            self._add_unique(raw)
+            return
+        code = self._lookup.get(slug)
+        if code is None:
+            code = self._lookup[slug] = self._add_unique(raw)
+        self._codes.append(code)
+
+    def extend(self, slugs: Iterable[str]) -> None:
+        if self._codes is not None:
+            for slug in slugs:
+                self.append(slug)
+            return
+        it = iter(slugs)
+        for block in iter(lambda: list(islice(it, _BLOCK)), []):
+            # Một lần encode và một lần cộng dồn offset cho cả block
+            start = len(self._data)
+            self._data += "".join(block).encode("ascii")
+            self._grow_offsets(len(self._data))
+            self._offsets.extend(accumulate(map(len, block), initial=start))
+            del self._offsets[-len(block) - 1]  # offset đầu của block đã có sẵn
+
+    # -- truy cập --------------------------------------------------------
+
+    @property
+    def interned(self) -> bool:
+        return self._codes is not None
+
+    @property
+    def nunique(self) -> int:
+        """Số slug thực sự lưu trong buffer (khác nhau nếu intern)."""
+        return len(self._offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        """Bộ nhớ của buffer + offset (+ mã nếu intern), không tính dict intern."""
+        n = len(self._data) + self._offsets.itemsize * len(self._offsets)
+        if self._codes is not None:
+            n += self._codes.itemsize * len(self._codes)
+        return n
+
+    @property
+    def buffer(self) -> memoryview:
+        """Buffer ASCII liền mạch (chỉ đọc) của các slug đã lưu."""
+        return memoryview(self._data).toreadonly()
+
+    def __len__(self) -> int:
+        return len(self._codes) if self._codes is not None else len(self._offsets) - 1
+
+    def _slot(self, i: int) -> int:
+        return self._codes[i] if self._codes is not None else i
+
+    def get_bytes(self, i: int) -> bytes:
+        """Slug thứ i dạng bytes ASCII."""
+        j = self._slot(range(len(self))[i])
+        return bytes(self._data[self._offsets[j]:self._offsets[j + 1]])
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[str, "SlugColumn"]:
+        if isinstance(i, slice):
+            return self._slice(i)
+        j = self._slot(range(len(self))[i])  # range lo phần chỉ số âm và IndexError
+        return self._data[self._offsets[j]:self._offsets[j + 1]].decode("ascii")
+
+    def _slice(self, s: slice) -> "SlugColumn":
+        start, stop, step = s.indices(len(self))
+        if self._codes is None and step == 1:
+            # Cắt liền: copy một đoạn buffer và dời offset về 0
+            stop = max(start, stop)
+            lo, hi = self._offsets[start], self._offsets[stop]
+            out = SlugColumn()
+            out._data = self._data[lo:hi]
+            out._offsets = array(self._offsets.typecode, (o - lo for o in self._offsets[start:stop + 1]))
+            return out
+        return SlugColumn(
+            (self[k] for k in range(start, stop, step)), intern=self._codes is not None,
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        data, offsets, codes = self._data, self._offsets, self._codes
+        if codes is None:
+            n = len(self)
+            for lo in range(0, n, _BLOCK):
+                hi = min(lo + _BLOCK, n)
+                # Decode cả block một lần rồi cắt str
+                base = offsets[lo]
+                text = data[base:offsets[hi]].decode("ascii")
+                for k in range(lo, hi):
+                    yield text[offsets[k] - base:offsets[k + 1] - base]
+        else:
+            uniques = [data[offsets[j]:offsets[j + 1]].decode("ascii") for j in range(self.nunique)]
+            for code in codes:
+                yield uniques[code]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SlugColumn):
+            if len(self) != len(other):
+                return False
+            if self._codes is None and other._codes is None:
+                return self._data == other._data and self._offsets == other._offsets
+            return all(a == b for a, b in zip(self, other))
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        head = ", ".join(repr(s) for s in islice(self, 3))
+        more = ", ..." if len(self) > 3 else ""
+        return f"SlugColumn([{head}{more}], len={len(self)}, nbytes={self.nbytes})"
+
+    # -- biến đổi / xuất -------------------------------------------------
+
+    def intern(self) -> "SlugColumn":
+        """Bản intern của cột (slug trùng chỉ lưu một lần)."""
+        return SlugColumn(self, intern=True)
+
+    def write_to(self, f, sep: bytes = b"\n") -> int:
+        """
+        Ghi các slug vào file nhị phân/buffer có .write (mỗi slug kèm sep ở
+        cuối), trả về số byte đã ghi. sep=b"" ghi thẳng buffer (chỉ khi không intern).
+        """
+        data, offsets = self._data, self._offsets
+        if not sep and self._codes is None:
+            f.write(memoryview(data))
+            return len(data)
+        written = 0
+        n = len(self)
+        for lo in range(0, n, _BLOCK):
+            hi = min(lo + _BLOCK, n)
+            if self._codes is None:
+                parts = [data[offsets[k]:offsets[k + 1]] for k in range(lo, hi)]
+            else:
+                parts = [data[offsets[j]:offsets[j + 1]] for j in self._codes[lo:hi]]
+            chunk = sep.join(parts) + sep
+            f.write(chunk)
+            written += len(chunk)
+        return written
+
+    def tobytes(self, sep: bytes = b"\n") -> bytes:
+        """Như write_to nhưng trả về bytes."""
+        out = io.BytesIO()
+        self.write_to(out, sep)
+        return out.getvalue()
+
+__all__ = ["SlugColumn"]
@@ -0,0 +1,235 @@
+# registry.py
+"""Cấp phát slug duy nhất dựa trên pipeline của slugify."""
+from __future__ import annotations
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Set
+
+from slugify import Slugifier, _entropy, _smart_cut
+
+_COUNTER_TAIL = re.compile(r'^(.*)-([0-9]+)$')
+_RANDOM_BYTES = {"random4": 2, "random6": 3}
+_RANDOM_ATTEMPTS = 64
+
+def _with_suffix(base: str, suffix: str, max_len: Optional[int]) -> str:
+    """Ghép base-suffix, cắt base sao cho suffix không bị cắt mất; ValueError nếu không còn chỗ cho base."""
+    if max_len is not None:
+        room = max_len - len(suffix) - 1
+        if room < 1:
+            raise ValueError(f"max_len={max_len} quá nhỏ cho suffix {suffix!r} (cần >= {len(suffix) + 2})")
+        base = _smart_cut(base, room)
+    return f"{base}-{suffix}"
+
+def _check_mode(mode: str, max_len: Optional[int]) -> str:
+    """mode đã chuẩn hóa; ValueError nếu sai hoặc max_len không chứa nổi 'x-<suffix>'."""
+    mode = (mode or "counter").lower()
+    if mode != "counter" and mode not in _RANDOM_BYTES:
+        raise ValueError(f"mode không hợp lệ: {mode!r}")
+    # Suffix ngắn nhất: "2" (counter) hoặc 2*nbytes ký tự hex
+    need = 2 + (1 if mode == "counter" else 2 * _RANDOM_BYTES[mode])
+    if max_len is not None and max_len < need:
+        raise ValueError(f"max_len phải >= {need} với mode={mode!r}: {max_len!r}")
+    return mode
+
+def _split_counter(slug: str) -> tuple:
+    """'abc-7' -> ('abc', 7); slug không có đuôi số -> (slug, 1)."""
+    m = _COUNTER_TAIL.match(slug)
+    if m:
+        return m.group(1), int(m.group(2))
+    return slug, 1
+
+class UniqueSlugAllocator:
+    """
+    Cấp slug không trùng: ``base``, ``base-2``, ``base-3``... (mode="counter")
+    hoặc ``base-<hex>`` đã kiểm tra trùng (mode="random4" | "random6").
+
+    Mỗi base giữ bộ đếm riêng nên không phải dò tuyến tính.
+    existing: các slug đã cấp trước đó (vd: đọc từ database).
+    """
+
+    __slots__ = ("max_len", "mode", "_slugifier", "_issued", "_next")
+
+    def __init__(
+        self,
+        *,
+        max_len: Optional[int] = None,
+        mode: str = "counter",
+        existing: Iterable[str] = (),
+    ) -> None:
+        mode = _check_mode(mode, max_len)
+        # Chỉ dùng _base của Slugifier: cần base đầy đủ để cắt lại khi gắn suffix
+        self._slugifier = Slugifier(max_len=max_len)
+        self.max_len = max_len
+        self.mode = mode
+        self._issued: Set[str] = set()
+        self._next: Dict[str, int] = {}
+        self.seed(existing)
+
+    def __len__(self) -> int:
+        return len(self._issued)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._issued
+
+    def seed(self, slugs: Iterable[str]) -> None:
+        """Đánh dấu các slug đã tồn tại, cập nhật bộ đếm của base tương ứng."""
+        issued, nxt = self._issued, self._next
+        for slug in slugs:
+            issued.add(slug)
+            base, n = _split_counter(slug)
+            if n > 1 and nxt.get(base, 2) <= n:
+                nxt[base] = n + 1
+
+    def allocate(self, text: str) -> str:
+        """Slug duy nhất cho text; ValueError nếu text không sinh được slug."""
+        base = self._slugifier._base(text) if text else ""
+        if not base:
+            raise ValueError(f"Không sinh được slug từ đầu vào: {text!r}")
+        max_len = self.max_len
+        candidate = _smart_cut(base, max_len) if max_len is not None else base
+        issued = self._issued
+
+        if self.mode == "counter":
+            if candidate not in issued:
+                issued.add(candidate)
+                return candidate
+            n = self._next.get(candidate, 2)
+            slug = _with_suffix(base, str(n), max_len)
+            # Chỉ dò thêm khi slug dạng base-N đã được cấp từ nguồn khác
+            while slug in issued:
+                n += 1
+                slug = _with_suffix(base, str(n), max_len)
+            self._next[candidate] = n + 1
+        else:
+            nbytes = _RANDOM_BYTES[self.mode]
+            for _ in range(_RANDOM_ATTEMPTS):
+                slug = _with_suffix(base, _entropy.take(nbytes), max_len)
+                if slug not in issued:
+                    break
+            else:
+                raise RuntimeError(f"Hết suffix ngẫu nhiên cho base {candidate!r}")
+        issued.add(slug)
+        return slug
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS slugs ("
+    " slug TEXT PRIMARY KEY,"
+    " base TEXT NOT NULL,"
+    " n INTEGER"
+    ") WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS slugs_base_n ON slugs (base, n)",
+)
+
+class SqliteSlugRegistry:
+    """
+    Sổ đăng ký slug duy nhất lưu trong file SQLite, dùng chung giữa nhiều
+    worker/process và giữ nguyên sau khi khởi động lại.
+
+    Quy tắc base/suffix giống UniqueSlugAllocator. Bảng ``slugs`` có chỉ mục
+    (base, n) nên tra bộ đếm của một base không phụ thuộc số dòng.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_len: Optional[int] = None,
+        mode: str = "counter",
+        timeout: float = 30.0,
+    ) -> None:
+        mode = _check_mode(mode, max_len)
+        self._slugifier = Slugifier(max_len=max_len)
+        self.max_len = max_len
+        self.mode = mode
+        # isolation_level=None: tự quản lý giao dịch bằng BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteSlugRegistry":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM slugs").fetchone()[0]
+
+    def __contains__(self, slug: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM slugs WHERE slug = ?", (slug,)).fetchone()
+        return row is not None
+
+    def seed(self, slugs: Iterable[str]) -> None:
+        """Nhập các slug đã tồn tại (bỏ qua slug đã có) trong một giao dịch."""
+        rows = ((slug, *_split_counter(slug)) for slug in slugs)
+        with self._transaction() as cur:
+            cur.executemany("INSERT OR IGNORE INTO slugs (slug, base, n) VALUES (?, ?, ?)", rows)
+
+    def reserve(self, text: str) -> str:
+        """Giữ chỗ một slug duy nhất cho text."""
+        return self.reserve_many([text])[0]
+
+    def reserve_many(self, texts: Iterable[str]) -> List[str]:
+        """Giữ chỗ slug cho nhiều text trong cùng một giao dịch (tất cả hoặc không)."""
+        bases = []
+        for text in texts:
+            base = self._slugifier._base(text) if text else ""
+            if not base:
+                raise ValueError(f"Không sinh được slug từ đầu vào: {text!r}")
+            bases.append(base)
+        with self._transaction() as cur:
+            return [self._reserve_one(cur, base) for base in bases]
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+    def _reserve_one(self, cur: sqlite3.Cursor, base: str) -> str:
+        max_len = self.max_len
+        candidate = _smart_cut(base, max_len) if max_len is not None else base
+        insert = "INSERT OR IGNORE INTO slugs (slug, base, n) VALUES (?, ?, ?)"
+
+        if self.mode == "counter":
+            cur.execute(insert, (candidate, candidate, 1))
+            if cur.rowcount == 1:
+                return candidate
+            row = cur.execute("SELECT MAX(n) FROM slugs WHERE base = ?", (candidate,)).fetchone()
+            n = max((row[0] or 0) + 1, 2)
+            # Chỉ dò thêm khi slug dạng base-N đã được cấp từ nguồn khác
+            while True:
+                slug = _with_suffix(base, str(n), max_len)
+                cur.execute(insert, (slug, candidate, n))
+                if cur.rowcount == 1:
+                    return slug
+                n += 1
+
+        nbytes = _RANDOM_BYTES[self.mode]
+        for _ in range(_RANDOM_ATTEMPTS):
+            slug = _with_suffix(base, _entropy.take(nbytes), max_len)
+            cur.execute(insert, (slug, candidate, None))
+            if cur.rowcount == 1:
+                return slug
+        raise RuntimeError(f"Hết suffix ngẫu nhiên cho base {candidate!r}")
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK: giữ khóa ghi ngay từ đầu."""
+
+    __slots__ = ("_conn", "_cur")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Cursor:
+        self._cur = self._conn.cursor()
+        self._cur.execute("BEGIN IMMEDIATE")
+        return self._cur
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._cur.execute("ROLLBACK" if exc_type else "COMMIT")
+        self._cur.close()
+
+__all__ = ["SqliteSlugRegistry", "UniqueSlugAllocator"]
@@ -0,0 +1,237 @@
+# server.py
+"""
+Dịch vụ HTTP cục bộ cho slugify (chỉ dùng thư viện chuẩn).
+
+Chạy: python -m slugify serve [--port 8765] [--workers 4]
+
+    GET  /slugify?text=...&max_len=80&suffix_mode=none  -> {"slug": "..."}
+    POST /slugify  {"text": "...", "max_len": 80}       -> {"slug": "..."}
+    POST /batch    {"texts": [...], "suffix_mode": ...} -> {"slugs": [...]}
+    GET  /stats                                         -> thông lượng, độ trễ p50/p90/p99
+"""
+from __future__ import annotations
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from slugify import _SUFFIX_MAKERS, _get_slugifier, slugify_many
+
+MAX_BATCH = 10_000
+MAX_BODY = 16 << 20
+_POOL_CHUNK = 1024            # batch lớn hơn thì chia chunk gửi sang process pool
+_LATENCY_SAMPLES = 10_000
+
+def _parse_options(opts: dict, from_json: bool = False) -> Tuple[Optional[int], str]:
+    """(max_len, suffix_mode) từ query/JSON; ValueError nếu sai."""
+    max_len = opts.get("max_len")
+    if from_json:
+        # JSON đã có kiểu: không để true thành 1 hay 2.9 thành 2
+        if max_len is not None and type(max_len) is not int:
+            raise ValueError(f"max_len phải là số nguyên hoặc null: {max_len!r}")
+        if max_len is not None and max_len < 0:
+            raise ValueError(f"max_len phải >= 0: {max_len!r}")
+    elif max_len == "":
+        max_len = None
+    elif max_len is not None:
+        try:
+            max_len = int(max_len)
+        except (TypeError, ValueError):
+            raise ValueError(f"max_len không hợp lệ: {max_len!r}")
+        if max_len < 0:
+            raise ValueError(f"max_len phải >= 0: {max_len!r}")
+    mode = opts.get("suffix_mode") or "none"
+    if not isinstance(mode, str) or mode.lower() not in _SUFFIX_MAKERS:
+        raise ValueError(f"suffix_mode không hợp lệ: {mode!r}")
+    return max_len, mode.lower()
+
+class ServerStats:
+    """Số yêu cầu/phần tử và mẫu độ trễ gần nhất để tính phân vị."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.items = 0
+        self._latencies: deque = deque(maxlen=_LATENCY_SAMPLES)
+
+    def add(self, items: int, seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.items += items
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lat = sorted(self._latencies)
+            requests, items = self.requests, self.items
+        uptime = time.monotonic() - self.started
+
+        def pct(p: float) -> float:
+            return lat[min(int(p * len(lat)), len(lat) - 1)] * 1000 if lat else 0.0
+
+        return {
+            "uptime_s": uptime,
+            "requests": requests,
+            "items": items,
+            "requests_per_s": requests / uptime if uptime else 0.0,
+            "items_per_s": items / uptime if uptime else 0.0,
+            "latency_ms": {"p50": pct(0.50), "p90": pct(0.90), "p99": pct(0.99)},
+        }
+
+class SlugHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, workers: int = 1) -> None:
+        super().__init__(address, SlugRequestHandler)
+        self.stats = ServerStats()
+        self.pool = ProcessPoolExecutor(workers) if workers > 1 else None
+
+    def slugify_batch(self, texts: List[str], max_len: Optional[int], mode: str) -> List[str]:
+        if self.pool is None or len(texts) <= _POOL_CHUNK:
+            return _get_slugifier(max_len, mode).many(texts)
+        futures = [
+            self.pool.submit(slugify_many, texts[i:i + _POOL_CHUNK], max_len=max_len, suffix_mode=mode)
+            for i in range(0, len(texts), _POOL_CHUNK)
+        ]
+        out: List[str] = []
+        for future in futures:
+            out += future.result()
+        return out
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.pool is not None:
+            self.pool.shutdown()
+
+class SlugRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # Header và body ghi thành hai lần: tắt Nagle để tránh trễ ~40ms do delayed ACK
+    disable_nagle_algorithm = True
+    server: SlugHTTPServer
+
+    def log_message(self, format, *args) -> None:
+        pass  # tắt log từng request, xem /stats
+
+    def _send_json(self, status: int, obj: dict) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _content_length(self) -> int:
+        value = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(value)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Không biết body dài bao nhiêu: không đọc, không dùng lại kết nối
+            self.close_connection = True
+            raise _HTTPError(400, f"Content-Length không hợp lệ: {value!r}")
+        return length
+
+    def _read_json(self) -> dict:
+        length = self._content_length()
+        if length > MAX_BODY:
+            self.close_connection = True  # không đọc body, không dùng lại kết nối
+            raise _HTTPError(413, f"body vượt quá {MAX_BODY} byte")
+        try:
+            obj = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            raise _HTTPError(400, f"JSON không hợp lệ: {e}")
+        if not isinstance(obj, dict):
+            raise _HTTPError(400, "body phải là JSON object")
+        return obj
+
+    def _handle(self, fn) -> None:
+        t0 = time.perf_counter()
+        try:
+            obj, items = fn()
+        except _HTTPError as e:
+            self._send_json(e.status, {"error": e.message})
+            return
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(200, obj)
+        self.server.stats.add(items, time.perf_counter() - t0)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/slugify":
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            self._handle(lambda: self._single(query))
+        elif url.path == "/stats":
+            self._send_json(200, self.server.stats.snapshot())
+        else:
+            self._send_json(404, {"error": "không tìm thấy"})
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/slugify":
+            self._handle(lambda: self._single(self._read_json(), from_json=True))
+        elif path == "/batch":
+            self._handle(self._batch)
+        else:
+            self._handle(self._not_found)
+
+    def _not_found(self) -> tuple:
+        length = self._content_length()
+        if length > MAX_BODY:
+            self.close_connection = True
+        else:
+            # Vẫn đọc hết body để giữ kết nối keep-alive dùng được
+            self.rfile.read(length)
+        raise _HTTPError(404, "không tìm thấy")
+
+    def _single(self, opts: dict, from_json: bool = False) -> tuple:
+        text = opts.get("text", "")
+        if not isinstance(text, str):
+            raise ValueError("text phải là chuỗi")
+        max_len, mode = _parse_options(opts, from_json)
+        return {"slug": _get_slugifier(max_len, mode)(text)}, 1
+
+    def _batch(self) -> tuple:
+        opts = self._read_json()
+        texts = opts.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise ValueError("texts phải là mảng chuỗi")
+        if len(texts) > MAX_BATCH:
+            raise _HTTPError(413, f"tối đa {MAX_BATCH} phần tử mỗi batch")
+        max_len, mode = _parse_options(opts, from_json=True)
+        return {"slugs": self.server.slugify_batch(texts, max_len, mode)}, len(texts)
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m slugify serve", description="Dịch vụ HTTP slugify cục bộ.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("-j", "--workers", type=int, default=1, help="số process cho batch lớn")
+    args = ap.parse_args(argv)
+    if args.workers < 1:
+        ap.error("--workers phải >= 1")
+
+    with SlugHTTPServer((args.host, args.port), workers=args.workers) as httpd:
+        host, port = httpd.server_address[:2]
+        print(f"Đang phục vụ http://{host}:{port} (Ctrl+C để dừng)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,43 +1,192 @@
 # slugify.py
 from __future__ import annotations
-import re
 import unicodedata as ud
-from typing import Optional
-from datetime import datetime
-import secrets
-
-# Regex cơ bản
-_NON_ALNUM_RUN = re.compile(r'[^A-Za-z0-9]+')
-_HYPHEN_RUN = re.compile(r'-{2,}')
-_TRIM_HYPHENS = re.compile(r'^-+|-+$')
+from _thread import allocate_lock
+from collections import OrderedDict, deque, namedtuple
+from functools import lru_cache, partial
+from itertools import chain, islice
+from time import perf_counter_ns, time
+import os
+
+# Import lười (chỉ khi dùng tới) để import slugify nhanh cho CLI/serverless ngắn:
+# re (đầu vào bytes), datetime (suffix date), secrets (random), hashlib (hash),
+# concurrent.futures (workers). typing chỉ cần cho annotation (đã hoãn nhờ
+# `from __future__ import annotations`) nên cũng không import lúc chạy.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+    from column import SlugColumn
+
+class _LazyRegex:
+    """re.compile lười: biên dịch ở lần dùng đầu, sau đó thuộc tính trỏ thẳng vào pattern đã biên dịch."""
+
+    def __init__(self, pattern) -> None:
+        self._pattern = pattern
+
+    def __getattr__(self, name: str):
+        import re
+        value = getattr(re.compile(self._pattern), name)
+        setattr(self, name, value)
+        return value
+
+# Gộp token trên đường mặc định: byte chữ/số giữ nguyên (chữ hoa -> thường),
+# mọi byte khác -> khoảng trắng, rồi split() lấy token (không cần regex)
+_TOKEN_BYTES = bytes(
+    (i | 0x20 if 0x41 <= i <= 0x5A else i)
+    if 0x30 <= i <= 0x39 or 0x41 <= i <= 0x5A or 0x61 <= i <= 0x7A else 0x20
+    for i in range(256)
+)
+# Đầu vào bytes UTF-8: quét thẳng trên buffer, không dựng str trung gian
+_ALNUM_RUN_BYTES = _LazyRegex(rb'[A-Za-z0-9]+')
+_NON_ASCII_BYTE = _LazyRegex(rb'[\x80-\xff]')
+# Batch: ghép chunk bằng ký tự phân cách để chuẩn hóa/gộp token một lần;
+# cùng bảng _TOKEN_BYTES nhưng giữ nguyên byte phân cách
+_BATCH_SEP = "\x00"
+_BATCH_TOKEN_BYTES = b"\x00" + _TOKEN_BYTES[1:]
+_BATCH_CHUNKSIZE = 1024
+# Chuỗi trung bình dài hơn ngưỡng này thì ghép không còn lợi (đo bằng
+# benchmarks.run): chi phí mỗi lần gọi đã nhỏ so với chuẩn hóa
+_BATCH_JOIN_MAX_AVG = 512
+# Cắt sớm: đầu vào dài hơn ngưỡng và có max_len thì xử lý dần theo đoạn
+_INCREMENTAL_MIN_LEN = 2048
+_INCREMENTAL_STEP = 1024
 _MANUAL_MAP = {"đ": "d", "Đ": "D"}
+_DASHLIKE = frozenset({
+    "\u2010", "\u2011", "\u2012", "\u2013", "\u2014", "\u2015",
+    "\u2212", "\u2043", "\uFE58", "\uFE63", "\uFF0D"
+})
 
-def _normalize_to_ascii(text: str) -> str:
-    """Chuẩn hóa Unicode và lọc về ASCII cơ bản."""
-    if not text:
-        return ""
+# Các dải mã được tính sẵn vào bảng gập ASCII: Latin-1, Latin Extended-A/B,
+# dấu kết hợp, Latin Extended Additional (chữ Việt) và dấu câu chung.
+_FOLD_RANGES = (
+    (0x0080, 0x0250),
+    (0x0300, 0x0370),
+    (0x1E00, 0x1F00),
+    (0x2000, 0x2070),
+)
+
+def _normalize_slow(text: str) -> str:
+    """Đường chuẩn hóa Unicode đầy đủ, dùng cho ký tự không có trong bảng."""
     s = ud.normalize("NFC", text)
     s = "".join(_MANUAL_MAP.get(ch, ch) for ch in s)
-
-    DASHLIKE = {
-        "\u2010", "\u2011", "\u2012", "\u2013", "\u2014", "\u2015",
-        "\u2212", "\u2043", "\uFE58", "\uFE63", "\uFF0D"
-    }
-    s = "".join("-" if (ud.category(ch) == "Pd" or ch in DASHLIKE) else ch for ch in s)
-
+    s = "".join("-" if (ud.category(ch) == "Pd" or ch in _DASHLIKE) else ch for ch in s)
     s = ud.normalize("NFKD", s)
     s = "".join(ch for ch in s if ud.category(ch) != "Mn")
     s = s.encode("ascii", "ignore").decode("ascii", "ignore")
     return s
 
-def _collapse_and_clean_tokens(s: str) -> str:
-    """Thay cụm ký tự không phải chữ/số bằng '-', gộp/trims dấu '-'."""
-    s = s.lower()
-    s = _NON_ALNUM_RUN.sub("-", s)
-    s = _HYPHEN_RUN.sub("-", s)
-    s = _TRIM_HYPHENS.sub("", s)
+def _build_fold_table() -> dict:
+    """Dựng bảng code point -> chuỗi ASCII từ _normalize_slow."""
+    points = [cp for lo, hi in _FOLD_RANGES for cp in range(lo, hi)]
+    points += [ord(ch) for ch in _DASHLIKE]
+    table = {cp: _normalize_slow(chr(cp)) for cp in points}
+    # ASCII ánh xạ về chính nó: str.translate tra trúng thay vì KeyError từng ký tự (~2x nhanh hơn)
+    table.update((cp, chr(cp)) for cp in range(0x80))
+    return dict(sorted(table.items()))
+
+_FOLD_SEP = "\x80"   # phân cách giá trị trong _fold_table.py (giá trị luôn là ASCII)
+
+def _write_fold_table(path: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_fold_table.py")) -> None:
+    """Sinh lại _fold_table.py (make fold-table) sau khi đổi _FOLD_RANGES/_normalize_slow."""
+    table = {cp: v for cp, v in _build_fold_table().items() if cp >= 0x80}
+    runs: list = []   # các đoạn code point liên tiếp [lo, hi)
+    for cp in table:
+        if runs and runs[-1][1] == cp:
+            runs[-1][1] = cp + 1
+        else:
+            runs.append([cp, cp + 1])
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("# _fold_table.py\n")
+        f.write("# Sinh tự động bởi slugify._write_fold_table (make fold-table), không sửa tay.\n")
+        f.write('"""\nBảng gập code point -> ASCII dựng sẵn cho slugify (ngoài ASCII).\n\n')
+        f.write("Mỗi đoạn (lo, hi, giá trị): giá trị của lo..hi-1 nối bằng slugify._FOLD_SEP;\n")
+        f.write('một chuỗi mỗi đoạn nên import không phải biên dịch dict lớn.\n"""\n')
+        f.write(f"UNIDATA_VERSION = {ud.unidata_version!r}\n")
+        f.write("FOLD_RANGES = (\n")
+        for lo, hi in runs:
+            values = _FOLD_SEP.join(table[cp] for cp in range(lo, hi))
+            f.write(f"    ({lo:#06x}, {hi:#06x}, {values!r}),\n")
+        f.write(")\n")
+
+def _load_fold_table() -> dict:
+    """Bảng dựng sẵn trong _fold_table.py; thiếu file hoặc khác phiên bản Unicode thì dựng tại chỗ."""
+    try:
+        from _fold_table import FOLD_RANGES, UNIDATA_VERSION
+    except ImportError:
+        return _build_fold_table()
+    if UNIDATA_VERSION != ud.unidata_version:
+        return _build_fold_table()
+    table = {cp: chr(cp) for cp in range(0x80)}
+    for lo, hi, values in FOLD_RANGES:
+        table.update(zip(range(lo, hi), values.split(_FOLD_SEP)))
+    return table
+
+_FOLD_TABLE = _load_fold_table()
+
+def _normalize_to_ascii(text: str) -> str:
+    """Chuẩn hóa Unicode và lọc về ASCII cơ bản."""
+    if not text:
+        return ""
+    if text.isascii():
+        return text
+    s = text.translate(_FOLD_TABLE)
+    if not s.isascii():
+        s = _normalize_slow(s)
     return s
 
+def _collapse_and_clean_tokens(s: str) -> str:
+    """
+    Nối các cụm chữ/số bằng '-' rồi chữ thường.
+
+    Một lượt bytes.translate (hạ chữ hoa, ký tự khác thành khoảng trắng) rồi
+    split() lấy token nên không sinh '--' hay '-' ở hai đầu; nhanh hơn
+    regex ~2x. Ký tự non-ASCII (nếu có) thành '?' rồi cũng là phân cách.
+    """
+    return "-".join(s.encode("ascii", "replace").translate(_TOKEN_BYTES).decode("ascii").split())
+
+def _collapse_bytes(data) -> bytes:
+    """Như _collapse_and_clean_tokens cho buffer ASCII (bytes/memoryview)."""
+    return b"-".join(_ALNUM_RUN_BYTES.findall(data)).lower()
+
+def _prefix_base(pieces, fold, collapse, need: int, dash):
+    """
+    Base của các đoạn nối tiếp nhau, dừng khi đã dài >= need (str hoặc bytes).
+
+    Mỗi đoạn chỉ được gập/gộp token một lần: token cuối có thể còn tiếp ở đoạn
+    sau nên giữ lại (carry) ghép vào đầu đoạn kế, phần trước nó đã chốt. Tổng
+    công việc tuyến tính theo phần đã đọc, kể cả khi đầu vào gần như toàn dấu câu.
+    """
+    empty = dash[:0]
+    done = []      # các phần base đã chốt, nối bằng dash
+    length = 0     # len(dash.join(done))
+    carry = empty
+    for piece in pieces:
+        folded = carry + fold(piece)
+        part = collapse(folded)
+        carry = empty
+        if part and folded[-1:].isalnum():
+            cut = part.rfind(dash)
+            carry = part[cut + 1:]
+            part = part[:max(cut, 0)]
+        if part:
+            length += len(part) + (1 if done else 0)
+            done.append(part)
+        if length + len(carry) + (1 if done and carry else 0) >= need:
+            break
+    if carry:
+        done.append(carry)
+    return dash.join(done)
+
+def _utf8_pieces(data, step: int):
+    """Các đoạn ~step byte của buffer UTF-8, không cắt giữa chuỗi byte của một ký tự."""
+    start, n = 0, len(data)
+    while start < n:
+        end = min(start + step, n)
+        while end < n and 0x80 <= data[end] < 0xC0:
+            end += 1
+        yield data[start:end]
+        start = end
+
 def _smart_cut(slug: str, max_len: int) -> str:
     """Cắt slug thông minh với max_len, ưu tiên biên từ '-'."""
     if len(slug) <= max_len:
@@ -53,20 +202,601 @@ def _smart_cut(slug: str, max_len: int) -> str:
         trimmed = slug[:max_len].rstrip("-")
     return trimmed
 
-def _make_suffix(mode: str) -> str:
+class _EntropyPool:
+    """Bộ đệm hex ngẫu nhiên (secrets), nạp lại theo lô thay vì đọc OS mỗi lần."""
+
+    __slots__ = ("_size", "_hex", "_pos", "_lock")
+
+    def __init__(self, size: int = 4096) -> None:
+        self._size = size
+        self._reset()
+
+    def _reset(self) -> None:
+        # Nạp lười ở lần lấy đầu tiên; gọi lại trong process con sau fork
+        self._hex = ""
+        self._pos = 0
+        self._lock = allocate_lock()
+
+    def take(self, nbytes: int) -> str:
+        n = 2 * nbytes
+        with self._lock:
+            pos = self._pos
+            if pos + n > len(self._hex):
+                from secrets import token_hex
+                self._hex = token_hex(self._size)
+                pos = 0
+            self._pos = pos + n
+            return self._hex[pos:pos + n]
+
+_entropy = _EntropyPool()
+if hasattr(os, "register_at_fork"):
+    # Process con không được dùng lại phần bộ đệm của process cha
+    os.register_at_fork(after_in_child=_entropy._reset)
+
+class _CachedTimestamp:
+    """Chuỗi thời gian đã format, chỉ format lại khi sang phút/ngày mới."""
+
+    __slots__ = ("_fmt", "_per_minute", "_value", "_valid_until")
+
+    def __init__(self, fmt: str, per_minute: bool) -> None:
+        self._fmt = fmt
+        self._per_minute = per_minute
+        self._value = ""
+        self._valid_until = 0.0
+
+    def __call__(self, text: str = "") -> str:
+        if time() >= self._valid_until:
+            from datetime import datetime, timedelta
+            now = datetime.now()
+            if self._per_minute:
+                nxt = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+            else:
+                nxt = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            self._value = now.strftime(self._fmt)
+            self._valid_until = nxt.timestamp()
+        return self._value
+
+_HASH_KEY = b"slugify-tieng-viet"
+_HASH_BYTES = {"hash4": 2, "hash8": 4}
+
+def _blake2b(*args, **kwargs):
+    """Lần gọi đầu mới import hashlib, rồi thay chính nó bằng hashlib.blake2b."""
+    global _blake2b
+    from hashlib import blake2b as _blake2b
+    return _blake2b(*args, **kwargs)
+
+def _hash_suffix(nbytes: int, text: Union[str, bytes], key: bytes = _HASH_KEY) -> str:
+    """Suffix tất định từ blake2b có khóa của đầu vào (bytes: băm nguyên văn)."""
+    data = text.encode("utf-8", "surrogatepass") if isinstance(text, str) else text
+    return _blake2b(data, digest_size=nbytes, key=key).hexdigest()
+
+# Mỗi maker nhận text đầu vào (chỉ chế độ hash dùng tới)
+_SUFFIX_MAKERS = {
+    "none": None,
+    "random4": lambda text: _entropy.take(2),  # 4 hex chars
+    "random6": lambda text: _entropy.take(3),  # 6 hex chars
+    "date": _CachedTimestamp("%Y%m%d", per_minute=False),
+    "datetime": _CachedTimestamp("%Y%m%d%H%M", per_minute=True),
+    "hash4": partial(_hash_suffix, _HASH_BYTES["hash4"]),
+    "hash8": partial(_hash_suffix, _HASH_BYTES["hash8"]),
+}
+
+def _make_suffix(mode: str, text: str = "") -> str:
     """Sinh suffix theo chế độ."""
-    mode = (mode or "none").lower()
-    if mode == "none":
+    maker = _SUFFIX_MAKERS.get((mode or "none").lower())
+    return maker(text) if maker else ""
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+class SlugCache:
+    """
+    Cache LRU có giới hạn cho Slugifier, kèm bộ đếm hit/miss/eviction.
+
+    Khóa là (text, max_len). Với suffix không tất định (random/date) chỉ
+    slug gốc được cache (khóa (text, None)), suffix luôn sinh mới.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "evictions", "_data")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"maxsize phải là số nguyên >= 1: {maxsize!r}")
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: tuple) -> Optional[str]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            self._data.move_to_end(key)
+        except KeyError:  # bị luồng khác đẩy ra giữa chừng
+            pass
+        return value
+
+    def put(self, key: tuple, value: str) -> None:
+        data = self._data
+        data[key] = value
+        if len(data) > self.maxsize:
+            try:
+                data.popitem(last=False)
+                self.evictions += 1
+            except KeyError:
+                pass
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """Xóa dữ liệu và đặt lại bộ đếm."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+class Slugifier:
+    """
+    Bộ slugify với cấu hình cố định, kiểm tra một lần khi khởi tạo.
+
+    Giữ một instance cho mỗi worker rồi gọi trực tiếp: ``slug = s(text)``.
+    char_map: ánh xạ bổ sung ký tự -> chuỗi ASCII, áp dụng trước bảng mặc định.
+    hash_key: khóa blake2b (bytes, <= 64) cho suffix_mode hash4/hash8.
+    cache: SlugCache tùy chọn, chỉ dùng chung giữa các Slugifier cùng char_map/transliterate.
+    transliterate: True hoặc tên script ("latin", "greek", "cyrillic", "cjk")
+    để chuyển tự chữ mà bảng mặc định bỏ đi (xem translit/); mặc định tắt.
+    """
+
+    __slots__ = (
+        "max_len", "suffix_mode", "char_map", "hash_key", "cache", "transliterate",
+        "_suffix", "_table", "_fold_ascii", "_nfc",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_len: Optional[int] = None,
+        suffix_mode: str = "none",
+        char_map: Optional[Mapping[str, str]] = None,
+        hash_key: Optional[bytes] = None,
+        cache: Optional[SlugCache] = None,
+        transliterate: Union[bool, str, Iterable[str], None] = None,
+    ) -> None:
+        if max_len is not None and (not isinstance(max_len, int) or max_len < 0):
+            raise ValueError(f"max_len phải là số nguyên không âm hoặc None: {max_len!r}")
+        mode = (suffix_mode or "none").lower()
+        if mode not in _SUFFIX_MAKERS:
+            raise ValueError(f"suffix_mode không hợp lệ: {suffix_mode!r}")
+        if hash_key is not None and (not isinstance(hash_key, bytes) or len(hash_key) > 64):
+            raise ValueError("hash_key phải là bytes dài tối đa 64")
+
+        table = _FOLD_TABLE
+        fold_ascii = False
+        nfc = False
+        if char_map:
+            table = dict(_FOLD_TABLE)
+            for ch, repl in char_map.items():
+                if not isinstance(ch, str) or len(ch) != 1:
+                    raise ValueError(f"Khóa char_map phải là một ký tự: {ch!r}")
+                if not isinstance(repl, str) or not repl.isascii():
+                    raise ValueError(f"Giá trị char_map phải là chuỗi ASCII: {repl!r}")
+                table[ord(ch)] = repl
+                fold_ascii = fold_ascii or ch.isascii()
+                # "ư" trong đầu vào NFD là "u" + dấu rời: phải gộp lại mới tra trúng khóa
+                nfc = nfc or ud.normalize("NFD", ch) != ch
+        scripts: tuple = ()
+        if transliterate:
+            # Chỉ import khi bật: workload mặc định không tốn gì thêm
+            from translit import TranslitTable, resolve_scripts
+            scripts = resolve_scripts(transliterate)
+            keep = [ord(ch) for ch in char_map] if char_map else ()
+            table = TranslitTable(table, scripts, _normalize_slow, keep)
+
+        self.max_len = max_len
+        self.suffix_mode = mode
+        self.char_map = dict(char_map) if char_map else None
+        self.hash_key = hash_key
+        self.cache = cache
+        self._suffix = _SUFFIX_MAKERS[mode]
+        if hash_key is not None and mode in _HASH_BYTES:
+            self._suffix = partial(_hash_suffix, _HASH_BYTES[mode], key=hash_key)
+        self.transliterate = scripts
+        self._table = table
+        self._fold_ascii = fold_ascii
+        # Bảng chuyển tự/char_map tra theo từng ký tự: gộp dấu rời (NFD) trước khi tra
+        self._nfc = nfc or bool(scripts)
+
+    def __repr__(self) -> str:
+        return f"Slugifier(max_len={self.max_len!r}, suffix_mode={self.suffix_mode!r})"
+
+    def _normalize(self, text: str) -> str:
+        if self._fold_ascii or not text.isascii():
+            if self._nfc and not ud.is_normalized("NFC", text):
+                text = ud.normalize("NFC", text)
+            text = text.translate(self._table)
+            if not text.isascii():
+                text = _normalize_slow(text)
+        return text
+
+    # Hook từng stage cho đường gọi lẻ (str và bytes); enable_stats() thay
+    # bằng bản có đo thời gian, thuật toán chỉ viết một lần
+    _stage_normalize = _normalize
+    _stage_collapse = staticmethod(_collapse_and_clean_tokens)
+
+    def _base(self, text: str) -> str:
+        text = self._stage_normalize(text)
+        return self._stage_collapse(text) if text else ""
+
+    def _base_prefix(self, text: str) -> str:
+        """
+        Như _base nhưng dừng khi base đã dài hơn max_len.
+
+        Chuẩn hóa theo từng ký tự và token chỉ nối thêm về cuối, nên base của
+        một đoạn đầu luôn là tiền tố của base đầy đủ; hơn max_len + 1 ký tự
+        là đủ để _smart_cut cho kết quả y hệt (suffix nằm ngoài vùng cắt).
+        """
+        if self._nfc and not ud.is_normalized("NFC", text):
+            # Gộp dấu rời cho cả chuỗi trước khi chia đoạn: ký tự NFD vắt qua
+            # biên đoạn sẽ tra bảng chuyển tự/char_map thành kết quả khác
+            text = ud.normalize("NFC", text)
+        need = self.max_len + 1
+        step = max(_INCREMENTAL_STEP, 4 * need)
+        pieces = (text[i:i + step] for i in range(0, len(text), step))
+        return _prefix_base(pieces, self._stage_normalize, self._stage_collapse, need, "-")
+
+    def _finish(self, base: str, text: str) -> str:
+        if not base:
+            return ""
+        slug = base
+        if self._suffix is not None:
+            slug = f"{base}-{self._suffix(text)}"
+        if self.max_len is not None:
+            slug = _smart_cut(slug, self.max_len)
+        # base và suffix đã sạch, _smart_cut không để lại '-' ở hai đầu
+        return slug
+
+    def __call__(self, text: str) -> str:
+        if not text:
+            return ""
+        cache = self.cache
+        if cache is None:
+            if self.max_len is not None and len(text) > _INCREMENTAL_MIN_LEN:
+                return self._finish(self._base_prefix(text), text)
+            return self._finish(self._base(text), text)
+
+        if self._suffix is None:
+            key = (text, self.max_len)
+            slug = cache.get(key)
+            if slug is None:
+                slug = self._finish(self._base(text), text)
+                cache.put(key, slug)
+            return slug
+        # Suffix không tất định: chỉ cache slug gốc
+        key = (text, None)
+        base = cache.get(key)
+        if base is None:
+            base = self._base(text)
+            cache.put(key, base)
+        return self._finish(base, text)
+
+    def _fold_bytes(self, data):
+        # Buffer ASCII: trả nguyên buffer, regex chạy thẳng trên đó (không copy).
+        # Có byte non-ASCII: decode (C) rồi gập bằng cùng bảng translate; gập
+        # từng chuỗi byte UTF-8 bằng callback Python đo được chậm hơn.
+        if self._fold_ascii or _NON_ASCII_BYTE.search(data):
+            return self._normalize(str(data, "utf-8", "replace")).encode("ascii")
+        return data
+
+    _stage_fold_bytes = _fold_bytes
+    _stage_collapse_bytes = staticmethod(_collapse_bytes)
+
+    def _base_bytes(self, data) -> bytes:
+        return self._stage_collapse_bytes(self._stage_fold_bytes(data))
+
+    def _base_bytes_prefix(self, data) -> bytes:
+        """Như _base_prefix cho buffer UTF-8, không cắt giữa chuỗi byte của một ký tự."""
+        if self._nfc:
+            # Cần NFC cả chuỗi (xem _base_prefix): decode một lần rồi đi đường str
+            return self._base_prefix(str(data, "utf-8", "replace")).encode("ascii")
+        need = self.max_len + 1
+        step = max(_INCREMENTAL_STEP, 4 * need)
+        return _prefix_base(_utf8_pieces(data, step), self._stage_fold_bytes, self._stage_collapse_bytes, need, b"-")
+
+    def slugify_bytes(self, data, as_bytes: bool = True) -> Union[bytes, str]:
+        """
+        Slugify buffer UTF-8 (bytes, bytearray, memoryview, mmap) không cần decode trước.
+
+        Kết quả giống self(data.decode("utf-8", "replace")) (hash4/hash8 băm
+        nguyên văn các byte nên chỉ trùng khi data là UTF-8 hợp lệ); trả về
+        bytes ASCII hoặc str nếu as_bytes=False. Không dùng cache (khóa là str).
+        """
+        if isinstance(data, memoryview) and (data.ndim != 1 or data.itemsize != 1):
+            data = data.cast("B")
+        if self.max_len is not None and len(data) > _INCREMENTAL_MIN_LEN:
+            base = self._base_bytes_prefix(data)
+        else:
+            base = self._base_bytes(data) if data else b""
+        if self._suffix is None and self.max_len is None:
+            return base if as_bytes else base.decode("ascii")
+        slug = self._finish(base.decode("ascii"), data)
+        return slug.encode("ascii") if as_bytes else slug
+
+    def _slugify_chunk(self, chunk: List[str]) -> List[str]:
+        """Slugify cả chunk: chuẩn hóa và gộp token chạy một lần trên chuỗi ghép."""
+        chunk = [text or "" for text in chunk]
+        if self.max_len is not None and any(len(text) > _INCREMENTAL_MIN_LEN for text in chunk):
+            # Có bài dài: xử lý từng phần tử để được cắt sớm
+            return [self(text) for text in chunk]
+        joined = _BATCH_SEP.join(chunk)
+        if len(joined) > _BATCH_JOIN_MAX_AVG * len(chunk):
+            return list(map(self, chunk))
+        n_sep = len(chunk) - 1
+        if joined.count(_BATCH_SEP) == n_sep:
+            joined = self._normalize(joined)
+        if joined.count(_BATCH_SEP) != n_sep:
+            # Dữ liệu/char_map đụng ký tự phân cách: xử lý từng phần tử
+            return [self(text) for text in chunk]
+        # Như _collapse_and_clean_tokens: một lượt translate cho cả chunk, rồi
+        # tách theo phân cách và nối token từng phần tử (map chạy trong C)
+        tokens = joined.encode("ascii", "replace").translate(_BATCH_TOKEN_BYTES).decode("ascii")
+        bases = list(map("-".join, map(str.split, tokens.split(_BATCH_SEP))))
+
+        suffix, max_len = self._suffix, self.max_len
+        if suffix is None and max_len is None:
+            return bases
+        out = []
+        for base, text in zip(bases, chunk):
+            if base:
+                if suffix is not None:
+                    base = f"{base}-{suffix(text)}"
+                if max_len is not None:
+                    base = _smart_cut(base, max_len)
+            out.append(base)
+        return out
+
+    def iter_many(
+        self,
+        texts: Iterable[str],
+        chunksize: int = _BATCH_CHUNKSIZE,
+        workers: int = 1,
+    ) -> Iterator[str]:
+        """
+        Slugify lười từng chunk, bộ nhớ không phụ thuộc độ dài đầu vào.
+
+        workers > 1: gửi từng chunk (không phải từng chuỗi) sang process pool,
+        tối đa 2*workers chunk đang xử lý, kết quả giữ đúng thứ tự.
+        Đầu vào chỉ vừa một chunk thì chạy tại chỗ.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize phải >= 1: {chunksize!r}")
+        if workers < 1:
+            raise ValueError(f"workers phải >= 1: {workers!r}")
+        it = iter(texts)
+        chunks = iter(lambda: list(islice(it, chunksize)), [])
+        if workers > 1:
+            head = list(islice(chunks, 2))
+            if len(head) == 2:
+                yield from self._iter_parallel(chain(head, chunks), workers)
+                return
+            chunks = iter(head)
+        for chunk in chunks:
+            if self.cache is not None:
+                yield from map(self, chunk)
+            else:
+                yield from self._slugify_chunk(chunk)
+
+    def _iter_parallel(self, chunks: Iterator[List[str]], workers: int) -> Iterator[str]:
+        config = (self.max_len, self.suffix_mode, self.char_map, self.hash_key, self.transliterate)
+        from concurrent.futures import ProcessPoolExecutor
+        pending: deque = deque()
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(config,)) as pool:
+            try:
+                for chunk in chunks:
+                    pending.append(pool.submit(_slugify_chunk_in_worker, chunk))
+                    if len(pending) >= 2 * workers:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def many(
+        self,
+        texts: Iterable[str],
+        chunksize: int = _BATCH_CHUNKSIZE,
+        workers: int = 1,
+        as_column: bool = False,
+    ) -> Union[List[str], "SlugColumn"]:
+        """Như iter_many nhưng trả về list (as_column=True: SlugColumn gọn bộ nhớ)."""
+        if as_column:
+            from column import SlugColumn
+            return SlugColumn(self.iter_many(texts, chunksize, workers))
+        return list(self.iter_many(texts, chunksize, workers))
+
+# Slugifier của từng process con, dựng một lần trong initializer
+_worker_slugifier: Optional[Slugifier] = None
+
+def _init_worker(config: tuple) -> None:
+    global _worker_slugifier
+    max_len, suffix_mode, char_map, hash_key, transliterate = config
+    _worker_slugifier = Slugifier(
+        max_len=max_len, suffix_mode=suffix_mode, char_map=char_map, hash_key=hash_key,
+        transliterate=transliterate,
+    )
+
+def _slugify_chunk_in_worker(chunk: List[str]) -> List[str]:
+    return _worker_slugifier._slugify_chunk(chunk)
+
+# ---------------------------------------------------------------------------
+# Đo đạc từng stage (tắt mặc định). Khi bật, các method của Slugifier được
+# thay bằng bản có đo thời gian; khi tắt, method gốc được trả lại nên đường
+# nóng không tốn thêm gì. Chỉ đo trong process hiện tại (không gồm workers>1).
+
+_HIST_BUCKETS = 64
+
+def _bucket_dict(hist: List[int]) -> Dict[int, int]:
+    """Histogram lũy thừa 2: {cận trên (bao gồm): số lần}, bỏ bucket rỗng."""
+    return {(1 << i) - 1: c for i, c in enumerate(hist) if c}
+
+class StageStats:
+    """Số lần gọi, tổng thời gian và histogram thời gian/độ dài của một stage."""
+
+    __slots__ = ("calls", "total_ns", "time_hist", "in_len_hist", "out_len_hist")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.time_hist = [0] * _HIST_BUCKETS
+        self.in_len_hist = [0] * _HIST_BUCKETS
+        self.out_len_hist = [0] * _HIST_BUCKETS
+
+    def add(self, ns: int, n_in: int, n_out: int) -> None:
+        self.calls += 1
+        self.total_ns += ns
+        self.time_hist[min(ns.bit_length(), _HIST_BUCKETS - 1)] += 1
+        self.in_len_hist[min(n_in.bit_length(), _HIST_BUCKETS - 1)] += 1
+        self.out_len_hist[min(n_out.bit_length(), _HIST_BUCKETS - 1)] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_s": self.total_ns / 1e9,
+            "mean_us": self.total_ns / self.calls / 1e3 if self.calls else 0.0,
+            "time_ns_hist": _bucket_dict(self.time_hist),
+            "in_len_hist": _bucket_dict(self.in_len_hist),
+            "out_len_hist": _bucket_dict(self.out_len_hist),
+        }
+
+_stage_stats: Dict[str, StageStats] = {}
+_stats_exporter: Optional[Callable[[dict], None]] = None
+_ORIGINAL_METHODS = {
+    name: Slugifier.__dict__[name]
+    for name in (
+        "_stage_normalize", "_stage_collapse", "_stage_fold_bytes", "_stage_collapse_bytes",
+        "_finish", "_slugify_chunk",
+    )
+}
+
+def _record(stage: str, ns: int, n_in: int, n_out: int) -> None:
+    stats = _stage_stats.get(stage)
+    if stats is None:
+        stats = _stage_stats[stage] = StageStats()
+    stats.add(ns, n_in, n_out)
+
+def _timed(stage: str, fn):
+    """Bọc một hook stage: ghi thời gian, độ dài vào/ra mỗi lần gọi."""
+    def timed(*args):
+        t0 = perf_counter_ns()
+        out = fn(*args)
+        _record(stage, perf_counter_ns() - t0, len(args[-1]), len(out))
+        return out
+    return timed
+
+def _finish_instrumented(self: Slugifier, base: str, text: str) -> str:
+    if not base:
         return ""
-    if mode == "random4":
-        return secrets.token_hex(2)  # 4 hex chars
-    if mode == "random6":
-        return secrets.token_hex(3)  # 6 hex chars
-    if mode == "date":
-        return datetime.now().strftime("%Y%m%d")
-    if mode == "datetime":
-        return datetime.now().strftime("%Y%m%d%H%M")
-    return ""
+    slug = base
+    if self._suffix is not None:
+        t0 = perf_counter_ns()
+        suffix = self._suffix(text)
+        _record("suffix", perf_counter_ns() - t0, 0, len(suffix))
+        slug = f"{base}-{suffix}"
+    if self.max_len is not None:
+        t0 = perf_counter_ns()
+        cut = _smart_cut(slug, self.max_len)
+        _record("cut", perf_counter_ns() - t0, len(slug), len(cut))
+        slug = cut
+    return slug
+
+def _slugify_chunk_instrumented(self: Slugifier, chunk: List[str]) -> List[str]:
+    t0 = perf_counter_ns()
+    out = _ORIGINAL_METHODS["_slugify_chunk"](self, chunk)
+    # Chunk được xử lý gộp nên chỉ đo cả chunk; độ dài tính theo số phần tử
+    _record("batch_chunk", perf_counter_ns() - t0, len(chunk), len(out))
+    return out
+
+def enable_stats() -> None:
+    """Bật đo đạc từng stage (normalize, collapse, suffix, cut, batch_chunk)."""
+    # Đường bytes ghi vào cùng stage normalize/collapse với đường str
+    Slugifier._stage_normalize = _timed("normalize", _ORIGINAL_METHODS["_stage_normalize"])
+    Slugifier._stage_fold_bytes = _timed("normalize", _ORIGINAL_METHODS["_stage_fold_bytes"])
+    Slugifier._stage_collapse = staticmethod(_timed("collapse", _collapse_and_clean_tokens))
+    Slugifier._stage_collapse_bytes = staticmethod(_timed("collapse", _collapse_bytes))
+    Slugifier._finish = _finish_instrumented
+    Slugifier._slugify_chunk = _slugify_chunk_instrumented
+
+def disable_stats() -> None:
+    """Tắt đo đạc, trả lại method gốc (số liệu đã thu vẫn giữ)."""
+    for name, method in _ORIGINAL_METHODS.items():
+        setattr(Slugifier, name, method)
+
+def stats_snapshot() -> Dict[str, dict]:
+    """Bản chụp số liệu theo stage."""
+    return {stage: stats.as_dict() for stage, stats in _stage_stats.items()}
+
+def stats_reset() -> None:
+    """Xóa toàn bộ số liệu đã thu."""
+    _stage_stats.clear()
+
+def set_stats_exporter(exporter: Optional[Callable[[dict], None]]) -> None:
+    """Đăng ký hàm nhận snapshot khi gọi export_stats (None để gỡ)."""
+    global _stats_exporter
+    _stats_exporter = exporter
+
+def export_stats(reset: bool = True) -> Dict[str, dict]:
+    """Gửi snapshot cho exporter đã đăng ký (nếu có), mặc định reset sau đó."""
+    snapshot = stats_snapshot()
+    if _stats_exporter is not None:
+        _stats_exporter(snapshot)
+    if reset:
+        stats_reset()
+    return snapshot
+
+# Cache dùng chung cho slugify_tieng_viet/slugify_many, tắt mặc định
+_shared_cache: Optional[SlugCache] = None
+
+@lru_cache(maxsize=64)
+def _get_slugifier(max_len: Optional[int], suffix_mode: str) -> Slugifier:
+    """Instance dùng chung cho slugify_tieng_viet, giữ hành vi dễ dãi cũ."""
+    if max_len is not None and max_len < 0:
+        max_len = None
+    mode = (suffix_mode or "none").lower()
+    if mode not in _SUFFIX_MAKERS:
+        mode = "none"
+    return Slugifier(max_len=max_len, suffix_mode=mode, cache=_shared_cache)
+
+_DEFAULT_SLUGIFIER = _get_slugifier(None, "none")
+
+def _set_shared_cache(cache: Optional[SlugCache]) -> None:
+    global _shared_cache, _DEFAULT_SLUGIFIER
+    _shared_cache = cache
+    _get_slugifier.cache_clear()
+    _DEFAULT_SLUGIFIER = _get_slugifier(None, "none")
+
+def enable_cache(maxsize: int = 4096) -> SlugCache:
+    """Bật cache LRU cho slugify_tieng_viet (thay cache cũ nếu có)."""
+    cache = SlugCache(maxsize)
+    _set_shared_cache(cache)
+    return cache
+
+def disable_cache() -> None:
+    """Tắt cache của slugify_tieng_viet."""
+    _set_shared_cache(None)
+
+def cache_info() -> CacheInfo:
+    """Thống kê cache của slugify_tieng_viet (toàn 0 khi đang tắt)."""
+    if _shared_cache is None:
+        return CacheInfo(0, 0, 0, 0, 0)
+    return _shared_cache.cache_info()
+
+def cache_clear() -> None:
+    """Xóa cache của slugify_tieng_viet và đặt lại bộ đếm."""
+    if _shared_cache is not None:
+        _shared_cache.cache_clear()
 
 def slugify_tieng_viet(
     text: str,
@@ -78,23 +808,83 @@ def slugify_tieng_viet(
     """
     Biến chuỗi tiếng Việt/Unicode thành slug ASCII an toàn.
 
-    suffix_mode: none | random4 | random6 | date | datetime
+    suffix_mode: none | random4 | random6 | date | datetime | hash4 | hash8
     """
-    if not text:
-        return ""
-    ascii_text = _normalize_to_ascii(text)
-    base = _collapse_and_clean_tokens(ascii_text) if ascii_text else ""
-    if not base:
-        return ""
+    if max_len is None and suffix_mode == "none":
+        return _DEFAULT_SLUGIFIER(text)
+    return _get_slugifier(max_len, suffix_mode)(text)
 
-    suffix = _make_suffix(suffix_mode)
-    slug = f"{base}-{suffix}" if suffix else base
+def slugify_bytes(
+    data: Union[bytes, bytearray, memoryview],
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+    as_bytes: bool = True,
+) -> Union[bytes, str]:
+    """
+    Như slugify_tieng_viet nhưng nhận thẳng buffer UTF-8, mặc định trả về bytes.
 
-    if max_len is not None and max_len >= 0:
-        slug = _smart_cut(slug, max_len)
+    Byte UTF-8 không hợp lệ được xử lý như decode(errors="replace").
+    """
+    return _get_slugifier(max_len, suffix_mode).slugify_bytes(data, as_bytes)
 
-    slug = _HYPHEN_RUN.sub("-", slug)
-    slug = _TRIM_HYPHENS.sub("", slug)
-    return slug
+def slugify_many(
+    texts: Iterable[str],
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+    workers: int = 1,
+    chunksize: int = _BATCH_CHUNKSIZE,
+    as_column: bool = False,
+) -> Union[List[str], "SlugColumn"]:
+    """
+    Slugify nhiều chuỗi, trả về list theo đúng thứ tự đầu vào.
+
+    Kết quả giống hệt gọi slugify_tieng_viet cho từng phần tử.
+    workers > 1 chạy song song trên process pool, mỗi lần gửi một chunk.
+    as_column=True trả về SlugColumn (một buffer + offset) thay cho list.
+    """
+    return _get_slugifier(max_len, suffix_mode).many(texts, chunksize, workers, as_column)
+
+def iter_slugify(
+    texts: Iterable[str],
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+    workers: int = 1,
+    chunksize: int = _BATCH_CHUNKSIZE,
+) -> Iterator[str]:
+    """
+    Phiên bản generator của slugify_many, dùng cho đầu vào không giới hạn.
+
+    Kết quả giống hệt gọi slugify_tieng_viet cho từng phần tử.
+    """
+    return _get_slugifier(max_len, suffix_mode).iter_many(texts, chunksize, workers)
+
+__all__ = [
+    "CacheInfo",
+    "SlugCache",
+    "Slugifier",
+    "StageStats",
+    "cache_clear",
+    "cache_info",
+    "disable_cache",
+    "disable_stats",
+    "enable_cache",
+    "enable_stats",
+    "export_stats",
+    "iter_slugify",
+    "set_stats_exporter",
+    "slugify_bytes",
+    "slugify_many",
+    "slugify_tieng_viet",
+    "stats_reset",
+    "stats_snapshot",
+]
 
-__all__ = ["slugify_tieng_viet"]
+if __name__ == "__main__":
+    from cli import main
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+# slugify_async.py
+"""
+API asyncio cho slugify: gom các lời gọi đồng thời thành micro-batch.
+
+    slug = await aslugify("Xin chào")
+    slugs = await aslugify_many(titles, max_len=80)
+"""
+from __future__ import annotations
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from slugify import Slugifier, _get_slugifier
+
+_THREAD_GROUP_CHARS = 1 << 16
+
+class SlugBatcher:
+    """
+    Gom các lời gọi trên cùng một event loop thành batch.
+
+    Batch được xử lý khi đủ max_batch phần tử hoặc sau max_wait giây kể từ
+    phần tử đầu tiên (0: ngay vòng lặp kế tiếp của loop, gom các lời gọi
+    đến trong cùng một vòng). Batch nhỏ (tổng <= inline_chars ký tự) chạy ngay trên
+    loop vì chuyển sang thread còn tốn hơn; batch lớn chạy trên executor
+    (None: executor mặc định của loop).
+    """
+
+    def __init__(
+        self,
+        slugifier: Optional[Slugifier] = None,
+        *,
+        max_batch: int = 256,
+        max_wait: float = 0.0,
+        inline_chars: int = 4096,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError(f"max_batch phải >= 1: {max_batch!r}")
+        if max_wait < 0:
+            raise ValueError(f"max_wait phải >= 0: {max_wait!r}")
+        self.slugifier = slugifier or Slugifier()
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.inline_chars = inline_chars
+        self.executor = executor
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._tasks: set = set()  # giữ tham chiếu để task không bị GC giữa chừng
+
+    async def slugify(self, text: str) -> str:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((text, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            if self.max_wait:
+                self._timer = loop.call_later(self.max_wait, self._flush)
+            else:
+                self._timer = loop.call_soon(self._flush)
+        return await fut
+
+    async def slugify_many(self, texts: Iterable[str]) -> List[str]:
+        """Danh sách đã có sẵn: tự chia batch, không cần chờ gom."""
+        texts = list(texts)
+        out: List[str] = []
+        for i in range(0, len(texts), self.max_batch):
+            out += await self._run(texts[i:i + self.max_batch])
+        return out
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            slugs = await self._run([text for text, _ in batch])
+        except Exception:
+            # Một đầu vào lỗi không được kéo theo cả batch: chạy lại từng phần
+            # tử để mỗi người gọi nhận đúng kết quả/ngoại lệ của mình
+            for text, fut in batch:
+                try:
+                    slug = (await self._run([text]))[0]
+                except Exception as e:
+                    if not fut.done():
+                        fut.set_exception(e)
+                else:
+                    if not fut.done():
+                        fut.set_result(slug)
+            return
+        for (_, fut), slug in zip(batch, slugs):
+            if not fut.done():  # người gọi có thể đã hủy
+                fut.set_result(slug)
+
+    async def _run(self, texts: List[str]) -> List[str]:
+        if sum(len(t) for t in texts if t) <= self.inline_chars:
+            return self.slugifier.many(texts, chunksize=self.max_batch)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._many_in_thread, texts)
+
+    def _many_in_thread(self, texts: List[str]) -> List[str]:
+        # Chia theo tổng số ký tự: mỗi lời gọi C ngắn để GIL sớm trả lại cho loop
+        out: List[str] = []
+        group: List[str] = []
+        size = 0
+        for text in texts:
+            group.append(text)
+            size += len(text) if text else 0
+            if size >= _THREAD_GROUP_CHARS:
+                out += self.slugifier.many(group, chunksize=len(group))
+                group, size = [], 0
+        if group:
+            out += self.slugifier.many(group, chunksize=len(group))
+        return out
+
+# Batcher mặc định theo từng event loop và cấu hình
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, SlugBatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _get_batcher(max_len: Optional[int], suffix_mode: str) -> SlugBatcher:
+    per_loop = _batchers.setdefault(asyncio.get_running_loop(), {})
+    slugifier = _get_slugifier(max_len, suffix_mode)
+    key = (max_len, suffix_mode)
+    batcher = per_loop.get(key)
+    if batcher is None:
+        batcher = per_loop[key] = SlugBatcher(slugifier)
+    else:
+        # enable_cache()/disable_cache() tạo lại các Slugifier dùng chung
+        batcher.slugifier = slugifier
+    return batcher
+
+async def aslugify(
+    text: str,
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+) -> str:
+    """Bản async của slugify_tieng_viet, gom với các lời gọi đồng thời khác."""
+    return await _get_batcher(max_len, suffix_mode).slugify(text)
+
+async def aslugify_many(
+    texts: Iterable[str],
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+) -> List[str]:
+    """Bản async của slugify_many."""
+    return await _get_batcher(max_len, suffix_mode).slugify_many(texts)
+
+__all__ = ["SlugBatcher", "aslugify", "aslugify_many"]
@@ -0,0 +1,393 @@
+# slugindex.py
+"""
+SlugIndex: chỉ mục ngược slug -> khóa nguồn (tiêu đề, id...) và tra tiền tố.
+
+    idx = SlugIndex()
+    idx.slugify("Tiêu đề mới")            # slugify + ghi vào chỉ mục
+    idx.add("tieu-de-moi", "post:42")     # hoặc ghi slug đã có sẵn
+    idx.get("tieu-de-moi")                # ['Tiêu đề mới', 'post:42']
+    idx.prefix("tieu-de", limit=10)       # autocomplete, theo thứ tự slug
+    idx.save("slugs.idx")
+    idx = SlugIndex.load("slugs.idx")     # mmap, không đọc cả file
+
+Phần chính là các mảng đã sắp xếp, gọn bộ nhớ (buffer + offset như
+SlugColumn), tra bằng tìm kiếm nhị phân. Mục mới vào một dict nhỏ (delta),
+được gộp vào mảng khi đủ lớn, khi save() hoặc khi gọi compact().
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import accumulate, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from slugify import Slugifier, _get_slugifier
+
+_MAGIC = b"SLUGIDX\x01"
+_HEADER = struct.Struct("<8sQQQQQ")   # magic, itemsize offset, số slug, số khóa, byte slug, byte khóa
+_HEADER_SIZE = 64                      # đệm để các mảng offset luôn thẳng hàng 8 byte
+_DELTA_MIN = 1 << 16                   # delta được gộp khi vượt max(_DELTA_MIN, số slug / 2)
+_BLOCK = 4096                          # số slug giải mã mỗi lần khi gộp delta
+_STRIDE = 64                           # cứ _STRIDE slug giữ một slug đầu (str) để bisect nhanh
+_OFFSET_MAX_32 = 0xFFFFFFFF
+
+class _SlugView:
+    """Slug thứ i (bytes) của phần đã sắp xếp, đủ cho bisect."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, data, offsets) -> None:
+        self._data, self._offsets = data, offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return bytes(self._data[self._offsets[i]:self._offsets[i + 1]])
+
+class _Builder:
+    """Dựng các mảng mới khi gộp delta: chép nguyên khối đoạn cũ, thêm từng mục mới."""
+
+    __slots__ = ("sdata", "soff", "poff", "kdata", "koff")
+
+    def __init__(self) -> None:
+        self.sdata, self.kdata = bytearray(), bytearray()
+        self.soff, self.poff, self.koff = array("Q", [0]), array("Q", [0]), array("Q", [0])
+
+    def copy(self, idx: "SlugIndex", lo: int, hi: int) -> None:
+        if lo >= hi:
+            return
+        soff, poff, koff = idx._soff, idx._poff, idx._koff
+        shift = len(self.sdata) - soff[lo]
+        self.sdata += idx._sdata[soff[lo]:soff[hi]]
+        self.soff.extend([o + shift for o in soff[lo + 1:hi + 1]])
+        p0, p1 = poff[lo], poff[hi]
+        shift = len(self.koff) - 1 - p0
+        self.poff.extend([o + shift for o in poff[lo + 1:hi + 1]])
+        shift = len(self.kdata) - koff[p0]
+        self.kdata += idx._kdata[koff[p0]:koff[p1]]
+        self.koff.extend([o + shift for o in koff[p0 + 1:p1 + 1]])
+
+    def add(self, slug: str, keys: List[str]) -> None:
+        self.sdata += slug.encode("ascii")
+        self.soff.append(len(self.sdata))
+        kdata, koff = self.kdata, self.koff
+        for key in keys:
+            kdata += key.encode("utf-8")
+            koff.append(len(kdata))
+        self.poff.append(len(koff) - 1)
+
+    def add_many(self, slugs: List[str], delta: Dict[str, List[str]]) -> None:
+        """add() cho cả dãy slug mới: một lần join/encode và cộng dồn offset."""
+        if not slugs:
+            return
+        groups = [delta[s] for s in slugs]
+        keys = [k.encode("utf-8") for g in groups for k in g]
+        for offsets, sizes in ((self.soff, map(len, slugs)), (self.poff, map(len, groups)), (self.koff, map(len, keys))):
+            offsets.extend(islice(accumulate(sizes, initial=offsets[-1]), 1, None))
+        self.sdata += "".join(slugs).encode("ascii")
+        self.kdata += b"".join(keys)
+
+    def arrays(self) -> tuple:
+        soff, poff, koff = self.soff, self.poff, self.koff
+        if max(len(self.sdata), len(self.kdata), len(koff)) <= _OFFSET_MAX_32:
+            soff, poff, koff = array("I", soff), array("I", poff), array("I", koff)
+        return self.sdata, soff, poff, self.kdata, koff
+
+class SlugIndex:
+    """
+    Chỉ mục slug -> danh sách khóa nguồn (theo thứ tự thêm, không trùng).
+
+    Bộ nhớ phần đã gộp ~ tổng độ dài slug + khóa (UTF-8) + 8 byte/slug
+    + 4 byte/khóa (gấp đôi khi buffer > 4 GiB). Tra chính xác và tiền tố
+    O(log n); phần delta là dict thường.
+    """
+
+    __slots__ = (
+        "_slugifier", "_sdata", "_soff", "_poff", "_kdata", "_koff", "_heads",
+        "_delta", "_dorder", "_dsorted", "_dnew", "_mmap",
+    )
+
+    def __init__(self, slugifier: Optional[Slugifier] = None) -> None:
+        self._slugifier = slugifier if slugifier is not None else _get_slugifier(None, "none")
+        self._mmap: Optional[mmap.mmap] = None
+        self._set_base(bytearray(), array("I", [0]), array("I", [0]), bytearray(), array("I", [0]))
+        self._delta: Dict[str, List[str]] = {}
+        self._dorder: List[str] = []   # slug trong delta; sort lười khi tra tiền tố
+        self._dsorted = True
+        self._dnew: Optional[int] = 0  # số slug delta chưa có trong phần đã gộp (None: đếm lại khi cần)
+
+    def _set_base(self, sdata, soff, poff, kdata, koff) -> None:
+        self._sdata, self._soff, self._poff, self._kdata, self._koff = sdata, soff, poff, kdata, koff
+        self._heads: Optional[List[str]] = None
+
+    # -- thêm ------------------------------------------------------------
+
+    def add(self, slug: str, key: str) -> None:
+        """Ghi nhận key sinh ra slug (slug ASCII khác rỗng, key là str)."""
+        if not slug or not slug.isascii():
+            raise ValueError(f"slug phải là chuỗi ASCII khác rỗng: {slug!r}")
+        keys = self._delta.get(slug)
+        if keys is None:
+            keys = self._delta[slug] = []
+            self._dorder.append(slug)
+            self._dsorted = False
+            self._dnew = None
+        if key not in keys:
+            keys.append(key)
+            if len(self._delta) > max(_DELTA_MIN, (len(self._soff) - 1) >> 1):
+                self.compact()
+
+    def update(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """add() cho từng cặp (slug, key)."""
+        for slug, key in pairs:
+            self.add(slug, key)
+
+    def slugify(self, text: str, key: Optional[str] = None) -> str:
+        """Slugify text rồi ghi vào chỉ mục với key (mặc định chính text)."""
+        slug = self._slugifier(text)
+        if slug:
+            self.add(slug, text if key is None else key)
+        return slug
+
+    def slugify_many(self, texts: Iterable[str], keys: Optional[Iterable[str]] = None) -> List[str]:
+        """Như slugify cho cả dãy, đi đường batch của Slugifier."""
+        texts = list(texts)
+        keys = texts if keys is None else list(keys)
+        if len(keys) != len(texts):
+            raise ValueError(f"keys có {len(keys)} phần tử, texts có {len(texts)}")
+        slugs = self._slugifier.many(texts)
+        add = self.add
+        for slug, key in zip(slugs, keys):
+            if slug:
+                add(slug, key)
+        return slugs
+
+    def compact(self) -> None:
+        """Gộp delta vào các mảng đã sắp xếp (giải phóng mmap nếu có)."""
+        if not self._delta:
+            return
+        out = self._merge(sorted(self._delta))
+        self._release()
+        self._set_base(*out.arrays())
+        self._delta, self._dorder, self._dsorted, self._dnew = {}, [], True, 0
+
+    def _merge(self, order: List[str]) -> _Builder:
+        """Trộn phần đã gộp với các slug delta đã sắp xếp (tách hàm để view mmap được giải phóng)."""
+        delta = self._delta
+        sdata, soff = self._sdata, self._soff
+        n = len(soff) - 1
+        out = _Builder()
+        pos = j = 0   # pos: slug cũ đã chép tới; j: slug delta đã xử lý tới
+        for lo in range(0, n, _BLOCK):
+            hi = min(lo + _BLOCK, n)
+            if hi < n:
+                # Block không chứa slug delta nào thì để out.copy chép nguyên khối sau
+                last = str(sdata[soff[hi - 1]:soff[hi]], "ascii")
+                end = bisect_right(order, last, j)
+            else:
+                end = len(order)
+            if j == end:
+                continue
+            base = soff[lo]
+            text = str(sdata[base:soff[hi]], "ascii")
+            offs = soff[lo:hi + 1]
+            block = [text[a - base:b - base] for a, b in zip(offs, islice(offs, 1, None))]
+            for slug in order[j:end]:
+                i = bisect_left(block, slug, pos - lo if pos > lo else 0) + lo
+                out.copy(self, pos, i)
+                keys = delta[slug]
+                if i < hi and block[i - lo] == slug:
+                    old = self._base_keys(i)
+                    seen = set(old)
+                    keys = old + [k for k in keys if k not in seen]
+                    pos = i + 1
+                else:
+                    pos = i
+                out.add(slug, keys)
+            j = end
+        out.copy(self, pos, n)
+        out.add_many(order[j:], delta)   # chỉ còn khi phần đã gộp đang rỗng
+        return out
+
+    # -- tra cứu ---------------------------------------------------------
+
+    def _bisect(self, s: str) -> int:
+        """Vị trí chèn (bisect_left) của s trong phần đã gộp."""
+        heads = self._heads
+        if heads is None:
+            sdata, soff = self._sdata, self._soff
+            heads = self._heads = [
+                str(sdata[soff[i]:soff[i + 1]], "ascii") for i in range(0, len(soff) - 1, _STRIDE)
+            ]
+        # heads thu hẹp về một đoạn _STRIDE slug, rồi mới bisect trên buffer
+        k = bisect_right(heads, s) - 1
+        if k < 0:
+            return 0
+        lo = k * _STRIDE
+        view = _SlugView(self._sdata, self._soff)
+        return bisect_left(view, s.encode("latin-1"), lo, min(lo + _STRIDE, len(view)))
+
+    def _find(self, slug: str) -> int:
+        """Chỉ số của slug trong phần đã gộp, -1 nếu không có."""
+        i = self._bisect(slug)
+        soff = self._soff
+        if i < len(soff) - 1 and self._sdata[soff[i]:soff[i + 1]] == slug.encode("ascii"):
+            return i
+        return -1
+
+    def _base_keys(self, i: int) -> List[str]:
+        kdata, koff = self._kdata, self._koff
+        return [str(kdata[koff[j]:koff[j + 1]], "utf-8") for j in range(self._poff[i], self._poff[i + 1])]
+
+    def get(self, slug: str) -> List[str]:
+        """Các khóa đã sinh ra slug ([] nếu chưa có)."""
+        if not slug.isascii():
+            return []
+        i = self._find(slug)
+        keys = self._base_keys(i) if i >= 0 else []
+        extra = self._delta.get(slug)
+        if extra:
+            seen = set(keys)
+            keys += [k for k in extra if k not in seen]
+        return keys
+
+    def __contains__(self, slug: object) -> bool:
+        return isinstance(slug, str) and slug.isascii() and (slug in self._delta or self._find(slug) >= 0)
+
+    def __len__(self) -> int:
+        """Số slug khác nhau."""
+        if self._dnew is None:
+            self._dnew = sum(1 for slug in self._delta if self._find(slug) < 0)
+        return len(self._soff) - 1 + self._dnew
+
+    def _iter_prefix(self, prefix: str) -> Iterator[str]:
+        # Slug chỉ có byte ASCII nên mọi slug bắt đầu bằng prefix đều < prefix + "\x80"
+        lo, hi = self._bisect(prefix), self._bisect(prefix + "\x80")
+        sdata, soff = self._sdata, self._soff
+        base = (str(sdata[soff[i]:soff[i + 1]], "ascii") for i in range(lo, hi))
+        if not self._delta:
+            return base
+        if not self._dsorted:
+            self._dorder.sort()   # gần như đã sắp xếp: timsort gần tuyến tính
+            self._dsorted = True
+        order = self._dorder
+        delta = islice(order, bisect_left(order, prefix), bisect_left(order, prefix + "\x80"))
+        return _unique(merge(base, delta))
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Các slug bắt đầu bằng prefix, theo thứ tự, tối đa limit slug."""
+        if not prefix.isascii():
+            return []
+        return list(islice(self._iter_prefix(prefix), limit))
+
+    def prefix_items(self, prefix: str, limit: Optional[int] = None) -> List[Tuple[str, List[str]]]:
+        """Như prefix nhưng kèm danh sách khóa của từng slug."""
+        return [(slug, self.get(slug)) for slug in self.prefix(prefix, limit)]
+
+    def __iter__(self) -> Iterator[str]:
+        return self._iter_prefix("")
+
+    @property
+    def nbytes(self) -> int:
+        """Kích thước phần đã gộp (buffer + offset), không tính delta."""
+        return (len(self._sdata) + len(self._kdata)
+                + sum(len(a) * a.itemsize for a in (self._soff, self._poff, self._koff)))
+
+    def __repr__(self) -> str:
+        return f"SlugIndex(len={len(self)}, nbytes={self.nbytes}, delta={len(self._delta)})"
+
+    # -- lưu / nạp -------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        """compact() rồi ghi ra path (ghi file tạm rồi thay thế nguyên tử)."""
+        self.compact()
+        arrays = [self._soff, self._poff, self._koff]
+        itemsize = arrays[0].itemsize
+        if sys.byteorder != "little":
+            arrays = [array(a.format if isinstance(a, memoryview) else a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+        header = _HEADER.pack(_MAGIC, itemsize, len(self._soff) - 1, len(self._koff) - 1,
+                              len(self._sdata), len(self._kdata))
+        tmp = f"{path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for a in arrays:
+                f.write(memoryview(a).cast("B"))
+            f.write(self._sdata)
+            f.write(self._kdata)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, slugifier: Optional[Slugifier] = None) -> "SlugIndex":
+        """
+        Mở chỉ mục đã save() bằng mmap (chỉ đọc): không đọc/parse cả file,
+        trang dữ liệu được nạp khi tra tới. Thêm mục mới vẫn được (vào delta).
+        """
+        idx = cls(slugifier)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER_SIZE:
+                raise ValueError(f"{path!r} không phải file SlugIndex")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, itemsize, n, m, sbytes, kbytes = _HEADER.unpack_from(mm)
+            if magic != _MAGIC or itemsize not in (4, 8):
+                raise ValueError(f"{path!r} không phải file SlugIndex")
+            code = "I" if itemsize == 4 else "Q"
+            pos = _HEADER_SIZE
+            views = []
+            for count, size in ((n + 1, itemsize), (n + 1, itemsize), (m + 1, itemsize), (sbytes, 1), (kbytes, 1)):
+                views.append(memoryview(mm)[pos:pos + count * size])
+                pos += count * size
+            if pos > len(mm):
+                raise ValueError(f"{path!r} bị cắt cụt")
+        except Exception:
+            mm.close()
+            raise
+        soff, poff, koff, sdata, kdata = views
+        if sys.byteorder == "little":
+            soff, poff, koff = soff.cast(code), poff.cast(code), koff.cast(code)
+        else:
+            soff, poff, koff = (array(code, bytes(v)) for v in (soff, poff, koff))
+            for a in (soff, poff, koff):
+                a.byteswap()
+        idx._mmap = mm
+        idx._set_base(sdata, soff, poff, kdata, koff)
+        return idx
+
+    def _release(self) -> None:
+        if self._mmap is None:
+            return
+        for buf in (self._sdata, self._soff, self._poff, self._kdata, self._koff):
+            if isinstance(buf, memoryview):
+                buf.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def close(self) -> None:
+        """Đóng mmap (nếu có); chỉ mục trở thành rỗng trừ phần delta."""
+        if self._mmap is not None:
+            self._release()
+            self._set_base(bytearray(), array("I", [0]), array("I", [0]), bytearray(), array("I", [0]))
+            self._dnew = None
+
+    def __enter__(self) -> "SlugIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def _unique(sorted_slugs: Iterable[str]) -> Iterator[str]:
+    """Bỏ phần tử trùng liền kề (slug có cả ở phần đã gộp lẫn delta)."""
+    last = None
+    for slug in sorted_slugs:
+        if slug != last:
+            yield slug
+            last = slug
+
+__all__ = ["SlugIndex"]
@@ -0,0 +1,76 @@
+# tests/test_app.py
+import pytest
+
+pytest.importorskip("tkinter")
+
+import app
+from slugify import Slugifier, slugify_many
+
+TITLES = ["Xin chào", "Hà Nội", "", "Sài Gòn 2025"] * 50
+
+def _run(path, chunksize=16, slugifier=None):
+    job = app.BulkJob(str(path), slugifier or Slugifier(), chunksize).start()
+    job.join(10)
+    return job
+
+def test_read_titles_text_and_csv(tmp_path):
+    txt = tmp_path / "a.txt"
+    txt.write_text("Xin chào\r\nHà Nội\n\nCuối", encoding="utf-8")
+    assert app._read_titles(str(txt)) == ["Xin chào", "Hà Nội", "", "Cuối"]
+
+    with_header = tmp_path / "b.csv"
+    with_header.write_text("id,title\n1,Xin chào\n2,\"Hà Nội, mùa thu\"\n3\n", encoding="utf-8")
+    assert app._read_titles(str(with_header)) == ["Xin chào", "Hà Nội, mùa thu", ""]
+
+    no_header = tmp_path / "c.csv"
+    no_header.write_text("﻿Xin chào,1\nHà Nội,2\n", encoding="utf-8")
+    assert app._read_titles(str(no_header)) == ["Xin chào", "Hà Nội"]
+
+def test_bulk_job_matches_slugify_many(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES), encoding="utf-8")
+    job = _run(path, slugifier=Slugifier(max_len=5))
+    assert job.state == "done" and job.finished
+    assert job.total == job.done == len(TITLES)
+    assert job.slugs == slugify_many(TITLES, max_len=5)
+    assert job.row(1) == ("Hà Nội", "ha")
+
+def test_bulk_job_cancel_keeps_done_rows(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES), encoding="utf-8")
+
+    class CancelAfterFirst(Slugifier):
+        def many(self, texts, *args, **kwargs):
+            job.cancel()  # hủy ngay sau chunk đầu tiên
+            return super().many(texts, *args, **kwargs)
+
+    job = app.BulkJob(str(path), CancelAfterFirst(), 16)
+    job.start().join(10)
+    assert job.state == "cancelled"
+    assert job.done == 16 and job.total == len(TITLES)
+    assert job.slugs == slugify_many(TITLES[:16])
+
+def test_bulk_job_reports_errors(tmp_path):
+    job = _run(tmp_path / "missing.txt")
+    assert job.state == "error" and isinstance(job.error, OSError)
+
+def test_submit_during_background_preview_reruns():
+    tk = app.tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("không có display")
+    try:
+        gui = app.SlugifyApp(root)
+        gui.in_var.set("Xin chào " * 300)  # dài hơn _INLINE_CHARS: chạy trên thread nền
+        gui.suffix_mode_var.set("random4")
+        gui._start_preview()
+        first = gui._preview_future
+        gui.on_submit()                      # bấm Submit khi job còn chạy
+        assert gui._preview_again and gui._preview_force
+        first.result(10)
+        gui._poll_preview()                  # job xong: Submit chạy lại dù khóa không đổi
+        assert gui._preview_future is not None and gui._preview_future is not first
+        gui._preview_future.result(10)
+    finally:
+        root.destroy()
@@ -0,0 +1,53 @@
+# tests/test_async.py
+import asyncio
+import pytest
+from slugify import Slugifier, slugify_tieng_viet
+from slugify_async import SlugBatcher, aslugify, aslugify_many
+from test_core import cases
+
+def test_aslugify_matches_sync():
+    async def main():
+        return await asyncio.gather(*(aslugify(src) for src, _ in cases))
+    assert asyncio.run(main()) == [expected for _, expected in cases]
+
+def test_concurrent_calls_are_batched():
+    calls = []
+
+    class CountingSlugifier(Slugifier):
+        __slots__ = ()
+        def many(self, texts, chunksize=1024, workers=1):
+            calls.append(len(texts))
+            return super().many(texts, chunksize, workers)
+
+    async def main():
+        batcher = SlugBatcher(CountingSlugifier(max_len=5), max_batch=64, max_wait=0.01)
+        return await asyncio.gather(*(batcher.slugify(f"hello world {i}") for i in range(100)))
+
+    assert asyncio.run(main()) == ["hello"] * 100
+    assert calls == [64, 36]
+
+def test_large_batch_runs_on_executor():
+    texts = ["Đường đua F1 " * 50] * 20
+
+    async def main():
+        batcher = SlugBatcher(max_batch=8, inline_chars=0)
+        return await batcher.slugify_many(texts)
+
+    assert asyncio.run(main()) == [slugify_tieng_viet(t) for t in texts]
+
+def test_bad_input_fails_only_its_caller():
+    async def main():
+        return await asyncio.gather(
+            aslugify("Xin chào"), aslugify(5), aslugify("Hà Nội"), return_exceptions=True)
+    ok, bad, ok2 = asyncio.run(main())
+    assert (ok, ok2) == ("xin-chao", "ha-noi")
+    assert isinstance(bad, TypeError)
+
+def test_aslugify_many_with_options():
+    async def main():
+        return await aslugify_many(["di-cho-nhanh", "hello-world"], max_len=10)
+    assert asyncio.run(main()) == ["di-cho", "hello"]
+
+def test_invalid_batcher_config():
+    with pytest.raises(ValueError):
+        SlugBatcher(max_batch=0)
@@ -0,0 +1,61 @@
+# tests/test_batch.py
+import re
+import pytest
+from slugify import Slugifier, iter_slugify, slugify_many, slugify_tieng_viet
+from test_core import cases
+
+SOURCES = [src for src, _ in cases] + [None, "a\x00b", "Sài Gòn\x00Hà Nội"]
+
+def test_many_matches_scalar():
+    assert slugify_many(SOURCES) == [slugify_tieng_viet(s) for s in SOURCES]
+
+@pytest.mark.parametrize("max_len", [0, 1, 5, 12, 80])
+def test_many_matches_scalar_with_max_len(max_len):
+    expected = [slugify_tieng_viet(s, max_len=max_len) for s in SOURCES]
+    assert slugify_many(SOURCES, max_len=max_len) == expected
+
+def test_iter_is_lazy_and_ordered():
+    def gen():
+        for i in range(5000):
+            yield f"Tiêu đề số {i}"
+    it = iter_slugify(gen())
+    assert next(it) == "tieu-de-so-0"
+    rest = list(it)
+    assert len(rest) == 4999
+    assert rest[-1] == "tieu-de-so-4999"
+
+def test_small_chunks():
+    s = Slugifier()
+    assert list(s.iter_many(SOURCES, chunksize=3)) == [s(x) for x in SOURCES]
+    with pytest.raises(ValueError):
+        list(s.iter_many(SOURCES, chunksize=0))
+
+def test_many_with_suffix():
+    out = slugify_many(["abc", "", "🔥"], suffix_mode="random4")
+    assert re.fullmatch(r"abc-[0-9a-f]{4}", out[0])
+    assert out[1:] == ["", ""]
+
+def test_chunk_tokens_around_separator():
+    # Phần tử chỉ có dấu câu/khoảng trắng hai đầu: '-' không được dính sang phần tử bên cạnh
+    texts = ["", "  !!", "-a-", "b ", " c", "...", "Đ—đ", "x" * 600, "UPPER lower"]
+    s = Slugifier()
+    assert s.many(texts) == [s(x) for x in texts]
+    assert s.many(["x" * 600] * 3) == ["x" * 600] * 3  # chuỗi dài: gọi lẻ
+
+def test_char_map_separator_fallback():
+    s = Slugifier(char_map={"x": "\x00"})
+    assert s.many(["axb", "cd"]) == [s("axb"), s("cd")]
+
+def test_parallel_matches_serial():
+    data = [f"Bài viết số {i}: Đường đua – F1!" for i in range(500)] + SOURCES
+    assert slugify_many(data, workers=2, chunksize=64) == slugify_many(data)
+
+def test_parallel_char_map_reaches_workers():
+    s = Slugifier(char_map={"₫": "dong"})
+    data = [f"{i}₫" for i in range(50)]
+    assert s.many(data, chunksize=10, workers=2) == [f"{i}dong" for i in range(50)]
+
+def test_parallel_short_input_and_invalid_workers():
+    assert slugify_many(["Xin chào"], workers=4) == ["xin-chao"]
+    with pytest.raises(ValueError):
+        slugify_many(["abc"], workers=0)
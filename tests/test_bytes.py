@@ -0,0 +1,56 @@
+# tests/test_bytes.py
+import pytest
+from slugify import Slugifier, slugify_bytes, slugify_tieng_viet
+from test_core import cases
+
+@pytest.mark.parametrize("src, expected", cases)
+def test_bytes_matches_str(src, expected):
+    data = src.encode("utf-8")
+    assert slugify_bytes(data) == expected.encode("ascii")
+    assert slugify_bytes(bytearray(data), as_bytes=False) == expected
+    assert slugify_bytes(memoryview(data)) == expected.encode("ascii")
+
+def test_invalid_utf8_like_replace():
+    data = b"caf\xc3\xa9 \xff\xfe b\x80ad \xe1\xba"
+    assert slugify_bytes(data, as_bytes=False) == slugify_tieng_viet(data.decode("utf-8", "replace"))
+
+def test_memoryview_slice_no_copy():
+    buf = bytearray(b"xx Tieu de mau xx")
+    view = memoryview(buf)[3:14]
+    assert slugify_bytes(view) == b"tieu-de-mau"
+
+def test_non_byte_memoryview():
+    data = "Đường phố!".encode("utf-8").ljust(16)
+    assert slugify_bytes(memoryview(data).cast("H")) == b"duong-pho"
+
+@pytest.mark.parametrize("kwargs", [
+    {"max_len": 10},
+    {"max_len": 30, "suffix_mode": "hash8"},
+    {"suffix_mode": "hash4"},
+    {"char_map": {"&": "and", "ß": "ss"}},
+])
+def test_slugifier_bytes_matches_call(kwargs):
+    s = Slugifier(**kwargs)
+    for src in ["Tôi & bạn — Straße số 1", "Ăn 🍜 phở bò tái", ""]:
+        assert s.slugify_bytes(src.encode("utf-8"), as_bytes=False) == s(src)
+
+def test_long_input_early_cut():
+    src = ("Đây là một đoạn văn rất dài " * 500).encode("utf-8")
+    s = Slugifier(max_len=40)
+    assert s.slugify_bytes(src, as_bytes=False) == s(src.decode("utf-8"))
+
+@pytest.mark.parametrize("src", [
+    "!! " * 200_000 + "abc def",                   # toàn dấu câu: đọc tới cuối
+    "ạb" * 3000,                                   # token dài vắt qua biên đoạn, ký tự 3 byte
+    "!! " * 2000 + "Sài Gòn " * 5 + "!! " * 2000,
+])
+def test_long_input_early_cut_is_linear(monkeypatch, src):
+    # Mỗi byte chỉ được gộp token một lần (trước đây gộp lại cả buffer đã đọc mỗi đoạn)
+    seen = []
+    collapse = Slugifier._stage_collapse_bytes
+    monkeypatch.setattr(Slugifier, "_stage_collapse_bytes", staticmethod(lambda b: seen.append(len(b)) or collapse(b)))
+    s = Slugifier(max_len=80)
+    data = src.encode("utf-8")
+    assert s.slugify_bytes(data, as_bytes=False) == s(src)
+    assert s.slugify_bytes(memoryview(data), as_bytes=False) == s(src)
+    assert sum(seen) <= 2 * len(data) + 16 * len(seen)
@@ -0,0 +1,51 @@
+# tests/test_cache.py
+import re
+import pytest
+import slugify
+from slugify import SlugCache, Slugifier, slugify_tieng_viet
+
+@pytest.fixture
+def shared_cache():
+    cache = slugify.enable_cache(maxsize=2)
+    yield cache
+    slugify.disable_cache()
+
+def test_hits_misses_evictions():
+    s = Slugifier(cache=SlugCache(maxsize=2))
+    assert s("Xin chào") == "xin-chao"
+    assert s("Xin chào") == "xin-chao"
+    s("Sài Gòn")
+    s("Hà Nội")  # đẩy "Xin chào" ra
+    info = s.cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+
+def test_lru_order():
+    s = Slugifier(cache=SlugCache(maxsize=2))
+    s("a")
+    s("b")
+    s("a")  # "a" mới dùng, "b" bị đẩy ra
+    s("c")
+    hits = s.cache.hits
+    s("a")
+    assert s.cache.hits == hits + 1
+
+def test_key_includes_max_len(shared_cache):
+    assert slugify_tieng_viet("hello-world") == "hello-world"
+    assert slugify_tieng_viet("hello-world", max_len=10) == "hello"
+    assert slugify.cache_info().misses == 2
+
+def test_random_suffix_fresh_each_call(shared_cache):
+    outs = {slugify_tieng_viet("Một bài viết", suffix_mode="random6") for _ in range(20)}
+    assert len(outs) > 1
+    assert all(re.fullmatch(r"mot-bai-viet-[0-9a-f]{6}", o) for o in outs)
+    assert slugify.cache_info().hits == 19
+
+def test_cache_clear(shared_cache):
+    slugify_tieng_viet("abc")
+    slugify.cache_clear()
+    assert slugify.cache_info() == (0, 0, 0, 2, 0)
+
+def test_disabled_by_default():
+    assert slugify.cache_info().maxsize == 0
+    with pytest.raises(ValueError):
+        SlugCache(0)
@@ -0,0 +1,56 @@
+# tests/test_cli.py
+import json
+import pytest
+from cli import main
+
+def run(capfd, argv):
+    assert main(argv) == 0
+    out, err = capfd.readouterr()
+    return out, err
+
+def test_text_lines(tmp_path, capfd):
+    src = tmp_path / "titles.txt"
+    src.write_text("Tôi Thấy Hoa Vàng\n\nĐường đua F1 2025\r\n", encoding="utf-8")
+    out, err = run(capfd, [str(src)])
+    assert out == "toi-thay-hoa-vang\n\nduong-dua-f1-2025\n"
+    assert "dòng/s" in err
+
+def test_csv_column_by_name(tmp_path, capfd):
+    src = tmp_path / "a.csv"
+    src.write_text('id,title\n1,"Sài Gòn, Hà Nội"\n2,Đặc sản\n', encoding="utf-8")
+    out, _ = run(capfd, ["-f", "csv", "--column", "title", "-q", str(src), str(src)])
+    lines = out.splitlines()
+    assert lines[0] == "id,title,slug"
+    assert lines[1] == '1,"Sài Gòn, Hà Nội",sai-gon-ha-noi'
+    assert len(lines) == 5  # header chỉ ghi một lần
+
+def test_csv_no_header_index(tmp_path, capfd):
+    src = tmp_path / "a.csv"
+    src.write_text("x,Xin chào\n", encoding="utf-8")
+    out, _ = run(capfd, ["-f", "csv", "--no-header", "--column", "1", "-q", str(src)])
+    assert out == "x,Xin chào,xin-chao\n"
+
+def test_jsonl_field(tmp_path, capfd):
+    src = tmp_path / "a.jsonl"
+    src.write_text('{"name": "Hà Nội"}\n{"id": 2}\n', encoding="utf-8")
+    out, _ = run(capfd, ["-f", "jsonl", "--field", "name", "--max-len", "2", "-q", str(src)])
+    rows = [json.loads(line) for line in out.splitlines()]
+    assert rows == [{"name": "Hà Nội", "slug": "ha"}, {"id": 2, "slug": ""}]
+
+def test_mmap_path(tmp_path, capfd, monkeypatch):
+    import cli
+    monkeypatch.setattr(cli, "_MMAP_THRESHOLD", 0)
+    src = tmp_path / "titles.txt"
+    src.write_text("Cờ VN\nCafé\n", encoding="utf-8")
+    out, _ = run(capfd, ["-q", str(src)])
+    assert out == "co-vn\ncafe\n"
+
+def test_invalid_workers():
+    with pytest.raises(SystemExit):
+        main(["-j", "0"])
+
+def test_translit_option(tmp_path, capfd):
+    src = tmp_path / "titles.txt"
+    src.write_text("Русский текст\nXin chào\n", encoding="utf-8")
+    out, _ = run(capfd, ["--translit", "cyrillic", "-q", str(src)])
+    assert out == "russkiy-tekst\nxin-chao\n"
@@ -0,0 +1,74 @@
+# tests/test_column.py
+import io
+import pytest
+from column import SlugColumn
+from slugify import Slugifier, slugify_many
+
+SLUGS = ["xin-chao", "", "ha-noi", "xin-chao", "a", "sai-gon", "ha-noi"]
+
+@pytest.fixture(params=[False, True], ids=["plain", "interned"])
+def col(request):
+    return SlugColumn(SLUGS, intern=request.param)
+
+def test_len_getitem_iter(col):
+    assert len(col) == len(SLUGS)
+    assert list(col) == SLUGS
+    assert [col[i] for i in range(-len(SLUGS), len(SLUGS))] == SLUGS + SLUGS
+    assert col.get_bytes(2) == b"ha-noi"
+    with pytest.raises(IndexError):
+        col[len(SLUGS)]
+
+@pytest.mark.parametrize("s", [slice(None), slice(1, 4), slice(4, 1), slice(-3, None), slice(None, None, 2), slice(None, None, -1)])
+def test_slicing(col, s):
+    part = col[s]
+    assert isinstance(part, SlugColumn)
+    assert list(part) == SLUGS[s]
+    assert part == SLUGS[s]
+
+def test_equality(col):
+    assert col == SLUGS
+    assert col == SlugColumn(SLUGS)
+    assert col == SlugColumn(SLUGS, intern=True)
+    assert col != SLUGS[:-1]
+    assert col != SlugColumn(SLUGS[::-1])
+    assert col != "xin-chao"
+
+def test_write_to(col):
+    f = io.BytesIO()
+    n = col.write_to(f)
+    assert f.getvalue() == "".join(s + "\n" for s in SLUGS).encode()
+    assert n == len(f.getvalue())
+    assert col.tobytes(b",") == ",".join(SLUGS).encode() + b","
+
+def test_write_raw_buffer():
+    col = SlugColumn(SLUGS)
+    assert col.tobytes(b"") == "".join(SLUGS).encode()
+    assert bytes(col.buffer) == "".join(SLUGS).encode()
+
+def test_intern_stores_once():
+    col = SlugColumn(SLUGS * 100, intern=True)
+    assert col.interned and col.nunique == len(set(SLUGS))
+    assert len(col.buffer) == sum(map(len, set(SLUGS)))
+    assert col.nbytes < SlugColumn(SLUGS * 100).nbytes
+    assert SlugColumn(SLUGS).intern() == SLUGS
+
+def test_append_extend_blocks():
+    col = SlugColumn()
+    items = [f"slug-{i}" for i in range(10_000)]
+    col.extend(items[:5000])
+    for s in items[5000:]:
+        col.append(s)
+    assert col == items
+    assert col[4999:5001] == ["slug-4999", "slug-5000"]
+
+def test_rejects_non_ascii():
+    with pytest.raises(ValueError):
+        SlugColumn(["tiếng-việt"])
+
+def test_batch_api_as_column():
+    texts = ["Xin chào", "", None, "Hà Nội", "Xin chào"] * 300
+    col = slugify_many(texts, as_column=True)
+    assert isinstance(col, SlugColumn)
+    assert col == slugify_many(texts)
+    s = Slugifier(max_len=5)
+    assert s.many(texts, as_column=True) == s.many(texts)
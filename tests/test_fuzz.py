@@ -0,0 +1,32 @@
+# tests/test_fuzz.py
+import pytest
+import slugify
+from benchmarks import fuzz
+from benchmarks.reference import slugify_reference
+from test_core import cases
+
+@pytest.mark.parametrize("src, expected", [c for c in cases if c[0] is not None])
+def test_reference_matches_cases(src, expected):
+    assert slugify_reference(src) == expected
+
+def test_no_differences():
+    done, checks, failures = fuzz.run(300, seed=0)
+    assert done == 300 and checks > done
+    assert failures == []
+
+def test_minimize():
+    assert fuzz.minimize("xxxxBADxxxx", lambda t: "B" in t) == "B"
+    assert fuzz.minimize("Đường phố", lambda t: "ờ" in t and "p" in t) == "ờp"
+
+def test_catches_and_minimizes_injected_bug(monkeypatch):
+    # _smart_cut ngây thơ: cắt cứng, không lùi về biên '-'
+    monkeypatch.setattr(slugify, "_smart_cut", lambda slug, max_len: slug[:max_len].strip("-"))
+    fuzz._slugifier.cache_clear()
+    try:
+        _, _, failures = fuzz.run(200, seed=3, max_failures=1)
+        assert failures
+        m = fuzz.minimize_failure(failures[0])
+        assert len(m.text) <= len(failures[0].text)
+        assert m.got != m.expected
+    finally:
+        fuzz._slugifier.cache_clear()
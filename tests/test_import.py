@@ -0,0 +1,45 @@
+# tests/test_import.py
+import os
+import subprocess
+import sys
+import pytest
+import slugify
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Không được import trên đường mặc định (suffix_mode="none")
+LAZY = ["re", "typing", "datetime", "secrets", "hashlib", "concurrent.futures", "threading", "translit"]
+
+def _modules_after(code):
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules, sep='\\n')"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return set(out.split())
+
+def test_default_path_stays_lean():
+    mods = _modules_after(
+        "import slugify\n"
+        "assert slugify.slugify_tieng_viet('Xin chào Hà Nội', max_len=8) == 'xin-chao'\n"
+        "assert slugify.slugify_tieng_viet('Đường—phố 🚀') == 'duong-pho'"
+    )
+    assert "_fold_table" in mods
+    assert [m for m in LAZY if m in mods] == []
+
+@pytest.mark.parametrize("mode, module", [
+    ("hash4", "hashlib"), ("random4", "secrets"), ("date", "datetime"),
+])
+def test_suffix_modes_import_on_first_use(mode, module):
+    mods = _modules_after(
+        "import slugify, sys\n"
+        f"assert {module!r} not in sys.modules\n"
+        f"assert slugify.slugify_tieng_viet('Xin chào', suffix_mode={mode!r}).startswith('xin-chao-')"
+    )
+    assert module in mods
+
+def test_lazy_regex_and_hash_match_eager():
+    import hashlib
+    assert slugify._hash_suffix(4, "Xin chào") == hashlib.blake2b(
+        "Xin chào".encode(), digest_size=4, key=slugify._HASH_KEY).hexdigest()
+    assert slugify.slugify_bytes("Xin chào, Hà Nội".encode()) == b"xin-chao-ha-noi"
+    assert slugify.slugify_many(["Xin chào", "Hà Nội"]) == ["xin-chao", "ha-noi"]
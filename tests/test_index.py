@@ -0,0 +1,101 @@
+# tests/test_index.py
+import random
+import pytest
+import slugindex
+from slugify import Slugifier, slugify_tieng_viet
+from slugindex import SlugIndex
+
+TITLES = ["Xin chào", "xin chào!", "Hà Nội", "Hà Nội mùa thu", "Sài Gòn", "Huế", "hà-nội"]
+
+def _reference(pairs):
+    ref = {}
+    for slug, key in pairs:
+        keys = ref.setdefault(slug, [])
+        if key not in keys:
+            keys.append(key)
+    return ref
+
+def _check(idx, ref):
+    assert len(idx) == len(ref)
+    assert list(idx) == sorted(ref)
+    for slug, keys in ref.items():
+        assert slug in idx
+        assert idx.get(slug) == keys
+    for p in ["", "h", "ha-noi", "ha-noi-", "x", "zz", "a-", "b"]:
+        expected = sorted(s for s in ref if s.startswith(p))
+        assert idx.prefix(p) == expected
+        assert idx.prefix(p, limit=2) == expected[:2]
+
+def test_slugify_records_keys():
+    idx = SlugIndex()
+    slugs = [idx.slugify(t) for t in TITLES]
+    assert slugs == [slugify_tieng_viet(t) for t in TITLES]
+    assert idx.get("xin-chao") == ["Xin chào", "xin chào!"]
+    assert idx.get("ha-noi") == ["Hà Nội", "hà-nội"]
+    assert idx.prefix("ha-noi") == ["ha-noi", "ha-noi-mua-thu"]
+    assert idx.prefix_items("hu") == [("hue", ["Huế"])]
+    assert idx.get("khong-co") == [] and "khong-co" not in idx
+    assert idx.get("hà") == [] and idx.prefix("hà") == []
+
+def test_slugify_many_keys_and_custom_slugifier():
+    idx = SlugIndex(Slugifier(max_len=6))
+    slugs = idx.slugify_many(TITLES + ["!!!"], keys=[f"post:{i}" for i in range(len(TITLES) + 1)])
+    assert slugs[-1] == ""
+    assert idx.get("ha-noi") == ["post:2", "post:3", "post:6"]
+    with pytest.raises(ValueError):
+        idx.slugify_many(TITLES, keys=["a"])
+
+@pytest.mark.parametrize("slug", ["", "hà-nội"])
+def test_add_rejects_bad_slug(slug):
+    with pytest.raises(ValueError):
+        SlugIndex().add(slug, "k")
+
+def test_incremental_matches_dict(monkeypatch):
+    # Delta nhỏ để gộp nhiều lần giữa các lần thêm/tra
+    monkeypatch.setattr(slugindex, "_DELTA_MIN", 16)
+    monkeypatch.setattr(slugindex, "_BLOCK", 8)
+    monkeypatch.setattr(slugindex, "_STRIDE", 4)
+    rnd = random.Random(0)
+    words = ["a", "b", "ha", "noi", "x", "a-b", "z9"]
+    idx, pairs = SlugIndex(), []
+    for step in range(1500):
+        pair = ("-".join(rnd.choice(words) for _ in range(rnd.randint(1, 3))), f"k{rnd.randint(0, 99)}")
+        idx.add(*pair)
+        pairs.append(pair)
+        if step % 150 == 0:
+            _check(idx, _reference(pairs))
+    idx.compact()
+    _check(idx, _reference(pairs))
+
+def test_save_load_mmap(tmp_path):
+    path = str(tmp_path / "slugs.idx")
+    idx = SlugIndex()
+    idx.slugify_many(TITLES)
+    idx.add("ha-noi", "đặc biệt 🚀")
+    ref = {s: idx.get(s) for s in idx}
+    idx.save(path)
+
+    with SlugIndex.load(path) as loaded:
+        _check(loaded, ref)
+        # Thêm sau khi nạp: vào delta, gộp lại khi save
+        loaded.add("ha-noi", "mới")
+        loaded.add("da-nang", "Đà Nẵng")
+        ref["ha-noi"] = ref["ha-noi"] + ["mới"]
+        ref["da-nang"] = ["Đà Nẵng"]
+        _check(loaded, ref)
+        loaded.save(path)
+    with SlugIndex.load(path) as again:
+        _check(again, ref)
+    assert len(again) == 0
+
+def test_empty_index_roundtrip(tmp_path):
+    path = str(tmp_path / "empty.idx")
+    SlugIndex().save(path)
+    with SlugIndex.load(path) as idx:
+        assert len(idx) == 0 and idx.prefix("") == [] and idx.get("a") == []
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.idx"
+    path.write_bytes(b"not an index" * 10)
+    with pytest.raises(ValueError):
+        SlugIndex.load(str(path))
@@ -48,3 +48,12 @@ def test_idempotent(src):
     once = slugify_tieng_viet(src)
     twice = slugify_tieng_viet(once)
     assert once == twice
+
+@pytest.mark.parametrize("max_len", [0, 1, 2, 3, 5, 8, 13, 200])
+def test_max_len_invariants(max_len):
+    src = "--Tôi__Thấy  Hoa—Vàng...Trên Cỏ Xanh!!!--"
+    out = slugify_tieng_viet(src, max_len=max_len)
+    assert len(out) <= max_len
+    assert "--" not in out
+    assert out == out.strip("-")
+    assert slugify_tieng_viet(src).startswith(out)
@@ -1,6 +1,6 @@
 # tests/test_maxlen.py
 import pytest
-from slugify import slugify_tieng_viet
+from slugify import Slugifier, _smart_cut, slugify_many, slugify_tieng_viet
 
 @pytest.mark.parametrize(
     "src,max_len,acceptable",
@@ -27,3 +27,42 @@ def test_max_len_behavior(src, max_len, acceptable):
     out = slugify_tieng_viet(src, max_len=max_len)
     assert out in acceptable
     assert not out.endswith("-")
+
+@pytest.mark.parametrize("max_len", [0, 1, 7, 80, 1500])
+@pytest.mark.parametrize("suffix_mode", ["none", "date"])
+def test_long_input_early_cut_matches_full(max_len, suffix_mode):
+    # Dài hơn ngưỡng cắt sớm; token và dấu NFD nằm vắt qua ranh giới đoạn
+    src = ("Đường đua F1 – Sài Gòn " + "ống🔥" * 7 + " ") * 400
+    full = _smart_cut(slugify_tieng_viet(src), max_len)  # base dài hơn max_len: suffix bị cắt bỏ
+    assert slugify_tieng_viet(src, max_len=max_len, suffix_mode=suffix_mode) == full
+    assert slugify_many(["abc", src], max_len=max_len)[1] == full
+
+@pytest.mark.parametrize("pad", [1022, 1023, 1024, 4095])
+def test_long_input_early_cut_nfd_translit(pad):
+    # "И" + dấu breve (NFD của "Й") vắt qua biên đoạn: phải gộp trước khi chuyển tự
+    src = " " * pad + "\u0418\u0306" + " b" * 5000
+    s = Slugifier(transliterate="cyrillic", max_len=80)
+    full = _smart_cut(Slugifier(transliterate="cyrillic")(src), 80)
+    assert full.startswith("y-b")
+    assert s(src) == full
+    assert s.slugify_bytes(src.encode(), as_bytes=False) == full
+    assert s.many(["abc", src])[1] == full
+
+def test_long_separator_input_is_linear(monkeypatch):
+    # Gần như toàn dấu câu: base không bao giờ đủ max_len nên đọc tới cuối;
+    # mỗi ký tự chỉ được gộp token một lần (trước đây gộp lại cả phần đã đọc mỗi đoạn)
+    src = "!! " * 200_000 + "abc def"
+    seen = []
+    collapse = Slugifier._stage_collapse
+    monkeypatch.setattr(Slugifier, "_stage_collapse", staticmethod(lambda s: seen.append(len(s)) or collapse(s)))
+    assert Slugifier(max_len=80)(src) == "abc-def"
+    assert sum(seen) <= len(src) + 16 * len(seen)
+
+@pytest.mark.parametrize("src", [
+    "ab" * 3000,                                   # một token dài vắt qua nhiều đoạn
+    ("x" * 1023 + " ") * 6,                        # token kết thúc đúng biên đoạn
+    "!! " * 2000 + "Sài Gòn " * 5 + "!! " * 2000,  # token thưa
+])
+@pytest.mark.parametrize("max_len", [3, 80, 1500])
+def test_early_cut_tokens_across_slices(src, max_len):
+    assert slugify_tieng_viet(src, max_len=max_len) == _smart_cut(slugify_tieng_viet(src), max_len)
@@ -0,0 +1,43 @@
+# tests/test_normalize.py
+import re
+import unicodedata as ud
+from pathlib import Path
+import pytest
+import slugify
+from slugify import _normalize_to_ascii, _normalize_slow, _FOLD_TABLE, _collapse_and_clean_tokens
+
+def test_fold_table_matches_slow_path():
+    for cp in _FOLD_TABLE:
+        ch = chr(cp)
+        assert _normalize_to_ascii(ch) == _normalize_slow(ch)
+
+@pytest.mark.parametrize("src", [
+    "Tôi Thấy Hoa Vàng Trên Cỏ Xanh",
+    "Tối ươm mơ",
+    "ĐẶC SẢN – đặc biệt—nhất",
+    "Łódź naïve façade",
+    "中文 Русский 🇻🇳",
+    "Å Ω ﬁ ½",
+], ids=["vietnamese", "nfd_mixed", "dashes", "latin_ext", "non_latin", "compat"])
+def test_fast_path_matches_slow_path(src):
+    for form in ("NFC", "NFD"):
+        s = ud.normalize(form, src)
+        assert _normalize_to_ascii(s) == _normalize_slow(s)
+
+def test_ascii_input_returned_as_is():
+    s = "Hello-World 2025!"
+    assert _normalize_to_ascii(s) is s
+
+def test_pregenerated_fold_table_is_current(tmp_path):
+    # Hỏng ở đây: chạy `make fold-table` sau khi đổi _FOLD_RANGES/_normalize_slow
+    assert _FOLD_TABLE == slugify._build_fold_table()
+    import _fold_table
+    if _fold_table.UNIDATA_VERSION != ud.unidata_version:
+        pytest.skip("Python khác phiên bản Unicode: bảng được dựng lại lúc import")
+    path = tmp_path / "_fold_table.py"
+    slugify._write_fold_table(str(path))
+    assert path.read_text(encoding="utf-8") == Path(_fold_table.__file__).read_text(encoding="utf-8")
+
+@pytest.mark.parametrize("s", ["Hello--World__2025", "  a  b  ", "-x-", "ÀBc-dé", "a\x00b\x1fc", "UPPER lower 09", ""])
+def test_collapse_matches_regex_tokens(s):
+    assert _collapse_and_clean_tokens(s) == "-".join(re.findall(r"[A-Za-z0-9]+", s)).lower()
@@ -0,0 +1,97 @@
+# tests/test_registry.py
+import re
+import pytest
+from registry import SqliteSlugRegistry, UniqueSlugAllocator
+
+def test_counter_sequence():
+    alloc = UniqueSlugAllocator()
+    assert [alloc.allocate("Xin chào") for _ in range(3)] == ["xin-chao", "xin-chao-2", "xin-chao-3"]
+    assert len(alloc) == 3
+    assert "xin-chao-2" in alloc
+
+def test_counter_skips_existing():
+    alloc = UniqueSlugAllocator(existing=["abc", "abc-2", "abc-7"])
+    assert alloc.allocate("ABC") == "abc-8"
+
+def test_counter_probes_past_natural_slug():
+    alloc = UniqueSlugAllocator()
+    assert alloc.allocate("abc 2") == "abc-2"
+    assert alloc.allocate("abc") == "abc"
+    assert alloc.allocate("abc") == "abc-3"
+
+@pytest.mark.parametrize("max_len", [5, 8, 11])
+def test_suffix_survives_max_len(max_len):
+    alloc = UniqueSlugAllocator(max_len=max_len)
+    slugs = [alloc.allocate("hello-world") for _ in range(12)]
+    assert len(set(slugs)) == 12
+    assert all(len(s) <= max_len for s in slugs)
+    assert slugs[-1].endswith("-12")
+    assert all("--" not in s and s == s.strip("-") for s in slugs)
+
+@pytest.mark.parametrize("mode, max_len", [("counter", 2), ("random4", 5), ("random6", 7)])
+def test_max_len_too_small_for_suffix(mode, max_len, tmp_path):
+    # Slug phải còn base: không cấp suffix trơ trọi
+    with pytest.raises(ValueError):
+        UniqueSlugAllocator(mode=mode, max_len=max_len)
+    with pytest.raises(ValueError):
+        SqliteSlugRegistry(str(tmp_path / "r.db"), mode=mode, max_len=max_len)
+
+def test_counter_outgrows_max_len(tmp_path):
+    alloc = UniqueSlugAllocator(max_len=3)
+    assert [alloc.allocate("Xin chào") for _ in range(9)] == ["xin"] + [f"x-{n}" for n in range(2, 10)]
+    with pytest.raises(ValueError):
+        alloc.allocate("Xin chào")
+    assert len(alloc) == 9
+    with SqliteSlugRegistry(str(tmp_path / "r.db"), max_len=3) as reg:
+        assert reg.reserve_many(["Xin chào"] * 9)[-1] == "x-9"
+        with pytest.raises(ValueError):
+            reg.reserve("Xin chào")
+        assert len(reg) == 9
+
+def test_random_mode_unique():
+    alloc = UniqueSlugAllocator(mode="random4", max_len=12)
+    slugs = [alloc.allocate("Một bài viết") for _ in range(300)]
+    assert len(set(slugs)) == 300
+    assert all(re.fullmatch(r"mot-bai-[0-9a-f]{4}|mot-bai-viet", s) for s in slugs)
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        UniqueSlugAllocator(mode="random5")
+    with pytest.raises(ValueError):
+        UniqueSlugAllocator().allocate("🔥🔥")
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "slugs.db")
+
+def test_sqlite_counter_persists(db_path):
+    with SqliteSlugRegistry(db_path) as reg:
+        assert reg.reserve("Xin chào") == "xin-chao"
+        assert reg.reserve("Xin chào") == "xin-chao-2"
+    with SqliteSlugRegistry(db_path) as reg:
+        assert reg.reserve("Xin chào") == "xin-chao-3"
+        assert len(reg) == 3
+        assert "xin-chao-2" in reg
+
+def test_sqlite_same_rules_as_allocator(db_path):
+    titles = ["hello-world", "abc 2", "abc", "abc", "hello-world", "Hello World!"] * 3
+    alloc = UniqueSlugAllocator(max_len=8, existing=["abc-7"])
+    with SqliteSlugRegistry(db_path, max_len=8) as reg:
+        reg.seed(["abc-7"])
+        assert reg.reserve_many(titles) == [alloc.allocate(t) for t in titles]
+
+def test_sqlite_batch_is_atomic(db_path):
+    with SqliteSlugRegistry(db_path) as reg:
+        with pytest.raises(ValueError):
+            reg.reserve_many(["abc", "🔥"])
+        assert len(reg) == 0
+
+def test_sqlite_random_mode(db_path):
+    with SqliteSlugRegistry(db_path, mode="random6", max_len=20) as reg:
+        slugs = reg.reserve_many(["Một bài viết"] * 200)
+    assert len(set(slugs)) == 200
+    assert all(re.fullmatch(r"mot-bai-viet-[0-9a-f]{6}", s) for s in slugs)
+
+def test_sqlite_wal_mode(db_path):
+    with SqliteSlugRegistry(db_path) as reg:
+        assert reg._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -0,0 +1,67 @@
+# tests/test_server.py
+import http.client
+import json
+import threading
+import pytest
+from server import MAX_BATCH, SlugHTTPServer
+
+@pytest.fixture(scope="module")
+def conn():
+    httpd = SlugHTTPServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    c = http.client.HTTPConnection(*httpd.server_address[:2], timeout=10)
+    yield c
+    c.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+def request(conn, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if data else {}
+    conn.request(method, path, body=data, headers=headers)
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+def test_get_single(conn):
+    status, obj = request(conn, "GET", "/slugify?text=Xin%20ch%C3%A0o&max_len=3")
+    assert (status, obj) == (200, {"slug": "xin"})
+
+def test_post_single_and_batch_keepalive(conn):
+    assert request(conn, "POST", "/slugify", {"text": "Đường đua F1"}) == (200, {"slug": "duong-dua-f1"})
+    status, obj = request(conn, "POST", "/batch", {"texts": ["Sài Gòn", "Hà Nội", ""], "max_len": 3})
+    assert (status, obj) == (200, {"slugs": ["sai", "ha", ""]})
+
+@pytest.mark.parametrize("body", [
+    {"texts": "abc"},
+    {"texts": ["abc"], "suffix_mode": "random5"},
+    {"texts": ["abc"], "max_len": -1},
+    {"texts": ["abc"], "max_len": True},
+    {"texts": ["abc"], "max_len": 2.9},
+], ids=["not_list", "bad_mode", "negative_max_len", "bool_max_len", "float_max_len"])
+def test_batch_bad_request(conn, body):
+    status, obj = request(conn, "POST", "/batch", body)
+    assert status == 400 and "error" in obj
+
+@pytest.mark.parametrize("path", ["/batch", "/khong-co"])
+@pytest.mark.parametrize("length", ["-1", "abc"])
+def test_bad_content_length(conn, path, length):
+    # Kết nối riêng: server đóng kết nối sau lỗi vì không biết body dài bao nhiêu
+    c = http.client.HTTPConnection(conn.host, conn.port, timeout=5)
+    c.putrequest("POST", path)
+    c.putheader("Content-Length", length)
+    c.endheaders()
+    resp = c.getresponse()
+    assert resp.status == 400 and "error" in json.loads(resp.read())
+    c.close()
+
+def test_batch_too_large(conn):
+    status, _ = request(conn, "POST", "/batch", {"texts": ["a"] * (MAX_BATCH + 1)})
+    assert status == 413
+
+def test_stats(conn):
+    request(conn, "GET", "/slugify?text=abc")
+    status, obj = request(conn, "GET", "/stats")
+    assert status == 200
+    assert obj["requests"] >= 1
+    assert set(obj["latency_ms"]) == {"p50", "p90", "p99"}
@@ -0,0 +1,48 @@
+# tests/test_slugifier.py
+import re
+import pytest
+from slugify import Slugifier, slugify_tieng_viet
+
+@pytest.mark.parametrize("src,max_len", [
+    ("Tôi Thấy Hoa Vàng Trên Cỏ Xanh", None),
+    ("  Đầy---ký—tự🤯  cực khó!!!   ŁắM liền – 12₫ @@   ", None),
+    ("di-cho-nhanh", 5),
+    ("hello-world", 10),
+    ("---", 2),
+], ids=["vietnamese", "hard_input", "cut_hyphen", "cut_word", "only_separators"])
+def test_matches_function(src, max_len):
+    s = Slugifier(max_len=max_len)
+    assert s(src) == slugify_tieng_viet(src, max_len=max_len)
+
+def test_suffix_mode_frozen_and_case_insensitive():
+    s = Slugifier(suffix_mode="RANDOM4", max_len=10)
+    assert s.suffix_mode == "random4"
+    assert re.fullmatch(r"abcde-[0-9a-f]{4}", s("abcde"))
+
+@pytest.mark.parametrize("kwargs", [
+    {"max_len": -1},
+    {"max_len": "10"},
+    {"suffix_mode": "random5"},
+    {"char_map": {"ab": "x"}},
+    {"char_map": {"₫": "đồng"}},
+], ids=["negative_max_len", "str_max_len", "bad_mode", "bad_key", "non_ascii_value"])
+def test_invalid_config_raises(kwargs):
+    with pytest.raises(ValueError):
+        Slugifier(**kwargs)
+
+def test_char_map():
+    s = Slugifier(char_map={"₫": "dong", "&": "va"})
+    assert s("12₫ & 5₫") == "12dong-va-5dong"
+    assert slugify_tieng_viet("12₫ & 5₫") == "12-5"
+
+def test_char_map_matches_nfd_input():
+    import unicodedata as ud
+    s = Slugifier(char_map={"ư": "uw", "ơ": "ow"})
+    nfd = ud.normalize("NFD", "Thương")
+    assert s("Thương") == s(nfd) == "thuwowng"
+    assert s.many(["Thương", nfd]) == ["thuwowng"] * 2
+    assert s.slugify_bytes(nfd.encode(), as_bytes=False) == "thuwowng"
+
+def test_function_keeps_lenient_options():
+    assert slugify_tieng_viet("abc", suffix_mode="unknown") == "abc"
+    assert slugify_tieng_viet("abc-def", max_len=-1) == "abc-def"
@@ -0,0 +1,57 @@
+# tests/test_stats.py
+import pytest
+import slugify
+from slugify import Slugifier, slugify_many, slugify_tieng_viet
+
+@pytest.fixture
+def stats():
+    slugify.stats_reset()
+    slugify.enable_stats()
+    yield
+    slugify.disable_stats()
+    slugify.stats_reset()
+    slugify.set_stats_exporter(None)
+
+def test_stage_counts_and_lengths(stats):
+    assert slugify_tieng_viet("Xin chào", max_len=4, suffix_mode="random4") == "xin"
+    snap = slugify.stats_snapshot()
+    assert set(snap) == {"normalize", "collapse", "suffix", "cut"}
+    assert all(s["calls"] == 1 for s in snap.values())
+    assert snap["normalize"]["in_len_hist"] == {15: 1}   # len 8 -> bucket <= 15
+    assert snap["cut"]["out_len_hist"] == {3: 1}         # "xin"
+    assert snap["suffix"]["out_len_hist"] == {7: 1}      # 4 hex
+
+@pytest.mark.parametrize("src", ["Xin chào " * 1000, "Xin chào " * 10, "Thương " * 1000])
+def test_long_and_bytes_inputs_recorded(stats, src):
+    # Cắt sớm (đầu vào dài + max_len) và đường bytes cũng phải ghi normalize/collapse
+    for s in (Slugifier(max_len=80), Slugifier(max_len=80, char_map={"ư": "uw"})):
+        slugify.stats_reset()
+        slug = s(src)
+        assert s.slugify_bytes(src.encode(), as_bytes=False) == slug
+        snap = slugify.stats_snapshot()
+        assert {"normalize", "collapse", "cut"} <= set(snap)
+        assert snap["normalize"]["calls"] == snap["collapse"]["calls"] == 2
+
+def test_batch_chunk_recorded(stats):
+    slugify_many(["a", "b", "c"], chunksize=2)
+    assert slugify.stats_snapshot()["batch_chunk"]["calls"] == 2
+
+def test_disable_restores_original_methods(stats):
+    slugify.disable_stats()
+    for name, method in slugify._ORIGINAL_METHODS.items():
+        assert Slugifier.__dict__[name] is method
+    slugify_tieng_viet("abc")
+    assert slugify.stats_snapshot() == {}
+
+def test_exporter_and_reset(stats):
+    seen = []
+    slugify.set_stats_exporter(seen.append)
+    slugify_tieng_viet("abc")
+    snap = slugify.export_stats()
+    assert seen == [snap]
+    assert snap["normalize"]["calls"] == 1
+    assert slugify.stats_snapshot() == {}
+
+def test_output_unchanged_when_enabled(stats):
+    src = "  Đầy---ký—tự🤯  cực khó!!!   ŁắM liền – 12₫ @@   "
+    assert slugify_tieng_viet(src) == "day-ky-tu-cuc-kho-am-lien-12"
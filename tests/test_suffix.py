@@ -1,7 +1,9 @@
 # tests/test_suffix.py
 import re
+import time
 import pytest
-from slugify import slugify_tieng_viet
+import slugify
+from slugify import Slugifier, _CachedTimestamp, slugify_many, slugify_tieng_viet
 
 def test_suffix_none_default_same_as_base():
     base = slugify_tieng_viet("Mot bai viet")
@@ -49,3 +51,37 @@ def test_suffix_empty_input_returns_empty():
 
 def test_suffix_emoji_only_is_empty_even_with_suffix():
     assert slugify_tieng_viet("🤯🤯", suffix_mode="random4") == ""
+
+@pytest.mark.parametrize("mode,n", [("hash4", 4), ("hash8", 8)])
+def test_suffix_hash_deterministic(mode, n):
+    out = slugify_tieng_viet("Một bài viết", suffix_mode=mode)
+    assert re.fullmatch(rf"mot-bai-viet-[0-9a-f]{{{n}}}", out)
+    assert slugify_tieng_viet("Một bài viết", suffix_mode=mode) == out
+    assert slugify_tieng_viet("Một bài viết!", suffix_mode=mode) != out
+    assert slugify_many(["Một bài viết"] * 3, suffix_mode=mode) == [out] * 3
+
+def test_suffix_hash_key():
+    a = Slugifier(suffix_mode="hash8", hash_key=b"k1")("abc")
+    b = Slugifier(suffix_mode="hash8", hash_key=b"k2")("abc")
+    assert a != b and a.startswith("abc-")
+    with pytest.raises(ValueError):
+        Slugifier(suffix_mode="hash8", hash_key="k1")
+
+def test_suffix_date_cached_until_next_day():
+    maker = _CachedTimestamp("%Y%m%d", per_minute=False)
+    first = maker()
+    assert maker._valid_until > time.time()
+    maker._value = "cached"
+    assert maker() == "cached"
+    maker._valid_until = 0.0
+    assert maker() == first
+
+def test_suffix_random_not_shared_across_workers():
+    slugify_tieng_viet("abc", suffix_mode="random6")  # nạp bộ đệm trước khi fork
+    # Lượt lấy kế tiếp của process cha; process con dùng lại bộ đệm cha thì sẽ ra đúng chuỗi này
+    parent_next = slugify._entropy._hex[slugify._entropy._pos:][:6]
+    outs = slugify_many(["abc"] * 400, suffix_mode="random6", workers=2, chunksize=50)
+    firsts = [out[len("abc-"):] for out in outs[::50]]  # suffix đầu tiên của mỗi chunk
+    assert parent_next not in firsts
+    # Các worker không cùng một dãy: 8 suffix đầu chunk trùng nhau là gần như không thể
+    assert len(set(firsts)) == len(firsts)
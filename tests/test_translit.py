@@ -0,0 +1,71 @@
+# tests/test_translit.py
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from slugify import Slugifier, slugify_tieng_viet
+from test_core import cases
+import translit
+
+@pytest.mark.parametrize("src, expected", [
+    ("Русский текст", "russkiy-tekst"),
+    ("Ελληνικά νέα", "ellinika-nea"),
+    ("Łódź, Straße, Ærø", "lodz-strasse-aero"),
+    ("中文 标题", "zhong-wen-biao-ti"),
+    ("ひらがな", "hiragana"),
+    ("한국어", "han-gug-eo"),
+])
+def test_scripts(src, expected):
+    assert Slugifier(transliterate=True)(src) == expected
+
+def test_default_output_unchanged():
+    assert slugify_tieng_viet("Русский текст") == ""
+    assert slugify_tieng_viet("Łódź") == "odz"
+    s = Slugifier(transliterate=True)
+    for src, expected in cases:
+        if src and all(ord(ch) < 0x370 or 0x1E00 <= ord(ch) < 0x1F00 for ch in src) and "Ł" not in src:
+            assert s(src) == expected
+
+def test_only_selected_scripts():
+    s = Slugifier(transliterate="cyrillic")
+    assert s.transliterate == ("cyrillic",)
+    assert s("Привет 中文 Łódź") == "privet-odz"
+
+def test_nfd_input_composed_first():
+    s = Slugifier(transliterate=True)
+    assert s("й") == s("й") == "y"
+
+def test_char_map_wins():
+    s = Slugifier(transliterate=True, char_map={"Ж": "J", "Ł": "W"})
+    assert s("Жук Łódź") == "juk-wodz"
+
+def test_batch_bytes_and_workers_match():
+    s = Slugifier(transliterate=True, max_len=12)
+    texts = ["Русский текст", "中文", "Việt Nam", ""] * 600
+    expected = [s(t) for t in texts]
+    assert s.many(texts) == expected
+    assert s.many(texts, workers=2) == expected
+    assert [s.slugify_bytes(t.encode(), as_bytes=False) for t in texts[:4]] == expected[:4]
+
+def test_unknown_script():
+    with pytest.raises(ValueError):
+        Slugifier(transliterate=("klingon",))
+
+def test_register_script():
+    translit.register_script("test_runic", [(0x16A0, 0x1700)], lambda: {0x16A0: "f", 0x16A2: "u"})
+    try:
+        assert Slugifier(transliterate="test_runic")("ᚠᚢ") == "fu"
+    finally:
+        translit._SCRIPTS.pop("test_runic")
+
+def test_tables_load_lazily():
+    code = (
+        "import sys, slugify\n"
+        "assert 'translit' not in sys.modules\n"
+        "s = slugify.Slugifier(transliterate=True)\n"
+        "s('Tiếng Việt')\n"
+        "assert not any(m.startswith('translit.') for m in sys.modules)\n"
+        "s('Привет')\n"
+        "assert 'translit.cyrillic' in sys.modules and 'translit.cjk' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
@@ -0,0 +1,76 @@
+# tests/test_vectorized.py
+import math
+import re
+import pytest
+from slugify import slugify_tieng_viet
+from test_core import cases
+from vectorized import slugify_array
+
+TEXTS = [src for src, _ in cases if isinstance(src, str)]
+
+def test_list_matches_scalar():
+    assert slugify_array(TEXTS, max_len=20) == [slugify_tieng_viet(t, max_len=20) for t in TEXTS]
+
+def test_nulls_pass_through():
+    nan = float("nan")
+    out = slugify_array(["Xin chào", None, "", nan, 3])
+    assert out[:3] == ["xin-chao", None, ""]
+    assert math.isnan(out[3]) and out[4] == 3
+
+def test_numpy_shapes_and_dtypes():
+    np = pytest.importorskip("numpy")
+    obj = np.array([["Xin chào", None], ["", "Hà Nội"]], dtype=object)
+    out = slugify_array(obj)
+    assert out.shape == (2, 2) and out.dtype == object
+    assert out.tolist() == [["xin-chao", None], ["", "ha-noi"]]
+
+    uni = np.array(TEXTS)
+    assert slugify_array(uni).tolist() == [slugify_tieng_viet(t) for t in TEXTS]
+    assert slugify_array(uni.reshape(-1, 1)).shape == (len(TEXTS), 1)
+
+    raw = np.array(["Đà Lạt".encode("utf-8"), b""])
+    assert slugify_array(raw).tolist() == [b"da-lat", b""]
+
+def test_arrow_keeps_nulls_and_type():
+    pa = pytest.importorskip("pyarrow")
+    arr = pa.chunked_array([["Hà Nội", None], [""]], type=pa.large_string())
+    out = slugify_array(arr)
+    assert out.type == pa.large_string()
+    assert out.to_pylist() == ["ha-noi", None, ""]
+
+def test_pandas_series_keeps_index():
+    pd = pytest.importorskip("pandas")
+    s = pd.Series(["Hà Nội", None, "Ăn phở"], index=[5, 6, 7], name="title", dtype=object)
+    out = slugify_array(s, max_len=3)
+    assert list(out.index) == [5, 6, 7] and out.name == "title"
+    assert out.tolist() == ["ha", None, "an"]
+
+def test_pandas_category_remaps_codes():
+    pd = pytest.importorskip("pandas")
+    s = pd.Series(["Hà Nội", None, "ha noi", "Sài Gòn", "Hà Nội"], index=list("abcde"), dtype="category")
+    out = slugify_array(s)
+    assert out.dtype.name == "category" and list(out.index) == list("abcde")
+    assert list(out.cat.categories) == ["ha-noi", "sai-gon"]  # "Hà Nội" và "ha noi" gộp làm một
+    assert out.tolist()[:1] + out.tolist()[2:] == ["ha-noi", "ha-noi", "sai-gon", "ha-noi"]
+    assert out.isna().tolist() == [False, True, False, False, False]
+
+def test_pandas_category_random_suffix_per_row():
+    pd = pytest.importorskip("pandas")
+    s = pd.Series(["Hà Nội"] * 50 + [None], dtype="category")
+    out = slugify_array(s, suffix_mode="random6")
+    slugs = out.tolist()
+    assert all(re.fullmatch(r"ha-noi-[0-9a-f]{6}", x) for x in slugs[:-1])
+    assert len(set(slugs[:-1])) > 1      # mỗi dòng một suffix, như .apply(slugify_tieng_viet)
+    assert out.isna().tolist()[-1]
+    hashed = slugify_array(s, suffix_mode="hash4")  # suffix tất định: vẫn đi đường category
+    assert hashed.dtype.name == "category" and hashed.nunique() == 1
+
+@pytest.mark.parametrize("dtype", ["string", "str"])
+def test_pandas_string_dtype_kept(dtype):
+    pd = pytest.importorskip("pandas")
+    try:
+        s = pd.Series(["Hà Nội", None], dtype=dtype)
+    except TypeError:
+        pytest.skip(f"pandas này chưa có dtype {dtype!r}")
+    out = slugify_array(s)
+    assert out.dtype == s.dtype and out.tolist()[0] == "ha-noi"
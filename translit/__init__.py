@@ -0,0 +1,167 @@
+# translit/__init__.py
+"""
+Bảng chuyển tự (transliteration) cho chữ không phải Latin, dùng tùy chọn:
+
+    Slugifier(transliterate=True)                    # mọi script có sẵn
+    Slugifier(transliterate=("cyrillic", "greek"))   # chọn script
+
+Mỗi script khai báo các dải mã và một hàm nạp; dữ liệu chỉ được nạp khi
+ký tự đầu tiên của script xuất hiện. Ký tự đã có kết quả ASCII khác rỗng
+trong bảng gập mặc định (chữ Việt...) luôn giữ nguyên kết quả đó.
+
+Dữ liệu có sẵn (latin, greek, cyrillic, cjk) sinh bởi translit/_build.py
+từ anyascii (ISC License, xem translit/ANYASCII_LICENSE).
+"""
+from __future__ import annotations
+from importlib import import_module
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+Ranges = Tuple[Tuple[int, int], ...]
+
+_MEMO_LIMIT = 1 << 18   # số ký tự tối đa nhớ trong một bảng (ngoài dữ liệu script)
+
+class CompactTable:
+    """
+    Bảng chuyển tự dạng gọn: mỗi code point trong các dải là một ký tự của
+    CODES, ord(ký tự) - CODE_BASE là chỉ số vào VALUES (0: không có).
+    Tra O(1), không dựng dict cho cả script.
+    """
+
+    __slots__ = ("_ranges", "_codes", "_values", "_base")
+
+    def __init__(self, ranges: Ranges, codes: str, values: Sequence[str], code_base: int) -> None:
+        self._ranges = []
+        pos = 0
+        for lo, hi in ranges:
+            self._ranges.append((lo, hi, pos))
+            pos += hi - lo
+        if pos != len(codes):
+            raise ValueError(f"CODES dài {len(codes)}, các dải cần {pos}")
+        self._codes = codes
+        self._values = values
+        self._base = code_base
+
+    def get(self, cp: int, default: Optional[str] = None) -> Optional[str]:
+        for lo, hi, pos in self._ranges:
+            if lo <= cp < hi:
+                idx = ord(self._codes[pos + cp - lo]) - self._base
+                return self._values[idx] if idx else default
+        return default
+
+class HangulTable:
+    """Âm tiết Hangul (U+AC00..U+D7A3) ghép phiên âm từ jamo, còn lại tra bảng inner."""
+
+    __slots__ = ("_inner", "_initials", "_vowels", "_finals")
+
+    def __init__(self, inner: Mapping[int, str], initials: Sequence[str], vowels: Sequence[str], finals: Sequence[str]) -> None:
+        self._inner = inner
+        self._initials, self._vowels, self._finals = initials, vowels, finals
+
+    def get(self, cp: int, default: Optional[str] = None) -> Optional[str]:
+        i = cp - 0xAC00
+        if 0 <= i < 11172:
+            # Mỗi âm tiết là một token riêng, như chữ Hán
+            return f" {self._initials[i // 588]}{self._vowels[i % 588 // 28]}{self._finals[i % 28]} "
+        return self._inner.get(cp, default)
+
+def _load_builtin(name: str) -> Callable[[], Mapping[int, str]]:
+    def load() -> Mapping[int, str]:
+        mod = import_module(f"translit.{name}")
+        table = CompactTable(mod.RANGES, mod.CODES, mod.VALUES, mod.CODE_BASE)
+        jamo = getattr(mod, "HANGUL_JAMO", None)
+        return HangulTable(table, *jamo) if jamo else table
+    return load
+
+# name -> (dải mã, hàm nạp bảng {code point: chuỗi ASCII})
+_SCRIPTS: Dict[str, Tuple[Ranges, Callable[[], Mapping[int, str]]]] = {}
+_loaded: Dict[str, Mapping[int, str]] = {}
+
+def register_script(name: str, ranges: Iterable[Tuple[int, int]], loader: Callable[[], Mapping[int, str]]) -> None:
+    """
+    Đăng ký (hoặc thay) một script: ranges là các dải [lo, hi) code point,
+    loader() trả về mapping code point -> chuỗi ASCII, chỉ gọi khi cần lần đầu.
+    Chỉ ảnh hưởng các Slugifier tạo sau đó.
+    """
+    ranges = tuple((int(lo), int(hi)) for lo, hi in ranges)
+    if not ranges or any(lo >= hi for lo, hi in ranges):
+        raise ValueError(f"Dải mã không hợp lệ cho script {name!r}: {ranges!r}")
+    _SCRIPTS[name] = (ranges, loader)
+    _loaded.pop(name, None)
+
+def available_scripts() -> List[str]:
+    return sorted(_SCRIPTS)
+
+def _script_table(name: str) -> Mapping[int, str]:
+    table = _loaded.get(name)
+    if table is None:
+        table = _loaded[name] = _SCRIPTS[name][1]()
+    return table
+
+def resolve_scripts(scripts) -> Tuple[str, ...]:
+    """True -> mọi script đã đăng ký; tên/dãy tên -> tuple đã kiểm tra; rỗng -> ()."""
+    if scripts is True:
+        return tuple(available_scripts())
+    if not scripts:
+        return ()
+    if isinstance(scripts, str):
+        scripts = (scripts,)
+    out = tuple(dict.fromkeys(s.lower() for s in scripts))
+    unknown = [s for s in out if s not in _SCRIPTS]
+    if unknown:
+        raise ValueError(f"Script chuyển tự không hỗ trợ: {unknown!r} (có: {available_scripts()!r})")
+    return out
+
+class TranslitTable(dict):
+    """
+    Bảng cho str.translate: bảng gập gốc + chuyển tự theo script.
+
+    Ký tự chưa có trong dict rơi vào __missing__: tra bảng của script chứa
+    nó (nạp lười) hoặc fallback(ch), rồi nhớ lại nên lần sau là tra dict O(1).
+    Mục gốc rỗng ("" = bị bỏ) nằm trong dải của script được gỡ để script
+    có cơ hội chuyển tự (trừ các khóa trong keep, vd: char_map).
+    """
+
+    def __init__(
+        self,
+        base: Mapping[int, str],
+        scripts: Sequence[str],
+        fallback: Callable[[str], str],
+        keep: Iterable[int] = (),
+    ) -> None:
+        super().__init__(base)
+        spans = sorted((lo, hi, name) for name in scripts for lo, hi in _SCRIPTS[name][0])
+        keep = set(keep)
+        for cp in [cp for cp, v in self.items() if v == "" and cp not in keep]:
+            if any(lo <= cp < hi for lo, hi, _ in spans):
+                del self[cp]
+        # Như bảng gập mặc định: ASCII ánh xạ về chính nó, không rơi vào __missing__
+        for cp in range(0x80):
+            self.setdefault(cp, chr(cp))
+        self._spans = spans
+        self._fallback = fallback
+
+    def __missing__(self, cp: int) -> str:
+        value = None
+        # Mỗi ký tự chỉ vào đây một lần nên dò tuyến tính vài dải là đủ
+        for lo, hi, name in self._spans:
+            if lo <= cp < hi:
+                value = _script_table(name).get(cp)
+                if value is not None:
+                    break
+        if value is None:
+            if len(self) >= _MEMO_LIMIT:
+                raise LookupError(cp)  # giữ nguyên ký tự, đường chậm xử lý sau
+            value = self._fallback(chr(cp))
+        self[cp] = value
+        return value
+
+for _name, _ranges in (
+    ("latin", ((0x00C0, 0x0250), (0x1E00, 0x1F00))),
+    ("greek", ((0x0370, 0x0400), (0x1F00, 0x2000))),
+    ("cyrillic", ((0x0400, 0x0530),)),
+    ("cjk", ((0x3040, 0x3100), (0x3400, 0x4DC0), (0x4E00, 0xA000), (0xAC00, 0xD7A4))),
+):
+    register_script(_name, _ranges, _load_builtin(_name))
+del _name, _ranges
+
+__all__ = ["CompactTable", "TranslitTable", "available_scripts", "register_script"]
@@ -0,0 +1,79 @@
+# translit/_build.py
+"""
+Sinh các module dữ liệu translit/<script>.py từ anyascii (chỉ cần khi cập nhật dữ liệu).
+
+Chạy: pip install anyascii && python -m translit._build
+"""
+from __future__ import annotations
+import os
+import unicodedata as ud
+
+from anyascii import anyascii
+
+from slugify import _FOLD_TABLE
+from translit import _SCRIPTS
+
+CODE_BASE = 0x4E00   # chỉ số lưu thành ký tự in được (CJK) để file nguồn gọn
+_SYLLABIC = ((0x3400, 0x4DC0), (0x4E00, 0xA000))  # chữ Hán: mỗi ký tự một âm tiết
+_HANGUL = (0xAC00, 0xD7A4)  # âm tiết Hangul ghép từ jamo, không lưu từng ký tự
+
+_HEADER = '''# translit/{name}.py
+# Sinh bởi translit/_build.py từ anyascii {version} (ISC License, xem
+# translit/ANYASCII_LICENSE). Không sửa tay.
+'''
+
+def _value(name: str, cp: int) -> str:
+    ch = chr(cp)
+    if name == "latin" and (_FOLD_TABLE.get(cp) or not ud.category(ch).startswith("L")):
+        return ""  # bảng gập mặc định đã xử lý, hoặc không phải chữ
+    value = anyascii(ch)
+    if not value.isascii():
+        return ""
+    if any(lo <= cp < hi for lo, hi in _SYLLABIC) and value.strip():
+        # Tách âm tiết thành token riêng: 中文 -> "zhong-wen"
+        return f" {value.lower()} "
+    return value
+
+def _hangul_jamo() -> tuple:
+    """Phiên âm phụ âm đầu/nguyên âm/phụ âm cuối, đọc từ các âm tiết mẫu."""
+    initials = tuple(anyascii(chr(0xAC00 + l * 588))[:-1].lower() for l in range(19))
+    vowels = tuple(anyascii(chr(0xAC00 + 11 * 588 + v * 28)).lower() for v in range(21))
+    finals = tuple(anyascii(chr(0xAC00 + t))[2:].lower() for t in range(28))
+    for cp in range(*_HANGUL):
+        i = cp - 0xAC00
+        got = initials[i // 588] + vowels[i % 588 // 28] + finals[i % 28]
+        assert got == anyascii(chr(cp)).lower(), (chr(cp), got)
+    return initials, vowels, finals
+
+def build(name: str, out_dir: str) -> None:
+    import anyascii as mod
+    ranges = tuple(r for r in _SCRIPTS[name][0] if r != _HANGUL)
+    hangul = _HANGUL in _SCRIPTS[name][0]
+    values = [""]
+    index = {"": 0}
+    codes = []
+    for lo, hi in ranges:
+        for cp in range(lo, hi):
+            value = _value(name, cp)
+            if value not in index:
+                index[value] = len(values)
+                values.append(value)
+            codes.append(chr(CODE_BASE + index[value]))
+    path = os.path.join(out_dir, f"{name}.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_HEADER.format(name=name, version=mod.__version__))
+        f.write(f"RANGES = {ranges!r}\n")
+        f.write(f"CODE_BASE = {CODE_BASE:#x}\n")
+        f.write(f"VALUES = {tuple(values)!r}\n")
+        f.write(f"CODES = {''.join(codes)!r}\n")
+        if hangul:
+            f.write(f"HANGUL_JAMO = {_hangul_jamo()!r}\n")
+    print(f"{path}: {sum(hi - lo for lo, hi in ranges):,} ký tự, {len(values) - 1:,} giá trị")
+
+def main() -> None:
+    out_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in ("latin", "greek", "cyrillic", "cjk"):
+        build(name, out_dir)
+
+if __name__ == "__main__":
+    main()
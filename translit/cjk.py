@@ -0,0 +1,8 @@
+# translit/cjk.py
+# Sinh bởi translit/_build.py từ anyascii 0.3.3 (ISC License, xem
+# translit/ANYASCII_LICENSE). Không sửa tay.
+RANGES = ((12352, 12544), (13312, 19904), (19968, 40960))
+CODE_BASE = 0x4e00
+VALUES = ('', 'a', 'i', 'u', 'e', 'o', 'ka', 'ga', 'ki', 'gi', 'ku', 'gu', 'ke', 'ge', 'ko', 'go', 'sa', 'za', 'shi', 'ji', 'su', 'zu', 'se', 'ze', 'so', 'zo', 'ta', 'da', 'chi', 't', 'tsu', 'te', 'de', 'to', 'do', 'na', 'ni', 'nu', 'ne', 'no', 'ha', 'ba', 'pa', 'hi', 'bi', 'pi', 'fu', 'bu', 'pu', 'he', 'be', 'pe', 'ho', 'bo', 'po', 'ma', 'mi', 'mu', 'me', 'mo', 'ya', 'yu', 'yo', 'ra', 'ri', 'ru', 're', 'ro', 'wa', 'n', 'vu', "'", '`', '-', "-'", 'yori', '=', 'va', 'vi', 've', 'vo', 'koto', ' qiu ', ' tian ', ' ki ', ' zim ', ' kua ', ' wu ', ' yin ', ' gau ', ' jap ', ' ding ', ' si ', ' tou ', ' yi ', ' zaau ', ' man ', ' ng ', ' nou ', ' dung ', ' ziu ', ' ho ', ' hang ', ' jau ', ' xie ', ' lou ', ' mai ', ' dau ', ' chou ', ' keoi ', ' kei ', ' fei ', ' jyu ', ' nuo ', ' fau ', ' fu ', ' dan ', ' co ', ' geoi ', ' dai ', ' xu ', ' xing ', ' xiong ', ' liu ', ' lin ', ' xiang ', ' yong ', ' xin ', ' zhen ', ' pan ', ' ru ', ' ci ', ' ma ', ' qian ', ' nei ', ' cheng ', ' feng ', ' wun ', ' sau ', ' taai ', ' zhuo ', ' fang ', ' ao ', ' zuo ', ' hing ', ' zhou ', ' dong ', ' su ', ' qiong ', ' kuang ', ' lei ', ' nao ', ' zhu ', ' shu ', ' zat ', ' cim ', ' zeon ', ' seoi ', ' zung ', ' shen ', ' jie ', ' die ', ' long ', ' ying ', ' beng ', ' gin ', ' zik ', ' koek ', ' lan ', ' miao ', ' li ', ' ji ', ' yu ', ' luo ', ' chai ', ' nim ', ' gu ', ' bei ', ' hun ', ' hui ', ' rao ', ' naam ', ' cam ', ' han ', ' xi ', ' tai ', ' yao ', ' jun ', ' lue ', ' tang ', ' zhao ', ' zhai ', ' er ', ' ran ', ' qi ', ' chi ', ' se ', ' sa ', ' hon ', ' seon ', ' kui ', ' pu ', ' ta ', ' yang ', ' ou ', ' syu ', ' mian ', ' diao ', ' mie ', ' niao ', ' you ', ' joek ', ' jing ', ' che ', ' sin ', ' sek ', ' wong ', ' kon ', ' fui ', ' jip ', ' quan ', ' cai ', ' liang ', ' mao ', ' gung ', ' gua ', ' sui ', ' din ', ' mong ', ' shi ', ' buk ', ' wang ', ' kou ', ' du ', ' ting ', ' leon ', ' juk ', ' bing ', ' huo ', ' gong ', ' cung ', ' qin ', ' jiong ', ' lu ', ' cat ', ' nan ', ' mit ', ' bi ', ' hung ', ' qia ', ' pi ', ' dian ', ' bai ', ' gan ', ' xuan ', ' lang ', ' she ', ' hua ', ' pian ', ' di ', ' ruan ', ' e ', ' qie ', ' rui ', ' jian ', ' chong ', ' deng ', ' jue ', ' xiao ', ' zan ', ' put ', ' zhan ', ' zou ', ' chua ', ' gaa ', ' chu ', ' kit ', ' ba ', ' kuai ', ' sai ', ' xia ', ' bie ', ' lung ', ' coek ', ' heng ', ' gwai ', ' gui ', ' ti ', ' le ', ' pei ', ' sun ', ' xian ', ' wai ', ' que ', ' zhi ', ' jia ', ' hu ', ' la ', ' ke ', ' ai ', ' deoi ', ' wei ', ' cin ', ' teng ', ' huan ', ' caam ', ' shua ', ' shuang ', ' he ', ' gai ', ' yan ', ' fan ', ' pang ', ' ne ', ' xue ', ' chen ', ' guo ', ' n ', ' fa ', ' pou ', ' siu ', ' wo ', ' hou ', ' qu ', ' xun ', ' gaai ', ' nie ', ' hong ', ' tun ', ' mei ', ' shou ', ' ye ', ' ju ', ' ling ', ' lun ', ' tung ', ' je ', ' ge ', ' pen ', ' chun ', ' niu ', ' duo ', ' ze ', ' sheng ', ' wen ', ' ku ', ' zaai ', ' haap ', ' zhui ', ' gou ', ' bo ', ' xiu ', ' po ', ' zyu ', ' cu ', ' kuo ', ' lao ', ' zha ', ' gang ', ' cong ', ' haam ', ' saap ', ' leng ', ' rong ', ' dou ', ' pao ', ' lyun ', ' kan ', ' coeng ', ' weng ', ' wan ', ' hao ', ' jik ', ' tan ', ' kyu ', ' bu ', ' zang ', ' in ', ' haau ', ' zoi ', ' dui ', ' bang ', ' bao ', ' chang ', ' gei ', ' suk ', ' zong ', ' zhang ', ' gun ', ' lau ', ' liao ', ' kyut ', ' da ', ' chan ', ' meng ', ' sik ', ' hei ', ' qiao ', ' nang ', ' yun ', ' zi ', ' ngoi ', ' kai ', ' heoi ', ' gao ', ' tao ', ' shan ', ' lai ', ' ban ', ' kong ', ' chuo ', ' nu ', ' daam ', ' ka ', ' ko ', ' peng ', ' jiu ', ' mau ', ' sou ', ' can ', ' suo ', ' tong ', ' haan ', ' qiang ', ' sao ', ' an ', ' cha ', ' saan ', ' soeng ', ' caa ', ' lian ', ' mi ', ' mu ', ' ging ', ' cao ', ' nen ', ' cui ', ' leoi ', ' nian ', ' yue ', ' nai ', ' huai ', ' hai ', ' luan ', ' mang ', ' ning ', ' ya ', ' ming ', ' zui ', ' jyun ', ' kang ', ' sam ', ' de ', ' bian ', ' jin ', ' chui ', ' tui ', ' za ', ' zhe ', ' cik ', ' song ', ' cen ', ' shutsu ', ' min ', ' huang ', ' zu ', ' ni ', ' cuo ', ' tuo ', ' qun ', ' giu ', ' bin ', ' tiao ', ' kwai ', ' sung ', ' duan ', ' tu ', ' ngaak ', ' yuan ', ' biao ', ' dao ', ' shin ', ' dik ', ' run ', ' jiao ', ' cuan ', ' zing ', ' fong ', ' faan ', ' hau ', ' ren ', ' sha ', ' mok ', ' saam ', ' zin ', ' zhun ', ' kun ', ' chuang ', ' zao ', ' zheng ', ' pin ', ' ben ', ' aa ', ' waa ', ' yo ', ' jiang ', ' go ', ' juan ', ' san ', ' daan ', ' ceng ', ' daai ', ' lam ', ' zhong ', ' mou ', ' jeoi ', ' fen ', ' on ', ' nin ', ' lie ', ' paang ', ' guang ', ' gip ', ' te ', ' men ', ' o ', ' shun ', ' shui ', ' deon ', ' ce ', ' oi ', ' guai ', ' wa ', ' laam ', ' bat ', ' so ', ' keng ', ' jung ', ' na ', ' huk ', ' shai ', ' cau ', ' hak ', ' den ', ' tuan ', ' sen ', ' qing ', ' geng ', ' chuai ', ' shao ', ' ngai ', ' syun ', ' gen ', ' gwong ', ' bun ', ' ceon ', ' zeoi ', ' hoeng ', ' caap ', ' nuan ', ' gwok ', ' piao ', ' haak ', ' kwan ', ' ngok ', ' tyun ', ' reng ', ' naai ', ' doi ', ' pai ', ' zaak ', ' zau ', ' ang ', ' hap ', ' bui ', ' wing ', ' guan ', ' shuo ', ' pun ', ' hen ', ' chuan ', ' zoeng ', ' mik ', ' kuan ', ' ciu ', ' goi ', ' sei ', ' zai ', ' mo ', ' zaap ', ' neng ', ' gam ', ' sho ', ' shuai ', ' taap ', ' jyut ', ' kiu ', ' joeng ', ' en ', ' sing ', ' cyu ', ' zip ', ' tim ', ' ping ', ' cang ', ' chao ', ' jam ', ' pui ', ' nong ', ' hip ', ' fung ', ' bou ', ' dat ', ' saat ', ' kao ', ' zuan ', ' ken ', ' sat ', ' hiu ', ' fat ', ' pat ', ' gwing ', ' cyun ', ' gik ', ' gim ', ' maan ', ' zen ', ' taam ', ' daat ', ' laap ', ' dang ', ' ham ', ' sang ', ' rou ', ' zeng ', ' jan ', ' ngou ', ' baan ', ' ceoi ', ' sim ', ' dun ', ' koeng ', ' ca ', ' loek ', ' cou ', ' hat ', ' sap ', ' baak ', ' pok ', ' cuk ', ' zaam ', ' au ', ' rang ', ' zhuan ', ' u ', ' ngau ', ' ei ', ' cun ', ' gaak ', ' ruo ', ' zit ', ' gotsu ', ' do ', ' zek ', ' seng ', ' ri ', ' tin ', ' gat ', ' sakikusa ', ' kau ', ' duk ', ' pa ', ' mui ', ' ung ', ' gaan ', ' zun ', ' fuk ', ' goeng ', ' niang ', ' nue ', ' gaap ', ' waan ', ' maa ', ' zam ', ' hin ', ' nung ', ' gaam ', ' mung ', ' fun ', ' suan ', ' ngo ', ' zaan ', ' seki ', ' daap ', ' lip ', ' bong ', ' saa ', ' baat ', ' pie ', ' tie ', ' ngit ', ' mat ', ' gwang ', ' shuan ', ' gap ', ' aan ', ' caan ', ' biu ', ' gyun ', ' shang ', ' diu ', ' me ', ' fo ', ' lia ', ' a ', ' fou ', ' m ', ' ha ', ' dia ', ' ga ', ' hm ', ' lo ', ' zhuang ', ' re ', ' zei ', ' zhua ', ' zhuai ', ' rua ', ' gwaan ', ' fiao ', ' miu ', ' shei ', ' eng ', ' nun ', ' gon ', ' kashidori ', ' futsu ')
+CODES = '一丁丁丂丂七七丄丄丅丅丆万丈三上下丌不与丏丐丑丒专且丕世丗丘丙业丛东专丝丞丕丟丠両丢丣两严並丧丨丩个丫丬中丮丯丰丱串丳临丵丶丷丸丹为主丼丼丽丽举举丿乀乁乂乃乄乄丂丄丅久乆丆丆一一乇么乇么义乊之乌丁丁丂丂七七丄丄丅丅丆万丈三上下丌不与丏丐丑丒专且丕世丗丘丙业丛东专丝丞丕丟丠両丢丣两严並丧丨丩个丫丬中丮丯丰丱串丳临丵丶丷丸丹为主丼丼丽丽举举丿乀乁乂乃乄乄丂丄丅久乆丆丆乍乎乏乐义一义乊乑乒乓乔乕乖乗乘乙乚乛乜九乞也习乡乢乣乤乥书乧乨乩乪乫乡乧乬乭乮乯买乱乲乳乴乵乶乷乸乹乜乺乻乼乽乾乿亀乷乗亁亂亃亄亅乞乘了亇予争亊事二亍于乗亏亐云互亓乞五井亖亗亘亙亚些亜乸亝亞亟亠亡乱亓乞亢亣交亥亦产亨亩乞亪享京亭亮亯亰亱亲乸亳亴亵云亶亷亸亹人亳亻亄亼亽人亾亿京二什仁仂仃乗亷亽仄乜五亖仅仆仇仈仉今亙介仌亹仍从乘仏京仐亻仑乨仒仓仔仕予亖亪他亭仗享付仙仚仛仜亦仝仞亰仟仠仡仢代令仟习仜以亪仦仧仨仩亀仪仫们仭仮互仯亇仰仱仲仳乹仴仵乨件价亠亓仸仯仠仒乹仹仺任乳亭仹仹亽仼份亃仾仿乳乳伀仏亪企九伂伃伄伅伆乞二伇伈仯仃伉亸仍亼伊乼伋亓伌伍伎乯亘伏伈伐休乨亪些仃亸伈伒享伒乯伓交亠伔伕仞伖众优伙伋亖乿仼介仳亱伅仳会伛仕乱仾伜京伝伞乞仾仯乩伟传以伡伢人伣伐伤伥乘亸伦伧伨伩乞伪乳仱伫伬伪伓乨伓伭伮伯估亓仒伱亻亾乸以乜伲仈伳伴伵伶乒亟企亸伷伸乴亍仯于乳伹伺仒企仸伻似伽企亪伾伌伿仸乜佀佁传乼乞佂亙乸佃什乩乮佄佅亊乫佅但伭乨伟佇佈但但乘亀伒乳亰仔佉伤佊乱佋仂九亷亻互亲仳佌仮位亊乓低住住佐买买习佑伶以伺佒体佔何佖伅乨仒伅佗佘余伨佑优习亼享佂伦佚伒伤佛仼伫作亅佝乴亱佞伓亪伌佟佝你佡亃仔佇伟佢佣佤伦乨亸伡伆佥亸佦佖佧享仮今伶乸你众佨伤佩似佋乽伺伴亏乞亃佐佪伣亹佫乞伦亸伣佌享亷佬佭亪亞亨众亷伶佃佮伶亷佯仃但仮佰价优佱仾佲仒仱乸但价佳仔于于佴佰亀併佌佶亏佷亠伫佸亃伾佹佺佻买但乻佉佼佽价佾仧伓优乓使侀侁何伭乳何京佋仈伭伖买伭人亢乹佷仃乨但仿乞侂习侃优侄乨侅享來乞享乘侇侈乞乨佳乾佯侉亹亽伦佾侊仈侉亖例亸侌亸侍侎侏侐亢乳侂侑亰侒仏企仈侓侔侕位侖侗但乳侔伆侘伧侙亸京作亟侚伌享供伌乞京乞伶亟仁佳仅亻仒侜乿伡乒侉依佷互乜什乜仟侏享侞侍乺佭伓侟乱亠乞什何侂佺侠何了価伆仳乒侢侣佬亸予乞侤伆你乿侥乿仒亱亢争侦佲亊侏亪今亨习侧云伶亸仳亸侨伷伷伭伾乞亗亇併享亙伂侩乖侪侫伣伦侬侭予侮佄乸侯亳侰乾伏乞乢亽亸侏亙乳乞侈侱侮侲侣佌仳亓侳于侩亅佨侴佧侵仁侶乪乿侷侸于亟亄侜互亨亸侷伦佱侹侊仑佲侯但佃伍侮伦侐侺乸佳仾伦从体佝侌体侻亘佊來侠乨乛亠佫侼乶伪人侽乞仿乾乘伶亓例乼侾仟便俀京乞佝侯亻佘俁係任亢乗乹侴侍从侊仱促佲俄伫亶俅乢侮俆京俇亏佞亳人俈享侩亭享伭佞俉乸侶侏俁伕俊佌伭乨仂乞乨亃乒仩仑仂享俈俋俌任佤伏侐伷乘俍享亳侐亨亗佌仱乷俎亠乸佧乾佬仃九俏俐仢伪俑佳亇伺俒仃侮侩侰乜乽介企俓乒佤乳佼侼仿俔亷侼佞俕仂亷俖亢俗俘佖仂伍侯伡伏乽佦俙仂俚仳亶侏伅俛俏伭仜侢俏俜保便人伋亪伖佦俞侈佝佤乩亅于俟乾侼俠信于俢亸乳乴侠俣侥佃伅仂享享企俤俀俟侊仼伭乞于京佳佼佁俒俥俦亪仳仑侹亪侬仳予侯京俧佌俨俩伏侟乞伒享价乚俪俐伷佑余亠俫侌乜侥俞侐价乖亪俐佄乱俧俊佘伣仹佋仟俬俭亙修侍俯俰乗亣俱伟侮价佝侼乨予乩俲俳伓习亢仛乘俴俳伈侻但乞侀享享亿京侠估伦伩位伦俵佥佌乴來乞亾伣仃亃仃伶仿佬亢侉俆俈侪伫仃俶亣俊九俷俈侪人侂俸亁侍侮仱仳伶係亓乞侉仲俹仼仔佻互俺俻亷伃乗侫佇九仃仏价了佄仳众乨价亝价俼伣伇伙什俻俩亀亱伅京佃伍侯乞乜仠习俽侖亹侰仔俅佫俾侣乛俿事乗乭伃侥今乹俌何亸侕亞伟侖伈伦伭乘亰倀估倁仂侂亵乨乨佖伭倂付今伏侽倃仔乿乞俪亙侪二令从享亍伡伫伷于仱仹伌倄份侍佑侥侉仒侔俵乳伓亘事云倅书倆伋伉侪侙倇亪京倈京侺亪佂仯伪俞俄亳俖倉仲亏乳伆亱仕亃侼亷亸乒俐住倊乬俼伶伦俄個倌位佊俈侣亡仕侟乞佌享侗乓俞倍仝仂京侮佧习倊亞京享伭侯仢乨乸仃乒亳侱京伆倎倏何乩倐伸亹云乘侨乯伻俞乞亲仄佋俏倄伴俋乘們俒于予侮使侉亄亡伨仳倒乞企佥伨伅仮伢俒伣亪伣伶亢倌俆享买俅京仮亩乬乪伬传亠伭乞仾亸侣亨乘乨俉亭位亅仮伈佁佻佻佑亘亡乾享介亂亸伳京乞亅享佃乓佊亅侰俆仟乘伵你仾仟亍侾佦俌亳京仡倓乻伅侐侐价倔倕倇一倖伖佉侺乘亘伉伣仾倗乒伡伞什仯五伨佤亪伻俼二佁伿倘佈侟個今二俟亰伨倗仭伦互佼云了乼你享俏伭仕佝佽亂併佷侂仈佤亷亣伦亠乹乨佄侖亅乨亓侺侯亲仺候亳倚俌俵乬亠俐亨俁伨佬仮侄人們伞伈伈俠俆亄亳从侣亼仺介佌佌伥倛亅倜倝侠仮侏侈仾伌乯們佋倞借佩仱亳佈位侧亸俒众侊倠亨佳亃亿于亭仐乔乳倡乨佞亳倢乨亚侌佞亅你俤伋俰俌佌伅但亅亡亡伡仂伦仂作余京仱余伴乳倣伃伣伞伴俕亷侥佞侖价仳佋俒値俼仏仳九侮伪俼亀値侮仟倐亅侒倥伌价佥乘亸侖亓仅伇侚仳位侪佚估一一伧侘伨佬信乩佌俻伪侤亭俊乛俛亘伶伸侪享买买倦乞修倧仒亳人人伦仯仂倨倩侐佂侯乳伨倉併伃九伶倪乣佃习使便侕佾侩倫亞伣倫乜亃仟仿仵亱伻侞乯云享亠亙例俰亡仳侬倬倭倮京亹侉习俏估佘倯估佂仔佞伣亪俆倰侼倱佳介侒伣亓伭仕亸俆俾伴倄倜位侌佼仂仉侷佞倲亳亡伶佌俤仵倇京伟乓乗佇伌佳倳俘俳亽俐乳倴倵佈众倶俤仯乿俭倷俞伋企例佽倂仴佦伭俿佉乜俅仳佃倸便佑俊仳倹佫乒倇仯伣亸乿习仑乳债倻乨倇乳俓二伕亏俊俀伴享佺伈代俧亵俜伣伶亽今伃伋值亷伌佌伭佽作但乓侸倽価仒从修倾侸佗侪伶倨伉伄伧仱仟伅亪仃佸伴亠侶倿偀佂伵仰俵侤乗享亸五伴佱伣亠亲仺亟乬亀亊伏偁享俌伦俵侢他偂仿价仾伡乷仂伦仺侉价亓仮偃仲偄俹侳亰亍偅偆今侴亸俄伣假俊今伨侴仳俻仳亅佭亀伷亪侲仂偈侁伟位佃侮仳亙仯俊佭俆倢候乣侂仉俆俟伈侄偉俗俲倇亪亭亟从伈伃亱一侮亜伣俴伥亢俀佝伋侖伺倕乨侌亨仂乞乱亪侷代乞仃享书乨倘侐伴亸佃侺优侺伞侉佄乸亟仨优俫京侾伿俑仒侐侮伣优乞俫伶俤亸仃以係乘侌乞亸仄俆佋仒伥佋侻俰俳俦亝乥位乨伝侴佟侩佟侣偄佥偊乞仺余佗仿俈亸位仂佁侮仩倌亨伭俛伖伫偋亳乞偌侐倄侟偍价亪仳亭侺亀伵伥亀侙亇侠伋享位乣倥伥伇侚偎伦乩佭偏亝佾佫伣亖伌乳佃偐俫伦併佫亓亣仟侸俅亙偑亽亷侨佫偒伊仉俤併偒仁侽倇亡亡倁佀仳乴亸伞享俒乞侶京仧似佖伶侴伣俤九乳伡偓仒乒侾佷俅以佥乞俅乧佼亨乞亮伉仾乸京佟佇仰仸今似偔乩侁亢乨仕伈併仺伍仾伣仑俼一偕事倞侯享乢伨企仧仒佖价侯侧乨伷乞併亖乾佀俆伀乘享偖亓亰偗侸仧从亓乞倜享享亭仒仟佥仢伦俅亪九俩佨倭仰享偘侍偀亸亀乾但亻乨人乨伦偎促乜亢伻侯伥乴侖乪偙仍亓乨佞乛俑俧亙伀亷併侔做亰倀倚侯佄倌伈侴伋伴乯以仕亟供偛习一乳他亵乞乬佉余佾亖伪俫侯仢佑仺乞伣俒亣亘体予乸倱乗來停伐亏俅人估倹佟仄亖倢伌俤似付倂伶伺亘伜亣亸侣倃侮伣估乘仔侮侖停亱伈亙伷任倃伕京偖仔侎亖乞乷乙侉偝份俆侳侺偞偟來偌仒佀乻亷倪乾俆仃俪偠倫偡佇乓偢伫仡俟佞五候亙俇亳偝乳亳伅伭倄併倻低伴乾亳偖京侂伶乒亾仲亹修仪偣佴偤俩俈乼仲佥乹伨俦乸俁偢侌侴倢偌偢俲交仃仸乣伶佑偌亱俻亡亾健乗伶他伋伣亹亷亝任享亠偦偧乤乨侗伷仮亸但侯仁俥乘侯仆伋佃侥佲俊亪倥侙伣俊伦俘亙亱佋伂侉伨偨侠侩体亅亱伕倄伪俔俔亏位仗伞伶以佂倇俫乜偢亱俪仩佞仞亅乯享侂亳伴亪俞侷佟侉伃亖俆伉乜仉人俹估估侕亂佱亣亴乘以乘伋佈仾伧倁伆亘仏俸仒亐侫乞以乞偌佶倩伥伌乗倣亣仪以俒倣今佁佌侉倱二伨亗伶佝京佂侘乜仃伨介佱伣俴佫乩佤侖伌佖侺伷亷侉伏偩今亘偠亷京二仒亪仮亸伣侉侮偪乜侠仉乒仯侐京会乜倶佔佉伕侠乫乸偛俅仟偫偬伡偭乞京伝偛佃佾亳俁偮俩佷侼伩俜乗亪位倫享亻伐何伋乷亱促们伸享仰伩俗仢俜伺乜促偯乧买何俁偰仢价俜仄侣俜从俆仳亖偱伏价享偲仾亪倐偳仢乾亙側享伅偵侀倩亣五亭亀佈亰京亖佞了伂侮亽侮佘偶亪仪倔云佦乹值伷侟佞俔亙乞佞伆九仯侥亷亇亠估乹任亮互仺伄倇佗仌伃京偄佫係亽佧倱俱仳侥俳亪仅亁乜偶偶伨乞伣乨亭乻偷併份偨併偸俼倃仒仵代佦亻仃佝佲亪乻倇优亱侩京佌偹佄侐俓侣偺乾乳伄偗亸亙俤俤乸侃侂侀倏伻伷享伦偻亰乗依伆亙侺俔仩侐仁侰乳位享佟仾侸侾亠亪侈亂俞仳亟亪仞倣乿乨仱伆仕仒佷井伥伫仱侧伓伡佣乞倓佗伂佅云俐亳伨亱偼侐佥享亰亸侔亮亄亘俈作伣仿偽偪俦伦伫伣似亸俸俈侣侨伣亠倄俕偾人俠伧亖伶仳俈亣仺亭亪伙倭仟仼俐乫人伴体伴侽乬亪亽估价伕仕介侈于伺乔侐侈仁佽俓佲今佾份伶亸亘侾伷仒侩俈侊伀俆亰享侍俤伶亸佯从仾侖佁亅估俪亀乓伋乨仂值佉亰亱侕伷佌侉倎价仟偁亰佇企亭书伧仜伵俐佷亰予侰伫亣倎仞亠仃亠乬偛伻伶仩伃乷仞伣俟乹侊佋侯仂仂佁乨京仹亇人亣介享侂仾俏乩侒人伶伢伞俐亣佗侪侮偿仾偄仕俒佃亩仮京伏伨俾俟亅亸俹仨乪侼伏俅享伋侎价以偁偌倇仐偌亸侉佃俤仮伣乸佔侥佂京乧伉佞偧仏二享仹俙乹亳以余众佼人京佽亠俊伧以伃互亃乳俏亀亀俋伶侍书仯侍亼倓伩伇伾俓伶仯亠倓似侤佁俳但仏侗今侴侾侄令侱伃乮从亠俏佌京亀亾佥乹偤侘伴佝佇佤乗佞倘仳佢侮乞侍亙侫仾俆仱亳亓俱傀亢傁亗併乴伭份侈亪傂伣亁伩亘仑侹亣伣亨偌伕仦伞价乳仮乞乻介乘俻仮亇佬伅侐伶作佥仂京仜仮但俐佌伀买俁侟便侲乩亪俱偋侴侖乴仂侁侗位來倶京乞仏仂乞侶乳伈侾亍伇伣偓侗价以你侶伦侕乓乓亂乞倇侩伴五亪伞侐亓俞侾侪佲俻仪仒亳伈伇侼佌侐佌侩仢侗亲仜使何侙伹侣伟乸侠俐仂亠仟伶倭伦俈傃伫伸停亽偖亲仂伓侤二乢俜亟乩俟亪习乿俍俐佉侔侮俠伏侐傄偢伦伕侴乒侒亢伣乯似亇侠伅伉侷佇人侾人侥佥仒伺人伪估仿侷伻偮偮亟佁侽便佇俱侏仾俆二京併係五伝亇侠伺俳伉亁侍佁佃亨乞佫乜亅乜傅伾傆侊企傇倩侺侍伓伥佼亪伕亠乸亭亝侏倁伨乘傈伦亅乕份伈亘亘余但伇佖值伦仯乞仃享亘佤俪佫俳倚們修众乞伋伙亇亻佬伭乞俊伶傉俼低偛亾亷京乷亾乯俫位今佃侼佋佾伞仡仵佑伒以伪侤亃云亹伖仱乸仩們估佧众俳亅俆侂伭侦偰亸倚仉侢佌亀倥侕侘今亅佱佫亭伨侢倁仉仐俆倥侯亙位亖俹佪伦仏傊俼亰伷佉仢伈亽乨余乗伷亭侣俾位乞佧侏侊京伦乞乴仮伭併仄乨侢俌亅乻乞傋亖亪乯倇乼伣伌仌侯伣傌傍伳伶俅位佇仂來侘价伨伨信們伡五便侠佷佉俼伭侂亱亪仜促亲乽俦以亣偨仵俐侠伶伬仅倠乨俊倌亸习偅俐併伌佋价亭伷亪侴休俠伃井伓伣侉侯亅乒亀侐傎伮伨份仃倓侰佞企倣人仟仧傏乗佴亂伺俳俏俹倍伏亏侷倇仍云价俪京亥侚什乞侯倢傐仧享佷仍伙伷侷亪伷佃乳什伅俳乓京俆仂佌侗仕亱佔乞乸倂佄乳倝倆仪交佥伭伪人仌伌倣亽伞亳今仯人侈仂俆亼侯侯伈仳伷仌侯亠乳伙俐亓人但俆侮佞伈伟位偧以乘俠乬傂仐伶亨伉俤伳仜但亭伷以亭亘侐乬俻仲什乞伇仝俪乳亨仢京仒任位亘今偛亿俤俇佷仨傑俁亷亷倂伨仯伃乳仾侯佉仿亰亾今京侂亪仳乗亖享亪亪侂你介倔俔侟侂亾伞佹乸侸伥伭俳互伭佞修估仾伍亪伶俐伺伨佾仁伌你來云乞乸亭偦伓乳倚亷偝仳伏今乳佇偺侍亓俴偀乩亲伓佖什什伄仂乜佌傒伶佽佋侐伹俱伕侲伟亷亏伕俊倔倣价什亘乗佘伦云仳佘侄乒伩偋侢从伃仂侲倱侮以亢亓仂俞予乸伋伃伂偀佔俪亀伵仺併偝体伴傍偌伙仂以价伋乜偳仡倚亳亸什佟倂佡亸伦俣佌伟俊倥侊价亷京伣伸偎侣佷乥仂享二仳亻伣亸仝佘伦侐俰佧乓伓伃体乒俊佥偹俗享亸亘伋佑享侈伻侤傓乽俐仂亘伢亮佱伪偦亰伵伷佧侲伦侉亖佟亿俊京伞仯伍乴仮侢併亰亸习何于仺乗伫侊仺侊介伦佞亣伭傌亨伶侉仜亀仉佬亹乯亙傔偶俓併乓仃今伧倎俐來侭傕伻俆伅佝乳何亰伅交侕伃傖伃佷佲亾低仂侰亅亥侂侢亷仒云今傗亓佷亸俹侲乳伯仕乳乯乗亸介便伸侼傘侊侲俘侒仼伌乿仂亝佧倥估佔伌伻乴予乘值仁備习伷佃以伴俅乷偌伊仯俁井俦侪何仒佳傚仡伺亖俆仂佃仧乞來傛偶伶乞乘仂俊亸乞佋乗伦伦亷侚乳体偛伖乬佺俔五佧侔乖佃佃伦侊亪云今伦亰仞伨伩任亃亣侐傜仂二侪仟仩乘亮伇偃伄乳侗乹伈乞佉傝侼享侤亷亝亪侐俑人佑亪仂仯亪仭侤佝傞亓乬伈乨亱乸仔仉位乽亏仏体倢仵亿仳乞倥京企亪傟佀傠亪傡俋伳倗乞侽乜余乳乞伊仁們傢伟仱俟仢伭傀仄伫仂傣假乯俁乘俦侨佬亳乨佖併亽伦乞乳伅傤亻伧侪伣习倧价位亠仈伧偾亇仿乹乯仳佥伴享俒亣伌伯佤佖仈傥亅佌倱伷九乼侯二乨伨侯亠俉佧亪仁亘乘亷偪乞侻侷仁位傦京傧侓乞傧乞亅优伓乘侯亸倚佯俑优伶俜伟乗侤乘伉云侼俞供亩俲佲亪佃倚以价侐佽储俻乽仈倹井佄佥人俰亳亸伅介俘仒伋亪俁亪亇享伨伏乳使偀佌侊使併倂乹亪伶侢以乞仭佧佂佲伃享佑亷佞佟乻侣侣乞仾伶俲亷乾侂偢係京仂俊亄偢傩伳俆偀仉乼偶仪俹伩乞乾亃伶亠佄伭伣侽乳佑乕偌亘侸伣佘亪侣仐伈俒亮佲乸供乪俀佯依书佨一京伭亘侀份乞傪仏乳价亘侐亙优俒偕俤佄伉乢佫伦偸倗侖京傫俆亞仳亷伙乞俀伏京佲俒偀伋交侣亞何仂人仈伄佂佄乨倧仈乯乨佞伪侴乸仼仌侂佽伟伓仃仑偀予乨伊伭伋仈偺仅何位侊伷似侊亢乮亣催偀佢亪仩伮俟亅亸傭俄俄伣侮亃倥乨以伭亶亶伴仒仳侗亣佗俻仂伈侏佝仂佧乼享乪俱侶俗亪位佦亇仾伣伨价俑乷乷亲众仕伟买乱伦乻乯俤偀亸乼仾倶侕仺乿侖伦倔九乓乞乨仺人人供佳倆乘伷仵人佲俞优云俞以从亸享侕乯伺俒亃侯俅傮倚京伅伦俪乸亼亳佄亗亷伧佬企俜偛佢亸俌侯乿乗五侃侕乹侠佌亲伟习伶享佊亖佲仕侣亠仒亳佥亓佑亗亸佂佼仃伭俊侄偝仃俲亳侻來佤俔亳乗于伀仢乪併乿仔侩今侉伭倠享伻仕京伣乿仸俽仇亗傩伶乒俹俌亻來佌佂习倇偓伓仃乽仱佉亙亮仃亰京乘仍乻佤亙俊伳亳偫仚伅傯俫侂伋亻倠乩伭伉亘倇傰俊亾佶乞伓俒佞傱乞佳侾估习习佃佤佳倁俏伣亀亙亏亘佝仾乞伦乨俆侣偋佷仞伦享佲偀佌仔伫乳伞佂伶伄伦俟乞侤亡伞佗佄伻伀倢佰乜体佇互亇伭亂亙仝享俉仂伶乳京乳你伦併亏仕佃仒伴佂伞伅俹侏九傑俜乳亏伨傲佞亾伋亽伋乳俐体乾俇侤仃亅仝伌习侣仂伈价享伦亘佃伏享俅傳亪亪侷仜亇乳侪亽以书伆仂佞倚九伓佢侷伦伻伓价侊伕乓俏倇予亇乒俘乳佣伈傴仰傉亀乒亏仃仈倇亱仩乗倗二仳亽偋伓仞乓俰使伋俜估乯价債优佁享佃仈伨乒仢仝侐乒仺伸倔人佫佄佢亡仃俓侊仾何伙俊伓侉伞俛伐伊侗伯侷仜亘位伻亀乳伀俘乖伫习五亙侺侖伤伏亢侠亪侀体佫侷伋係伷仂佇乳仳佇俔俏乓俻仂俳倢仯乓仿仟乘仳俞佌仺书乨俅亲亘佫偸乗侪倘侖侟习佟亞佧倘傍侉乜伉仢亱侒件伦伭俏位偧但位仂侷傶乞亸伻候佫伻偠仒享佞亍乔乫佢伃俤京伴乸京佃亊仼倣仲伝侾亙仒俌佋停人亙伶偑來佧京佞仢伮伶亖乼伟仩侷享伮侏傷俽佌佌伓伻仯乽伣侩伞京亖仄俜伻乹乒书傸偶仝伃伶侐仠亣侉伝亪侤亄亄佝亽伡乩仂俓俜伅侣亠乞享偶伋价亖乞体体你亪偋亹你佢佌乸伷乜乸什仮亘仁伾俻亷仞伦侯京仓俍佉乘从俜仈亊侌侯佫京侧侯佌仺俆仧享侊伈伺佾份侉亪亪乒傀亣侏伻伦仁傹亼侒伞侷亳仺侪何侉俫以伀乹亣以仃佋亷乯佋伶偧侢俆何伣偀侕伆侉亷侊侷佢亅俆侖侰俞佰侟俳伦体京倂乪俹仂亓傺乓假佢仢乵亠伈于俤佋信佋亢俲佾侮偾估仳伭伣傻佞俳亘亱侊乨仌仒一伌亪佥侯傼佋倂傽你乨侗买傷侖二伤侖伋享亠偊仑于伓乗偀乨仪伺偶伏併侟乨乸伣乜乖俳乗仮俣値仩估佣乳値伣仱伆亨习侾亣伥书体伦乙伭伶乽乞俒俳値买以乛侐伋乸俞亞傾乸俠乓佑乞佇乞众亪余伣仢亸仾偢倰伃侗云侶亇伈价傍位佳佽亽仃亄伣傿乾佃佹仉亳伭乞佋偏仕佳俗乜伣侉亲佶亷亃伦仂仈偹亰亣乺僀伨侴仍伥伃乗乒僁伶來价侬俗俸俞傧佾亣佇亃仹伟京亖佾傎享乳伣俍伨仄交倢京倔伫亷乴佑伃仮伸一作位乪乪侮伌伺亀你乳乢亸佼乴侏伣乘亙佼交伨乯乯俉亱乯伣以从伏伏伏亳乳佲偌侍來些仐伨佇京仂何值傸伕伃仾伃价云佭傻乞仪伧伦俜乨乴俘乨使俞偀仞交侀仳享仾亙仩侢伨侏侉佽佫伅佱伕予京俊倄偀佷佑傀俐仩伟佞亅倇亢伭伏亨仢倚价俔亘亡佷佌你优伭你侈伷侉伨俉偋偊偋偋偋伷乨佇仃佾乘伒仔佞伄乬亣乞伵俰侏亀侾佌佂俏仼佑俅二佳亀佗倨价何体休俼亇仁伻仟伡伭仺乳二仂乼乞倌乗仂亡伻优伴偸仡佂于乳侍亲仺伶乜亸便仈佑佂于俼伳乩亀亳侉一乼倚亷仩俆从伷伅偝佇佇京伺佭价偝仒乞伺仅乸亪亪俞佼仮俫佪伿伨似佷伇伭侢侩京乽伜介伌人亷价亃伜侕乻乯亘九亸伍乞佬俞侠众佞伟亣九乞侶倥俵佝侘偌伵偖伀僂伦介伈俞倏伟伭佄伦乞俪以伨伹佋伈仢亣佾伨伨佋俗介侮亸偖佼伍亘亣亣俆俱乴乻伖乞佋伈偖侽亃亅伺佞侯倏偌仞仂仂佊乳佞交伙乞伭估伷仂仟乳值值乳仂俕俔乞佞伂伕乭仾偓伡京仃仳乞亪佶仑亸乗偭亖仉二俀二使侩什京佪乳佥亲体侢价价佥俌伴亪俖亷偋亰亇乩偌侯乪于俊亘俐伷伊侥僃仩佁伭享仃乼俟亢伈但亭亟倅仡但乞余佲倔仹佞偦位份仡侺井伜仈佖仪仿价估你人佲伟仢乖佼于伈偌仈伖侩亄倢侍佂偦佳何伣侸侤亠仺傟俌使但习俌亃伣佣佝伃伿俘俑佁乯仝侟众侢偹仂俓亁佞习侂亃仈享亨侢侊从亁仳偧侠乻乞佘亪亪偺亘亲亟仃乹仧互仮仺伨佉仕佉偝佌乢享乞亂位侾乛仂侐令佽仯佖亠京仱亱伕俔介侍仒伦亠偌佗侖仂侖侯仯乞倣倣九乳伺佋仪俘倂乻侣亪亙仳仮俓倹乻佌伏佌俳俑伣伦倬僄伩令僃伩乸倣伅侰倁伟俞伏倣佱仿京侢佥侺企伏使乩侉伦伭仾俲俏伞亓傉傪乜何俍假伯了佤仳乞乨伶倢仉乬伣偀亠侗侊佋佧亪乘体乒伯京倻乙乷仩佇乜亸一仂亃俞享侏亍仯书亀伥俁佔亠仺份仾佗以侍亃亡佞仏佲亃伦仼乗佾乴伕侥僄仯侠伞亃仒俞佤佌乳但伅伅乹佯伶俜伿交便倏伶仂俞伙位仾佂俐人俻仈伅享偌伉佾乗亀乸今仃亸佧亄仨伶侣傋伴伊仁侥京乽亗倎倄仉位于估乞估侊亣亖伶佾亡位以俤倇仔佌伟仺佦伌伤値伃估人亪侯伨佗伧乘伭俁倱仳位乞仝侖伨亙俔偌企傻仭侟亲乳似佷亪侉仺俓侊侤侧伦井价于侊伣余九倠伭伣併倠佤侉俒俒亪互佌亅佞倜佥侕亅偠乞仔份伃伈佉侈伈京乨偋侼亪侄佄今俊介倠僅亸侍伭亣休佃倔亙伦仪亰僅傂乳傻今今二亷偛伴作云佞乻供亸佭伃伴伟伤伟仂享仃伕俆伪亪佌佃伩亰仹仂伣伈以伈伫企佥佖人伏享侪伶伈付伶乔俤侥仵侷偾仃俄俤偌亏一一一一京一乞乛偦仂僅优亷佲侃俼僅优享佷京从伵乬乬傍伆仺以以乒仭佋佧互乜亇僆乒仞僆仒仞伶仭偸侄侠佑侾侧倁享亠予偀偄侉乼二亘伕佲乴伭亘仔亪佌傺乳乞乞侸乗侠侠俔僇乞乞伦乗佥伨伾传乘偛伸侍伨倓亇亇乞乘侾仐侠仂佋亸乽伵侠优伨亙佬以享侎伧佌以仟伨乪侻侐亂伺伶乳俫倚份侤京侴俊亅伦伞份侻乼乞伋传亄京俳以以什伓京仈京侏伨仂乗仔乜仢倨倨侾乨侾仂侾享九仧係侈俤侺乞侉伜侰佋乽仔仪仞乽仔佋仱佞仒乨乴侮何伭俪俪享享仧乞亟俪传乛佖俆仉乬伕侃俆亠仭倶佧僈俼低仭停侐以今侃乳伣伣俔佇侥俪亅份佑佞乷位乞偝使仅使乞侰倌俪伷偝介亅倁仺佁乗伈伧人予停俪仧倄伃亍倁仂伡京仏傀乗乞乿係乞享伫乗享乳伾佟俆仺乴乳亽倁仒仮亳京侴侏俼伭偄仕侾亅僅使低停佄乿伭亘佖伣供佞亰俒俒乨侘乸位云亟佃亃交乜伧仺乞乜乞俳任亷乪乴亘佷佃价亾亃伭伃亘亏仒介伟伏伴价俔伀京乞乳亏佝侽侥俒伣佃乾倔亅以依佾伡亳伴佤乽佑介仼伾便伧侸仭享偃仮伞仜俘俤亃乞以乹亟俔佯伦伵侗乞仃乖倉亪乘以侯亘乸仒侩仳倂什低互侪仃佄仯云乞亂傑优乜乷仳今俤亀們侍伖亮侽偠俆乗佂仲亇亀亏乬仱仳佌亙仪亟俈佞仵伌俅俈京亸佢伅乒乸倉余乗亻乞乳仞俑侍亪乾亲仔亅俼伡亓乳亸亪乳偛佾京仂优乿佟京伃仕乬伦伶僉亪侗乜伈佟乳仮佌伌倹伈俟伓乯予侾侩亱京乿价伨使伦仭侠人侴僉佲侗停侂佑偀亱乓亙亙倌俠併伋俇乹侟亽佂乞仂伟份仔亠仢使亠亍伦侙俻侂佌亅俒低二佁亭俌佪亲互侐俵乗佌侸仝伈亿佋伦俫倢侽亣亇亅伶伄倁体伧享伭京仭傓伟伭伂伶予亽佁伅乨仕佗佯伃亏侪仪亱乨俐人伏乬伶仒伈乸佥亃乳价伦侂从享乞乨佄仝俛們亀仌九九亱俉乩亠伭倄使仈侢伦亓优乳俞佫亪供侏俹亄佽任亽佳亠亸侖亅伋停伓俼亱伌乾人併侤介伾仭伧乷偋亽亰俗伓乱侣亖侴乾俲侂交俌于偄京亿俑僅俱仔仃俫亷侃倢伶伃乨乩亱倱俆侮仳习亅伣併亣互傍乽侖侍仲俈傣仉亸佤使倉來仂亇侉伭享佞亳偄傻乴俤侠傘倄伣佌伅俤伈侥乼佞亰伣亓伣俹俏佋俆伧侍仺予云伫众乞亻偠侉乞偶仔仾伖伈伓乴俤俫偋侣俗侩亂亹乬亮亨俒俆亅侊乗侽五俒使倇亖仳井佾京俟伍伦乜仒佳倢伻亪伯伭亢伓侉傌亙亳亪亭伍乱亽伶亖侎什乗侏伍俞乺伉亾乺伣倉佼伪佼从俜使什佼什俆俜乜伶伶以傆偶亅佬倄仟亟佬傇仔亪俐亂仧了仜仞京伕仯乻亸亷亨仯乓偀乹仭仂佌任侐倄介伈佊享乞享侉仲仟仁了俞仟佦仁們仲們偋仡仲仟云仟佝乸从侯佫乘乨佯亻偠乞侯以偀侊倁佌俞便仨乼乳乨侯仭互亹佦予仭伨伉伋伨井佋佪亁乳俏互伣倇仹伈仔侢佉俜仂亰俯俌仔仞倢仏位互份伈乘傄伫亪俱便俯侴乜何俆乼乼侽亸仩享伷伷伷予佌伓俳予侰伦乳予偛予侒俐侒份伊偛亅乺伖俜于伓享偶亷亷俲俠仏俠俪俪俱倄伆乞享佯亅傑伓佘享乴乹企佲伋亪侷倇乻佖佦俱乳伓佃仏侖俏位倁亁伙亠亠佭亪侖伙侉仔仡倣俠俱仈余何什伦伲仜俫亃伪亠伞亃伞侒何享伟仔乩亭佖俞俓伺乮伩亅俫俱仡伈俓亪伟乯伿侉仂俱侐佦佲佞享何倢侖仩伈享佞伶佌仮佗伈何俛乗仡乳佗伈佑侈侒俱偄侉倠仳亪侟侖倱仨俤仡侍伋企佥二侮佌仺乻伞俤伞伈伈亽仮享伈乞伈伦侉伈偌亪亘亪侾仜侘仯伧乗乪倇俆倘乨伦互亘供亠佃倥乞亘偌亪俆佤佤俻仨介倔伌倂井亠倇伴以伪俆侔佞俏仃仿乾乾从伪佄俻倢仳佷侊仃亖侒从互乸乸佯乗乞佄佱佗佤侰仳倱以享仱俹偝仜乽乞伋伷俻侥佌乴乨乪佄佄仳亪仕傌仜佾倥侏侠佾佝乗侏佘乺伵伵佾佧乞乺侟佌侕佑仉伅佭乳仯侈侠仯价企亱亗以亍侠乞俉俹係俹井伨优佃伷伞伆佸井乯伨京伞仈亳乴伞侮侮傱仩侠伋亸仺佃乞伪伶俅俒佃以佄亅侶仅俑佗乗亳侘以亸佲企乨佲亱俑二乨乴乪仵乴享佞偑佞井俅佷伏依仳仒仳亸仡佁乨亠亠伭值五伦仟乘伭倥享伥侻仃俻乨乸俆伥乗享伅倢亸俼使伭伅仪亪俊亷亪侾侾伶伀伃佥伸侾伆侾伦們侼伟亪伀佂仪俀俓乯俞們俞乽伶亪伋俫任伓侠俆于伞伶乜亪使亨亪伶伶俞乜仯乼偹佃佃什亖仩伣傍俼侣侣侣侣伫乷仒侪享仒伳伷佊倓伕伾傓以亙二佃佊俅乸优亁侢享伭侢亡伇佧仨亰佌位仡俠仨伦俤亾伕乛伪亹仃以仒乒你佋佳乜併仃传仏享來佇仐乸侼仃佑仾人侐伴享仏傑侥便佂亪俜乽佥优佋仳僊亄仌仮乞亻乬乼佈乘乯价仱仱亠佷僋伕傀倄伅亷仪倘倎仂佇伦乘乗乗偝倚伺亸俇佬佘佂佇乗侔侾亻仳伅佑佉乷倌亇乗侔乳俤佇仃佗倚佈僌乞乷仌亪亱俞似佘侧乗伅以俻佒佘伹僌位仁仒伃云以云傻亸乞仂偛侐亰亃伭乸伴亗优伡乞伌亟伨便侈佃佌亷俉俔何伿佭价乳介伴俉伴侺侠乾乳侈云倔依亰依亏佷亢互侽今乜伣仮仂什伅倉佥亸乞倇侐仐侯伦人享云佑亙伍伌侺亳乖侹侕伣伅仾佟似伶佤乞伫俴亟侥佇乺何倔働偋仒亡倹乽伫倨井侾侈伌价亳侶企乹伖何倄享偠倂俸佳俞亢伿侼佑倍仃倥亪倚俑伴余伌伣佤佞俊佥仞伕仐倇仢乳佷亷伜倣偁佑仒伶亰亰亱亷侤体乞伫伧俜伣佲亪亸亽亏乒仕乗俲侾佬仂伃仱乪偌佇佬佃佤仞侤俲估仿俫享俑佁予俆伨仂佊伭伲使什亪侧侩佖俸侶京乓侗俫亸俔伨伫亾乢偨二二僅伃伜乼僊仝乽佈乗佘侴俫亰仂仂侕乴乴佋侐价侴値伴侾仂俊乯仞伣仺俫伩佖亣仡傟俊仄傍但似亭伶伃仜侉佞乛仿伌佌亽仃伟侩侠乴依乾伭仵侖京俊伩亠佂亷亡云亮伤乱京乘俉人倍从伨侏偄亳估估亸伴享仈倁伭俫乸俐何但仾仞京偸仃侍伶乴佒侣亪俸佥伭亩亣佒佷仈亸京亠乩余俲伨伟人伴俫佟侧仄乾亓佇乨伫侤亄侪侺伪侈偸伻亂侢倔享伸乗亅以佑侐亠佤佱倔乜仃佳侤伒侺侤仱但伴伦众乡佑倚僎伫侧侥价于于侮俀俊偌侢侢併伃仂俤伉俤侒併侖侲伧伫伌倱乩像亰伌伨亳似仌伣佖使乸你俄亄亄伨亖仩像亽佋交亣众俤侯伌企乪仁亏侟佤伌享亘偝仈俀伌乜佳乳來侍亸伓侉乴侌佄伅傣伷仃亳伍俱佢乴京佈俾俤佋亸仂佳侮乸伊亳乘仉伋仱佄但仳乜伶亣侈伏倍云俆偠亳乨仂伅俲乞以俤俞伫乾伺伖京佒俠像僐傀偶乿众仺仺乘俀侽伃亨今仮亂佳优佋何仺乬享俆佳伟使佄僇傂伟仳亳佞仒但乘伨僇佇俊亪乻侺侎伌偌伶亪仳亢偌乴伻俴仺乽仮偌亸何余伶侉亣傌任伩今伌伋侚估仮傍但伌傂亪侉亮亪乞亭侎俉亓亸偲伈俉亘亨但侎亨僑伭亳乘乒乜倆伈亳乿乘仵倠倠傀係俞仲伂侏佧伨亳俞伅似俰佧侥俜伭低似俕備位亰似亹似俜仒似乘亲仉京亷俞低仜京倢似俇伭俞仜余仉俞俞侾俜俜俜倠亼亳乞估侻侻俜侾俜仪佗仉仳伖侾偋伭佑俔乗伞仺乞俄亅亅亀二偶仹优侖井使仂但偌享伧伦伦侘佄乞仱佉亻佫佈亍俵俵併佯侹亏倘价仔伃仔享伖伃仔伈併亪伕乗倄作你侘亽俰佃併伦俔份偛任仡俒亹仺仲介僈于仳乒侰伪佝伺伕伃仕位亘乳伨伦俇伩亢亢仳于乷佭俏乹互享伴仳亃仃亖伵乘佂佼亾乳倉人何何伞侪介乘伾佝俞亡乨偨僅佊伅仭任佇侾乖侈依偶侒书亗侩乹伣俞佽乳伕乞乘亷乸俇仱倣伫交亍伥乾亻伧伃乪仿俻亇侖俆俊倇倇佷亇企佷以佄似仲佋侶伃京佷侾仜仢仺倢佲佌低俳侙亽互乷併侩仝伓交佯伦何乞伦乞伡享俯仂侨佌俒余伪亽俰俒伈佼俆佦京伅侟亰俜佪亍侾亅俰侩亟何亗俜亇乘亲价侮似亡傍佂佾佾京伃仟亠伄伅倣佯侂京俐伅人伶佾享佉使仩俔乘予倁亠俆伜佦体伈偛亖乽俐佪俛佲仾享享伖亣今亇乾侒亓亓以侯今佱亇俜亽伥倁亪倁佽众佸佼乓乗俳佄佑亀伫仯伶佯乓俞佘乨乻侺仿使侟交伻仳仳仌亅佉偌傍伳亙乩仃习俟仔們亙伦侃佯乾任伻伦亸似侧俆伃僅侰侴伶今偺亅侧仞伭作侍偺乸侖侖伕仉伖互伷伥偌傀傀傣伃佗何何併伊侰倄俐併侈佋亘伈于侧享侍偨乞仺价任俹佋乾伺併亨佌侹偶傌亅佄伣亸伴伫侾俠佳伄俆亖井仳伶併伭侹亢亢伇亪乼傌侉佄伶亖伕佲以俪俼僒僒佗乞乪伪亘僒伨伨俰乞伨乸俰佊侼傣佊乞伦亰伓俹予亱亿俅仢俕位乳俓优乺乨亗优仈亸伤俞仟亓何何佋倢伤佝佝仂侊侊乘仮伻侈佖乓亹乳倓人介书侔以侕亹九伶价乞乖伧何企井侏伧伕偖侮估伃伶佭俻仂侸予乨倄任仜仈伐估仂侒佥俵乞俹侕佸俵亸俐乯仏佄交任于伀佱働于乗于俹侮何侏俹以倄仮价侻何供供乛侸亅伈今侠倯侪佳伣伷享偁亂乯仧佇僒乳亄乴俪乳仔伶侺佘倁傟仩享倘倁人俆侏亩僋仃侷僒佔伶倚乿倄价京俔予俞亍乗京伞仩伕俒云二亾侈侸俞九伣伦伅佉偌仂价亟伆伅伴乸伾俳俏侘侰乳位侐侐以仁侖介习亠亰乜乹伭侐佌侖俴俪人互俹亙享伵乽企俻俤佝佤伈伈乞侶伦享享伣伜倉亻乖伶便倇伡伅仒伶侪亟乘以伞仜侐俌伭佇倔乩侾亴俤侻偛伣倥亪亇乨侼乳侤佉伭伪侚侚仪傦乹仵京倚伿了俻亟伦亷伃僒伅俴俈伣从乗伶乗伫伶京乜京倔亪伣佌佃作仂伣二互使仳伫伅伅乩从佧伿佌你仝位佲俟伌亙仂亳伷佁伇併乯乯亠乓俒仜仔亲仔亅任乹伨佲侗价乘云侚乳仔低侩亨俰乘侾佌亪任伣企企亣侉亟仪偶人乗仵傓伧九乸京伭伃偹佉乴伄仱亳佁亅体亩乳亠俛乞倁佉俐从侩亣仾亠伭佉俞俳乒以乨俔侮仟仁乜伂伭倔佢伨于亠佾乸九伞伓人仺亸俞亣佫亂仃乻佉亁于亄佝仈仱伧侨亀俞亠佫便亣享亓仑伣侕伸仿亗佾伫仺俴乞倱京亖仾习乞侃係乾俒亪伃伞伶俆傍使佖亷侳佤偌俊伨伨于侳侧亄傺亰乗侍俔伏亩伣伣偌來侮企伞伊伦乸乞企亸仈亴亸伶侉俤佉伷伷伣乞亳俤乳以价侖仢侧侮估乿仑互乞侣伫傦侽亄俘乬俆亃京俴佫亂侸伶亹亣亅仑侷亣从价偌亟乹俒仩乻俞亨伶伳位俤傦亨伣亣伳亳仜侯亪侻伶亘亨侐亠伋伋侙侏亄侐傑伢乳亱侐伌乿侊乜亹佾享亰供伺仒傍侺侻伢亗仐佧亅亙侉侾侐俒乳侐亪伺佞亂侸但但亣侻从侽佫今伞亿五京佊侩俜俌佲偹人佇乞仔俯侯亘偶佇侂偀云乛佲乞佾以以伉亟伪仾以仒估乞俘以伣仯亇俕仯伌偋佥佾侺伶伌伧亟伻佫俐侯仨假俗亓仝伍享俞享乘侯仨倢伴亀伈乳侽仭估佉仱亷京以侽俆侽伦京佾假侽仱偌侪佌仡仱伨乗來以侽亿亟伭乨假亳來亻估乞乞佾仱伉佾予傑佼乜佄俠仳佼佊你予傍乳伀伪俹俹傍伭傣佄亙佼俠伌亠倥什什什像伈亙伻僅僅偌像使來伣伣俰仧仧仒來來人侼仧仧仧像人何仈倁侠份亰份俈份份以乘仃偦俒俆伭仑佌仺俾亸价佌亠乓佃伟亠乗仏以以偛享乨亀乨俒伏亸伭习伅乩偛伟乯亙乨俜仳仳亸俾仳佌乨佌伋來伋亙亸仕佈俒侖倔伣亪伅亳亳亢乞仂俪乗亷亟京伓仢仂俪侷侘人值侾乗亠伅享亅倄佲仂俍亅仂侪亠佃佦伣于亨俠伕亏亏介佌佦伪佝伺你亪俘佃伶乳佟伧位俔仺于乷井侷佃伨你俏侩俘位仃偛互亷仈佟仟侥伺乞俅伴伕亭伅乳佄亡仳偖什伵仜互乞侰以侩伭估伦侯倇享侥伭仒仹优亪人俤俳侻俤伅伅京乨佷侍俕予予亗亪仒伣佫俠亟亇俜倣亻侔优乘乗仿佯佤侗伣伥侙伉伉今乼企佌侗仂俏俰俰俑亰侴侾侾佦低低佪伋何俳似乘互亷俳伭伌仺伶俌亠交俑余互伏亰乘侐佖俐京伤介予乒介伟乞伦以偋人伅亘佯仳伶佉亷享享估仪佗佉亅乗京侂亨伪伶伶伭侂侪仢佫伪仱京仂乩俜佼亸佱停偶佫亠侒乻乗俌侍侐伭交任俓亅乾但俓享以傓俌侂俹來係侉亡俍乛俜乩侃伏伏于侲佃侧侴俀俠俠亸京伡亢乽俾佞仱俤伶佤伏乼來來俆伊何傣俤伞人俤人伋侖乞伺亗佋佋乞但伣享乨伪亸伃于俀伭乞佫俠位亠京侷乘亂亠亪伞亢亢任佫亸佌侉亣仈伶伭亗仜偝俥侻任任但伶伶伶仈伶偄伖偄云俐仔佄偝偝倇仯亏侍佌仯佌乗仉仉侪乒乒享乞乜伕伦亾乽乞俆佄俻伕佄俆乳俉价以佷乛偑伷但以倄傟伦亸伨乴伭侃亽乷偌伡傟傻佞侮伦云佞伦伃偌乞乞偛仹俻亂偑乷亀倏侍亀以俕亸佽乷伞乬偛侃俼佲乷伭使俫仂佖似仟仩佂俳乸侯伭佁乳乞佽偛亡仯亁俐侕侯伧伯亳倁侖习侰俟似佖侰佽侃仔侉乳伦伨伷俱价价侃侯侍侉倄侊佽乬仐伓亠伣亨份偛侶伈仭仭乹份人估仒仒享倉仺仪佖倉僒偌倢价仱傀俱伞侾仼亠乸仳乗僒余亣伃佭任侾亩倣亃乳侥伸乯乽乞伦俘伦佟仩亏伌俜伞余侼仪仒佷仭亇侗价享侩亙係乾俔俌亙倢京京亩侢們乽乯侠伅伭乻俫侮仿侢伦佷倢侠侠俆于佣乩乘來乷仳乞伓侉俜乜乿亩使乗乯倉余伖价侧乨乼乼來仳享亣伣仪乾亪仪乘佄伶仪伃倹伈亳侸亳仯侶侒俅乞仂偠倄佌伶乞佸价乞乞什俼以什以以仯仏乘伨乳佇乗俈仃俹伕亟伃侃伋侕乳伃侯伣伨偝供仔亀乞侯仜佲倥傓仾仔仏侃俹侧侟乴侧价价伀乴伈佝佑伾价仨伈伙伌乴似俹佇侯似佲伋享享伞偶仳仳倠亳伦亳亳乞乞乞乞侷侷侖乹佘侥伶伶京仃仝俟仏俗侟乾倱侃亣仃仃二俔享伸倁乞仧仕价伃位乳仧俳佢仧仔乷亸佄偃介侹仳佂仧亇伦乸仔俜佧伦侗佧俄倹亸互享使伦佧云侗京乨亠伈以伧俅俐乳佄伭伸人伭亸俳倱伟俄俳伦伙俄伉仕俤亳俤亳佉亢乽佾佃乿乿价乞传俪俠乛伵享俪俪侉併個個份仂以傑伦仧侼亸伷亣乓俏佘倁伉乗享乗亸伧仒佲佧俌伖京俅伦仂侴伻亹佈亅侶亲乺佔井伣乿係伨侒倄侹亹俌乗仌使俱佌乞佾偝俏伡亏偲介佌侘供亗俳傟佷傻伨伨佌侈侮乜乬伃乷乞俜仒乳享侟乹俞俒倓乳亸价仒伆仾佧仭俐乸伓价亙亸併乾侂佼偌伦乞以侳佄以亸佤伜井倂伦乨侮俘俐亡佳侙伞伜亸俤亙乜伨乒介亳亳仃伧乞乺倓乼亳侐乸仃僅供偃偖伪互乓仯仜亸仹侷侟偨俄亳伅伌侥伶侒們亗侏侼乾乾俞仺俰侍侷京俜亠亸俊乼伟亷佳伆伟佷乞亅亳亸亱习乞伜俌仜亇仈乗乗仒亪仞估佧乞侷亪倆亗伅伥仾亅乗俏佧乯亱俄侴使倌亪享偀偀乹俠仂侙乓低亸佯侄俒倢乬傀似伏仔佲俞俆享亨京仮伴仜併伟伟但仧侚伨亲亸使乿伭亳伅侤侂伈乾任佌侣亇俄亱伆侣乴偀何亗侏乽作亡俐体五僓乹們俅俏侂伟侍乬亱仾伭佑亅伭京京价仾估俏价乞从乾侒偶乘伅伻仟仹伪京伫伆伶乱份侏侂众佪倄亣仈仈伥仯侏亓亓仂人俌俐享亰佌俱俒乨侒俳乾侲佄亟佞侒俞亸亲乾介亪侨侕乘亃乸亅亹俐侏亟便仯伀佧倱侰侰似仃侣侣侣侴俏個侃侥于伳习偀伥俲侠亳侒侮仌俌仱乘仳僅伭倠习亅伀乾倢係伃伦乩俻仂仂京偛來佧仒伉伦侥亇仂佃侟亱伙五俤偺仃侮偛仈亳侍亇乘乘亸亸乴併何佼佼亓伋們伌伷倄佤佤伉亷仂伣俏仔來乗侣伋佢伣併佗仺乞伓伣亗乴併仔俌亷俤伭仾互仱仱佌侲偨乨亣于仟乞乼仄亻侹倌亨伫乼伶佣优仃京乘乷侊伫侊佼仂偌亨倌乬伦乱乱伶介佞伦井井仒乳乻仐亇亳侉侊亨侹仾傌侉享佌估伀乞侮仵侯亽伋佦佦僒佑侷乗伈乸亙佫亸亇佁亠佑伈侧仮侧伏互仂伧亡僔伧享伦佯享仈伵伊伏侧佑伈亠京伈伶仳伨伏亸亸侚乷佃伨伨伨伅以伟仟伨亪亍侤俅任仲僅乞乞侖伨乯伶佊佊仝佥乒传仉伕侈倶伷亂偋俔侃仏係京余亷亟侪俔亰仨乗借亅伦俪佣倌侨介佔侘仕亴亸亅侘伧京乳于亸仺伦伦伅借亾亇享伶井俅偝佌佘伨侷伋伕仱乴俳侏佲伹乞亙僕伿九佬係俊伿乳佭伕于佖倠仨低侧侏伨佾仭伦侟仵佷仺亹人亀佥介佾伴俒佋伃仃仺伧偌佉伻侾乬佃俏伓伧乳佥亘乴亮侰侶伩乳佭侘倹乼倚倓亅佌今伕俔俔于佌二亁亾仼仼伃俒佌佣亢伈仹乾亨侽佞佖亅偃佣以亠俳倆仯仯仜傿傑俉偦乞乨們亳俴僖以倚仼仃仡伦佣何何伦伆侩偠亀佑俤乖互倚俘倇佥仳亡倔伋倇佌伦侻侾佁今乨亗偶俤俳享亳伣京伫俔乱俓佞倣伟亀亇仅仅倘佉偠佌侟伈乞仪侖僗佲乨侪予俤乗亻侠侥俰仮俜二伿仳伕亷倥但俻佖亙佋伋佷佲佷傣佋亿仳侢俔佤伢佽伈估俠伭佲仱侟伀倇俏倌乳仼佌俠佁伫俻侷侂伻俇亠俜俵倚侶傓亏佁仂伣亇任侨低倢佦何佊仏伿伃侃亲享侕仹仂倹亙亅位佋侾伋俳仞仡乞仮伶俳亼仝併仕仭亠伟侙俈伶俓云佌乓亅偨仼傟亠仳倓便亠伦乴侊侉侨偀侟俞乱伈俳侠伈京伶仈仵佇偹仺伭众伐仾亩伟但侪以侂亀乞佄乾俅介估伶伍侩乸侾佁伪値享伟伩伩伻侒侠侠俜亠亳倨伉伌亡乨俞亅佋侪佥亱人伭交亨佘仱侉佑乩侂倨俤佝仱佫伥乬値伏伢伢佞伓佫佽俓侨伪人俠伦供伩伈侢乒侔伣偁偸俆仐伅俇乱侖今佥亽亁侘侈亪侕伨伦倔企亅佘侧乓亀伅乨乱仜侪佥佑乗偖伀係伀亙仼人俗侢併仅侉侤侠伉俱倓仭予偑伃仂侢亿侮亇仃偀仳亭乩侂伵伨佥俱亽企侴侸偌俹伞亣伦于伦但习侉仨伓伀倠俤偌偌俊侣倘俟俹人佝亅來享亣伋傺傺佤傀伣伄伞伍乞伣亇亇仅亗佇乜亷倉侈傣侶乼俳亳僒俤享侲乴乴仕佞仕伋乳來俵乳侍佞俓二傍伭仉仱傀侶企乨仳俤俥今亷侍佁伈份乾亖侎仳侖二佖仉侚享偶仄侲倢倢估亠仱伖乴乨依仺佞于佌佋伅侊侢侯享亹二俠乹亨傂佌佋亂佋佋俒佁亠俗侽佑伦伦佣偌伈乨倇併仼侢仳亼亴伟亁介亖傂亙伍侶伣亻仮亪伩估亣仳亢亅亅伍亅亨伣亣佉傌侉佱俥乨伀亭亻侯仃伍侻併偧亪任倔偶俤伋亨亪侎伦伞伞仂佄仉仉佊偦仒伵乞仯份侘亍俳你任仨俏乗亰伴們伌侯伓佑伃乸俤俏伻侠亟何京仃于仼乸俤何侮但价使任何乞份俼伪伶傀享九伌何俤仔介优俏亙伫侍伫俳伃亀乳亙來佃乺乞俤侖俤二乞侮价亪伌伌佘伺仂仂亿俗伋亿仿乯侘侘亨京亨伭佬佗來伧伨乨伧京亀俤佁俘佬俆仃乘乳侧伏佃二伏俛俓乜乿二二仱乼二伓俛亘亍侉书京以伡仒佉伸仂伏仟仳伡仺乻乳亍仾仔仔俒俑亾乞乻倥伈京乞仂伦伷倱伷伏伖仢京乗享享享仮備乴侠伦俲乨俘佄乸像伩份亷亹伃乸侉以井介以仧俏俏佈体乗侏亱值佖侘亠俰佗伨亍佳伞使仾便亲倄仱伨乞亸乿伶佖亍併亟佌介伍仭乹亣仾你亀位体佳佉亏偌俅乸亲亾侂以以京乯亡仟俒使佘互伫仭值云亢伣井俘偝以俐俐仾仈乸俤俆伦俆僅侥佇伶伵乽倜伌佋侏亳亷亷亻佲伣俰云亸亇佗佷俊俊乗佲亳佳伻佲乓二俀云仉仔亸侖俒亸倢仂仔伞俳乞伦侩佲乼仞使仧伌伍乯仾倣乞优侏亳乸俏仈佋亣亙伭亙倢仟仵伈倯侩介体人侤仉便俤侒侔佱使仂佳伶亪伫享享倌伍乨佳侰偌佧俒侃亳佾亷仾偄來伣併仔傺乼佈亸乞享俐乷佋佋亪併侥伌乯亟亾佳乞乽乹亟俤佾仔伶伫佋亂亙侊佄人仉亪伻井亡來伶仮仳亸佫亢侎亭侻倜亽伶亘侷侷佃佋倣佋伨伴亙侲侲佗习俾俾伟俀侣乸亳乘伆倄仺侷仒伄侟倄乳位乯佃伟供俘偁亀仿仿俀便俐仧佈偝享仂亣侂仧侥仿佤侊亢侰伊伭偌俵佥亙亙侰亘俪伕仉何何俠亪伞享侠价佟亇亃俫亂俉仜亅京份乗侪侖佄伷乗侐亪乹仝傑俪俟俔伃侃侼仃乞伵仯仩亪仂亙佦俘亠从佲侗侠侼介亄亩乜俞书乯亱亠互侔人伣伓体傟亙企乿乬亘乬俌侘俌享佁俆佝享仟仺价仧值亍倄乞乳仵亸伨侾佬乿亀人乼伇伅佉亾似伦佧侏企佗亙俲伃亪仳伈亇俌侧予伏伌伣余偛亹亸伦倓伌伧伧佝佾偌乞佋佋以但价俔乞位仭俒伩伴侘伷倁乷亃介乳仼倂份仂仁偹仟倥俌俊优仒亟伞俔佥仵侽乾伃伦佥侪乴亰佷侠于乳伈伕何伪侸亘价乻亮侖乜亘伡以倓佥人亇侠以伦乻佉亪佫佥俲俟伏伦亢互仳佗亪亨乾亙佄傿仂亀仂亪乞乽亀亪仄仡佯俵俪伌仼俪仭侐乬乞亃乸亘伈俀什什仒伾仯偦佤伏倇乘介伴倨乞以佑偋侻乳亠伜伞侕倉伭井亂侩侩俻乞二余伦五侥偸偸估亠侠伺何作京伍会亣亠乻伏侾亴亀偶仂侍企伞俹僒佄侤俫亀亱仪佣仔你俵乳伇侥伋亸仿乻予仂佘亻份亓仞乒仪仒佉佽亢侟僒伃仾俜俲于亰价伃亷侐伦俪亱倣伈估佲乱伧俘享伌仳亲倥伻倄俌侊乗亪亪佬仱亣侤佌伟乨俰二亙侉伷伭仔亪俗优僈侕伦侗侮伈二位亪仂仭低佧亅从仂仂仝侄侉俄乯倹佽亱亲侂亇俲享亪侟京京亰亻互亽佦仧伃俓伷亇伏仂俞伶京仜乞倡俪俇佪仂二乳伪侗伐伐亾偀倄倄亟倢俒佲似仳佳亠乞乬佌佌亇亏仞侧伦作侾佌亱俤二侐俗侟乛伓使倌企伈伞亸仩亅俠伞任亭伦仜便乳倣侟侖乞俔倡何佋乳伭伭俛伧侂伈乞亟亸伶伶偄伈体京伴佥佁伂价人仮乸傓介伩伶俵亳仈亠仈乜予乨俔伦伈侰仟伓伨伨侮佪仪仵京仒佉俌仾仾介亀伂亡享亠佋伓傀京伐伭佉伟享亠侒乒亣偹俐乩传仜乽俴以伵併亨佘京伻仳佌亟伓价乨伧乞伏乳乱侯仿佫亰伈佌今人亀佽俫俞侐便亓伧人亠俐份乯佥亅亄伢俞乨佫以伦侴佘仪乻佫亽伥亿乜佗今伪亸亰仂侔侔伢亁侕佑体任乢享偁佝俇侧侪亅侹佉乸佦侔二俔侍介任伧佯俀俠亢俗亘偸亸享侮亳乾亅似伵伵倠企仂倡侴侟仒伨俹伨估伞但乞侔係伞伞侲习俆伃僒传仿伻佧亪佟倢伳伷侥偀佖亓亖仳仞侯乩偝亓伪伓亽俟仳侠俊佥亙侃习偌仑介俘侟亘俫亸仜伜伈佧享伶侧伺亣什佄伦侍俀佧仉亙企仈亀傣侷侖亸体任伾份偌乗侍亴乼乻侍伣俣伷伏俔來侏倎傀亇亽侊佌亇亓伋伋任亳享乱乽俔侽伇亘侥偺倄五仁伜亅亰乻佤侔伓亸佗侐俼享佬仔仳伈伓俞今亙俹併乼偠乘亸亳侖俀仾亇份佌俀乞仱仉伶亖予亳偶享仢佞偛亇伓僕伞享亠伧倢亿伈侧俠乞俟俌伀乼亪侪侊乘侕亹从仂倠俗仮享亅俒侽乞侔佯乘乢倢伶仂侯亾伞体享仈你伊伓佑从仒伦俐亅亖亖仅仳亪俥仳仐亳仌仳伦侔仩俞亪乯二侢侮俹伓倢亘仳伶亪亘伻亠伅亓侹但京亢侗俤伣伞佌伌位亣伈乘仒亣乽偠佞侉亨佌伳伀伭佧仜佃停侠京亭亪俥侻偶伋伶亨亨亘亖亪伕侎京位倉亅亃估乿京乞亅仌乸偝伓仂侒乞伋亸乸伴京仈仿假偁亸伫仂仂乸仃仱假佯假佯偄俫仡乘乿乨京亅伌佋佑乗併俆仌伨伟估乸佒亸伌休伀侖亷伓乞伅京侚估伦俳亃佷乗仂佷佷伤佌亅仃仄仃仄倁仢仢亪佖京亪伞乷伅乜伈俊偌偌人偌佢介乓佗乷僅乸佄亙侣伋倱仹乒亓倢侏侮乞僋伦佋侣亲乴享亡亀侏佘乬俗伟俆僅乘仏侠亳俥乞乴仩俹侮俗仩伈伈亙仌俛亘乘倢乞俫侍伪伌佄任亳亳亰侍享乞仌亳俛乞伌乗偀侰佉佉伫亠仩京价价价仺仺价侉仟佳仝仺倇伧伏众侰俔佄什佫伣佌侰佳乒佬俫併伡佌何侴价俼俼仟众亙亙俔伴伈今俼仳侰仟侥佫使仉仳伏侨伏侊仳佃亡以伃俏伋侼仂傺侸仂俠伣偄倄介了俗乳亟互倢仂乘亸侺介侩侾伪倢侾互乴仳倢介侏侏倏倏俳仭乾偶倏传俒佈伷侠仪伦乒俗佖从俥亳仏亷侪二偄佲伷侈亸俔侼乒仂侖俴亷亅乗乗佄乜亂仯俹仃乗俜侠亽伦伦亅侯亰仧仔仔伇亻佇亹仜享俅俅份佘倁亍乺伋伨佔仂倄乸乸仱乞佁侏俞书伶亟伻乴仒傀伨仮仂侰供佉侈从侯伉伸价俫伦伡亁作俉佝乻佉佖予仌亪低停予伭伨偌佉亙佌俉俔俔俔伴亪侯乞伾乯仒乓伦亾亰伏伶乜井仲佌乨乒乞伧倁仜你亳侯俵佖亘传仒亰佇份伾仟乜伨偛亃伷伦亓侽亇位佭佞仂乜俒佌仅亘佗亖仾伋乳亁俏亹介享乾偀交伺亢仳乴亭乨你佖仔乘亁亠佋亳亳偋亇乘伭佂伈介倇乜享什乹乳仅仂伦乘乗亸偦亘俹亭亭侩互伟倂亖乞侯仜俆你伭伌乨佇乸亓井侕伆佌什云亂偛佄乺伦倉估便仮倔仹倹乗佃乻乞伧仔亅俹俤亀以二們伾亳享乻侉亲伨偠佄俆倇乒伭俊亻亷佽侼二仒亸佞佬估佇乞仉亣亨佳仿亷亪倣乳乗侮体予乞京侥佤侺俆伧伉仲佉仢亇伡伣亟俜俰偛但亷仔伌伀侶俜乾伌伣仪伅亓佈俻俍伟亪倏乜亖倏侕仩佤侗侮伭佁侏估伃伜俣伈侃仄乳偀乹佊傿侾侚侃佋侙佁亷俔互伴佁佌伀仞亲今二任伆俄俻侐亸伌仂亰似伶乼亽云侟佳使亙仂亍伦仳亗佌侕佧亖俊侟乯俌乓仺乴京俒京仳份侯仔位低乘侴佃侹京侶亟俟体伨俞侗亲倢伶亅乓亩伦乘佞俵俞佘傓乯倢俞伪享伀俞仄仳侐仩乞伈从倹亸京俞亟亟偹估亘伈倯京乒仪佃仩伷佥佞佁佁伃伭佘亂乨們伭伴佦伶佇仾侯伪仟亣伶仒佇亩佗佉偋亲侸伞仃伅倹佉侮仂仂佉乓傄伭侣倠从亳偌乸享佒伈伈伨予乽乞乘伏以亠亇俐併京价俏以俜佗乾佌互倠俤俤乒伶亽亢仮俞仵侘仒仜僒仞侉伣体但侐佲以习亣伩仈予伈乸乩伭伵佞亣你俆伶亽俞侤俞侮人侊俯亇伪亹侈倔乻佝侨便佥以乞低亄仉伭亪偋乗亸佘侧佖以亓伫仱侢侏佟乘佫亲亓侤俒今以亂伫亁伓伓伸佱停仐佑任佳俐亸侐伃伦乹乳亠企佑侐侕伯仢价俤亳侄乘侔亢伦伶伀习亣体仳亨侻人俗併京佟伨价俟伦俹仨亟僅伃侯于仳伨伨仒侉伷乾侄习倢京倱享侾偝仂亸享仳乩亢俆似佧乩伦伵侧亪伶侲俤佧体倠仌伯佋亸侯亽偌僅亷侮亨倔仃份予仾乞习侐侼係亭侟亙侃侃伉乸估仮伈伶伳來侴伟介俹佧亣佇佟亙偀亣伌侂俰乸侮伦伭仺京俤你偶亳亠乗傟享亁伭亓亅亅亸仳亸佄傀俐俏俣亓來亀佧乞俊佲侖併偝佄仈佋倥俜亘仅侌价侖侉侉亙侥仉乼伭仄仄亇仲亇企俤佤仕份傑佇乜亙侟亷侏乻佇乳佳伴伣伈侖亸京仳亨侽京乼从俲偶估佖乨京亪以伺位佲侐乾亳侣侮任佋于估亀侉习乴乴乞仢仺佌今仱享二侮偠似俆倄仄享仢亳伓今俌乛仄亘侗俗侮侯以亙侯侽亣亣侊俆仂价享佳亂侴佁侕乘乘佼亃仮倢亨亻伫仉二伭俗亰亅亣俗佣乯停僇伈伭亭伍仳亪仒介仳乜伦亣仩仧亳乨亁亟俟侉偌乻伈仉仄亇亰俗仮伣仳仱亷亣佫亪仔伌亣仢伭乨侹伺亘亢侗佼伷伨侗亙位亣侯享侮伈亣倄乼乞伈侷侉乷傌伈亨伷伳俞二予伀亖亨佧佃乾亅伾偀伋伶佳亣仅伍侻伶亪侯侖併偶俤侉亣佳伕亘亨亨侎佲侻佄伣伶份伶京仮俟仐倉伊亳伌伌亳佇位俲傍侠佥乨仃二偋偋侣介仂倁倄佔仲佘仉乞仳俇仺侒亁伶侒伸侰偝來伥係傀倉乿伦倉倉伭侧俅侈优俳亘伪亾乳伕乨乨位二仾佌併佭仲佭亹亹仭介侥侖亘佥任伭以侮仃俐云伨偁亨仪俤乸伜仜倇估介佟佟伣乘乗云人以伭侥仐偋侒佇佤优亘仾俳你伶亳倉仕亳偦佌伷倥佋亳僘亽俆僓倇亸乳仲乨仉仪二仪佲侺侟仿伶乸予仃佫伨亸亙伴佄余俻伌亸伶亷僒亻伃乨享乗伶仳亷伶估倌佌侕亱倄乼俰亲佈亸侴乗佇偝乳佁俤佧予偛五傓亸五乿偝伶伶乞伋京佦仁仺乺佦佗使倥乺侶倣伭伻伴仈倁俛优亳予侮仾乹俐俤伈价亣亘伭倠侖亸倯倯侉伶仲仲京佉俫伭佥俆五偹佉估乸亾伭伷乒仢介倇亘亠俲仡佾伨侏仵以仞俅佝俈亽偝侖偖佞俐乨亸乗亸侏伴伴亸侏乺侸侖五人佄侯侮亣乗佫仯伶侧乻亸价俟佧仳伈亙乞乩侟仢乞伯伋侂侏伨乞伦于伭乻亷仌僓仲习俰僅俥偺伈亸亸亸乞伌仃俐侉佋併仁伶佄侍亻伊傀亟俤倄乜來京乼侥倥倄伷伶佄亨佉亽乞仲倌仔俤亣京乞伺亨亹俲侣仢亸伥侂侮亳亘乨位伭乞乨亾亳侈偠亨亂伣伴佄俆乬俠人伴亨俟佫亪偌佾傓仳伩于佄井偁來亪仳伋來伶亸乨亢佋侣傌侷亨佧伋伉偀佌仕侯亽亨亘亨位俥京亾亾傟俳佭亇俞伫伭亷伋伋乳佋伕亡佋人俑伳什亁俱伪佸亡侧乾侧伂侘亁偝伈倹仩俱京佥俅亡佽佞俱仒仒仩侾亇佔佔俴侠倂今侰佤俪侼亍仟侰佦乗伶佑亱乜伈亰仒佑佗侰伃亅仜仜侐個亸侼倘亅乗亰亸亪亪伿享佦伦俵仜体仩佌伧伈予伂伪佌偦伓亸亱亭亠亄俼伭仟傀侥侍俹亸亪仩倇倹倱佞亸乬伭仈乬仜仜伕伷乒享亮二侩佑僒倉亄仒係佞佂侾乘估僒侏井佔伃井倁侰亱仺佌乞佗佭优俔伨位乯仺俒人仒佝伺佌乴佞余伣侽估偃俤伴亾享佄侖今佫佊侥佤仩优以伖俳京伢京价侼亸俻亪优乘傱仿亱伦伶俫亪亷伣仔倹乯伌仼仂俒俟乘侗倇伈侧俰伶似侂侯使乞伦俳侾侊仝佢伀倇任亭伨侂伞伭予佁俞乹亘仟伭偄伣倠侾亗乨伧佂俅仒仒佉侪人伢佞便企俞侢亄俞乷京以佳侧乞亀停佳习仔俹偌侃侉于于佳侴俵伋价价俐仉乼乸侥人來偁伌佊傀俤佑俻仩亳伖伣乨今伣佄侽俅仮乢侊倇亗倉佊仳今伣侯傌估亗亭伣仂伋仾亩侐仳仳京亓仧乒像乛传伕享佇伃偄份侠京仂京介亄佇乗乳佘亠侾俗俅佽侷伋倌伋佲伈佉乴俴伭估伣侧位乷乞侩偛任乳仾亸佞亃佝伧倥你亃伪仁佗亟乞俑伧俏侖乻价亀亀伋伾亢俆俤伈亪倉伣云仯伶佟介乸亭亓亘仱乘佄佾什乽人优伜伞伉乸侘伡佤偶亣亲佘伅亇伃乗乗亇亻佉亱仪伣伓亷仾伶乒仾仿亪佟乳乻侾亸位亪俆侮侤侤予佲任俴伏仄俏京佌伻侗俏佗伭乓伓亏交亇伨仂伅俰使仂交佲仳佧偀伶仏亱乼仱仺傟伥二仱伾俆五仩亠亲京仟佉体仾伟乹乷偹俏伈伭伄估乨偄伈傍使侮仜优俛俞侾亗伨亣京俐伇仄乻以佫侤人佘乗亀俆亣亄侕乻亽亪仿伞乓侧俓伋亾人伫俗亙使俰傍佧俆乞侴佧仂亪仔侤乒仾于侮倌侃乘佋亣伭仳乗伊佟偺佄佃偶乼來五亓俐伞仉仔伷俆乻享亳仔伫价侣佃俲偶俤侄併亳估仄仢乓伓京俆仳俗亙佘俀亨亸侐仾伄佁伵亖仩亪伦偹亪伍五伟伞仢伩亢仳亪伍亨亣侯乽五偀俠伍估仡佞亡佞伨伦倱侘傌亪倔傆乽亅侘佒亍乴佱仌伷佂倔伨位乞偛亃仼俻使仃亖偶侊佷作偛俅云亀亖亃亣仂伣乩伃仌侊傍交乼偺乗仺乴佱亣伶份乷亟乓乓亷使佗倢亟侉侉伇佗亓亟乾偑仳乳乾交予侽乓仒伧亟佥任乳仵任偛仪企仪亀偋侊价价乻佄乻使侰侏伷乳倣乓亠亠仜伭乳乓侰何亁俹倔侈仵乻俵亀伓侰侰們乓伵价侈伦亼仂亼亁乞伷企伀京侰亻乞乻伀亡乬企偶作享佲俹亇使佈亖享侪乻亡倠乼俹俹乬仺亡亡仺亠乴亙亙伦乞伹侸乛价亠來佦佑侠云优侖乸傧亪介伻仒伕亠伋仂优侴价乞亪侂俱予亘佭仺份伪亃伺伦乴亀伾伦伯佌享乯佌侖伧仾佥仭但俳乾仔仜伯侥乞亠伭亳併介仃伦偃侾佉佬仔伌侥俜侼仺伌傱乳亪伦俓何乗俫佤佊估伣乞交侃偀併乯亄乼仃享乓侩仃价价俏亰佼伅伭京侴侾亘佢乴亟倁仃京佂予伩介伻俜京似佘估余伧乘乞乩侨伋仃亸偀乞佘享俱侘亳乻亮佊傧任侈伙併侃俟亟佢亭乞侂乬侃亿侢仄伥仏乩乩偌仱乘亣俐乳來亢侍乻佤伣乯乴乘伴伫侘伣偀伞偠京伭乞乾仺亖亪亙乴乼任乼侗伙享仃介仾亠俳僇亪仮侗享任仾亣乘佃乾併任亭侻侻佞佞伞伕伾伊伾仼仼伙享俲俲仟俄傟亠俐伞亃位侔偌享俤侟侔伫伅佳亷价佲乬亅亸伫伌佳俐佳佖侴佳伌佋你佳俤伫乹俐亪倱伴俤仺份佭云亻乒傑伥佥亰亻亻云佥亰亾仩俏仂亣京亱亾倁佒伴亣伴乞佞佲伴值伏伶伈伴京仈伷伵俠亁乳乒佗俠仳伏侊亪俆乸伈亁偀侩仳乸云偶侩亰亪侰乛份乸侼仧伦仂俞乓乽傀乿亸亁予傀俏便佗以侏从亁亍亩乴佉仟佯伣仨以介俳人亟仮侈亀井佌亟乞佗佉偌亘亀亀从以俞亡俒侐侐偝佥仾仭侯亢仢侥侯亡伃伹便仾仃井俻倂亀俘介伶偌倁偌俊俳佉侤倥亷估伃亇俓俻伅习伣亸俰侗伈侖乓侄佲佪以五倇侾仔俳亪侗仢俻倏仢仩价仺侰亲俒仳乞亠仝云京亲亄优乹亳侄偋体伈佉仩佂仾乓仈侔伇仟乸伾佁亩乬仈侯佱仨偶伻伪侢优五偌便习倄佖侃乞仏仨偌倎佧乩仃习倱亇伞侊佲俣傺亸侍仉亘伊亟倎來仕伣佯佋乸侥倂乼伞伈佋伫亳伏伈亰亾佃佉乬侨侽佄人仮侊从俴从亖井伋仾从仮仳侊亢偀习亸伓亽佯亘仟俆俆京偁佖伋以乞亟伦佂亟亣佌云俤俓俛伫俤偺侷伕以乛仂享侐份乗俊余佦亸伷井偶亄俫乴伋亪乳俏伅企係伦仂佯亠俗伅侾仺俊伶仢傍仕傀倔伶俆予伾偌佥佌京伪俔俔伃亿亀伅乳侰亘伩俅供偛侟位佭传你佞你亟俉伫亪亢侥乾亪井伓倘仜亘井伞伅亗仹仳亳伫佑乘乹伶互侟亸佤佇偁优侍倢伭侍乞倘伌伥侉仿佇京伌优侼亭乾仕仕佁乻亣侼伥伶俫俰京仃企仳伻伈傧俌二倘侟伶作侙亇仂侂倢乼亻佞乛亲仏伈伴仳伫仢伥佪亱乘佼乗仂低佲任亗亱仂伻伄伶亡乛云俔亠亣俅伪价伭偁亀俛优偶伟亗侟伈伃併侪乓仂傀予仾伥伥亄仯侶亓伅亃乻乜亽佽企仺伭偸亖俓乓优亸侮亁伭侏佼俊伪伩傍人侄傍侉仂于侟乻仳佯俱伻乘亖俟仂偌仂侴侂倢侚低享侖佤佃偺伊伈亸乼乛併俐亁俉侍伃亪伈俤亸侃侍傀伈京作伴伪佖亖亠伓佋伥偶乞俹仺仺京俴伅伫伪伈京伄侊佭亃佞介亄傂伣井亖亖伦亪亪伷伥佭亣亪亢亢偌佞伳偀亨傂伶以以亪倶伀侷乜仂今亄乨人伣仂仂伦交佼倁俪乞以仒伦俘乳乳侯俑伦傱佉亏佃伨亘亟仢亃亮侯仳京乽乗俘倱亘伞优伦享侔亀侔倏俆亟伵俰伃俠仮侕仂亰偀俀位仳仭俆俠伦仳侉价俊亳仒亸乘侐仮亀乳俞乗伣介伦乞佉乜伃亱二亀乾享侔亽乜亄今乳仾仂京亸享乜侉乴伞仢亪偠侯俠亪傌侷伟伍亖偹京京亪乨仱伴俜佟乜俪俜侐侪份乞伣仭侶乒乒倁倄佳侏伪亩伦仔价伦京侯余侘仺俒亪仒俑仺佞位偌亇侶仱介亏伦伦亙佌侐仮享亇侥伦仮伴乘侐伦亠俪仩乞亘亳偠乳亸侔仿乳佄倏仳俰份仔伟亇俜倥倏侾低仳亰亏俪俯佽仼享伦伦俰佪侟伪仭乬俀京亓亼乽乞亸俅享乳仺乱亠倁侂乸亇俠佘伣侐京享乸亀伦俠伧享侔侔亰佫仢佫享係侰侣佉伦享仳亓享亣佘乒仄伴乞俐伆享仢伌仉俤二侥俀仳仢偠仄亳傌乱京俴享俈佘亇仮井仳俟仄傌二亪俥伺倔侠五亸五侙京亟仔人偄俯俜佤伆亿人俅佾人仭倔亘俤侍仏乗伞人伦俱人俘俤俱仲伌亇仨俥佁乴余伪二乸亓偀仈佬二乘佁倔侾京佌五人人俘偝京乓仏佌來亸乗仈俱亾假假亢亇侴來俲俥侍五佬俲亢伆亪伓以乳亅伓佇仂佳佗倄亙亩佃伏亘位亢仭仔仔侃仼乜亻佇侥俌仔仏乞亙仔佃亠偛俛亪傍俾伊傑伤仔佯仔亘亘传侟京仃份侼亘佲仩享俤伕傱享仱亾伢侾作俞伨书伌俍价价伈乞互侖佗侈伃亘倚仃亰亪伆俏佾俘乜乳們俵伾侈侐伃位佖供乳佝伷伧份伷以仟你伟伈五亢俏俅亭伞佃仃乘人伣价五佣伊伌俆仜伢亂伾井亘侥享侈书們倁仨侗价倜偶俳們乳侏俜傟亪仿佌偀伈亷侥优伦亇傱以亘亏伌倥仪們伶侔伖份乬井佦侏仌亅伌伈伿侗伐价价价佑亹倓京伈俠亰仃俳倢俫云仳佞享乼傱亻乳佥亰侙亅亅亻俇偀俞們俑佞佖伆俔亭乴伌傓伈仾俅伢乽伣偛亀乹伨乞亘侷体仳乗互偁享亠俐乹佉伷偄傍伂予亘俐伆佂乒亩亅亰仈以乩侏伴亽侷乬侔乯傓俳佝但亅伌俥亢侟仩亪价二伓倜仃亘侧亢亨伈佷亪亳价伃佧伶侟侣傍仺倱佬京仐倠佖倜伞乞伨侉仨佢偛俲享伞亓乩們仳侶侤俥仏侤传俛亘伌佞侯倜偶來乴任乳伈俏仈乷俤伊俐伢佤伍伌仳以伍仂倹仂倹份佌仳仳伶佞偶众僕佝亅侮佷云侗以亨仈京侷佳亀亹伟但乬享乞仂伯傍云伷侢云亅二伯仳仳伈俔亣京侗亢伆侮亨亅侷倁佃侮俅俛偧亪乜亭亣侷二京侯伃伷亟俊亟供伴亖伣侐俒傑侃亅亿价侘乗俫係偹倄价侴乘俊侯亹伨伕亪份佌你偌佢伏云仃亓俘亪亸亓佇侥侐們侷云乼僒仼佤倄什佃伴仞伣乳仞侣仔亪侷仳佌仂侴仼侃乼侂仔似企俼俼亽俅偹从佂乸侂伨伈伍亃亪乨乳乱亱亰佟侔亽乒伧侲僒亽侯俼倄俲係俹偌俼俼乱亸仞俹伖佞估亙侂伣乱倠但亪亏伃但俘亨侯乜侠亸仯俳侠仒享侪云佄侷佇京伴佲俪佘佘乒倚侐九佔僋享亙体仺亀俫佇伦享倄侏俪乴俆亓亍侤侴侠俉伕俆乳伦仂侐乬佇俉亖亸乳乨亟佞亘佃位亘倥份介乳俔亀乷伓以倁伣俑仲侘佃偌亙俀井仔俪书乨亠亘乬仡仼伋井伨亃估倣侕亠余俤仜伵亭仾交伣乳侀互佫俘乘亖乨俻乸伵亡侥乜俹乽亳伋伦伈俻仃从亀仳亇乒亙佽侥伌估仱倣佟伟九乨佇亸乳仪仢佼俰乳仔伨伦伶仲予享乸俪侂伻何亪仳仞乬仜倥仂仂俯仂佲亅伣佊伭倢侕佲佦仧交作仝似侴低乻仂伏价侚位从仂伆乓侂侄伐亸侐乹仞俆乯伇俏京侂伷仳乸亣僅仂乸乽伈伪伣伄从享俛伉伃俏亩俞乨佾乜乒俅估倣佧从伭乳伭九佝亩乨侮侂俅侏乘伟仡伦侏亇侉乷优俞侂乸佗伭倣仾亣俆乞作俒佽亰亁云伈亃仜伳侏优侴亸佫侕乳侏伻侔亂伨偋伯伣亓亀侂侕俐仝价予佢亪侤伶亸侂亖俻亅习伦仳侰倱侮侯仾侂享侖仢伷仳交乞侨倂人侧亲伣享俫佟仁仾仢侍偺亏伦侖俼乼京伷來侚傣伈亴侉伇佟亳企偧亸侧侏侈佗亳亸仄伈俹估俲佧乨俤价乴乞偠仢乞倜乸享俗亅亨仉佄偧仂侟人偌亖乨偧井仒乸亖伣侉俤仳侉亣仝傌伣俀偧亭亪俠亨亖侮乜侠京佇云伣伴侷享佲井享俪伭侏佇体仺俫佦倚俪侂低倄伦佘亍亘亀佔亙伣份乨乳侮俑亟亸伦倁云侘乳伓倥乞仔乷佽佫亠余亴亡书亳侀仾俹亭伋俤侥倣伌俻佟亸仢侕享伟享乸位亣乸仂乯侚僅侄佗伭从佊交乬侕乻仜侂伏佲仳作侐伪乽伈从亨伟亩享侏亳乜何俛俅伣佝作估伃仳俅俏俞俆乳亂亀予侴侔侉亪乞伈俗倱习亖亣侤倂侨乨來侖偺俹亅侍估俤偧僋乨佦僋伥僋仂佞偛乽亾佦亣亣倢优偀傣併亇仂佱亣亖併仳偀仧仧佦仧亷亭亭乳亟伾亰亘佌仟亰俏佦伕仡伟俻乳亟伶亾俀仡二京伦侩伾亨亙乜仺亄乻伕伾亪偝伭价享偺伉乻享俻侯亾亭仺享享侻介侯侧侈佉介仒仒倄伕侔介亰侧佸侔位乞亘伃佟侧乞伣佫俕俕侧估侤伣乞介侧亅京倣亠亽俞亸伷侖倄侖侮亖倣乢侧侉京仯乞伉佱倄佇仃仃侴乳优俵乞伩乞仺位乻伦佃亸乨乽亸亸伪侍亳亳伌俫佇俹伃侴乯俠俫仃亘伈仾仃伂侂佲亳佂伴伴亷于倱乞侮佂于乼佒侍于伷乞亳仾俠人佤佤偦仟俊仂佝佝佝亡亡什伲伄侸侸俛亖仪侐倣偝佳侏伕仺乞乜佃伧佌仮伓佤低享亽仌乩乢俹伸佥乩享佤仮仒偌侹什乞乛佋侈俌仱侏仃乴乴佇倣伦亁但乴亀仕位俳仒倔來亢伦侽俘什侾傻似乸侮佳佗倇俴仔佌价伃似佘乸偛佧乛俒仪佌佧仈侮仈佧侮佱仈侮侮佧于佗俌仪仈但伦乴侽伆俒仪仪亢京京亾乜亓乞亓乜亾亾偹乞亖享乒偨侲佑佞估俐仃俪伌亂云俞仩佦佫份侪佁使亰伦亷乳乯倄伡伸伈亍俯仒倚值偨仁仯京佘人仂仺亅亸亸乯偨仔亹亟倁侃乨亟伭云亡乴乯伕佞佃乓亱仡亹侐乯伦俒偛侐乳伸亀伣亏伡伧佗伦佾侰佃伨伪仃乘乸介亢互依仳仔供伶伸乖乞倉侺佑互仃俤乺乺什侩伜伂偎侐伞亇俘伦侴佉乨侴乨乪乪享乨倆伖仅佸仂亗侯偠侻佲佞佘佲佟俤仔仒伜俓倇侖仪佉体亟亅俄俻佢佟乿俔佭亇了仉佬俔仑亗仺亰亭亪侮侃侴亠仞倏仺俟低伂亖仈俇乴乓了仔侸伩佋伶俪亟侚乳乳佌乯侧佲互仺似侂乛佁佉俒傍仃傄亭仌伃侩乹亗亙傿仵侏倁偹伅众俜人伈伭俤京伧俛价使乳伣俒从倔伯俈佽亅仳倔佊亽亓作佑乞佞來享仺乨侔仳俗仌使仳似伸値俟俹乳亽偌亸傍仳俤亣仳伦伺傑乼侥侟俒値來侴伞伌伯伷伦俤侖伨侴俣乽仢倄亣侖僕乴伖偠佈侮价乾伋伓乞俻伩侮侨佈亰仂侴俗佄亗佁佸伣俟乹假伩伶仳仮俉亭佃佸侻俒俉伻亅佁倉佸乼倉侐俤但乬享侔乬从但伦伦佑伈亡伦佟亹亀侠伣京侪人京伉亸亸侠京京乹佌侠乿伀伀伀侠以併亙以乓併仉仉偀企乓偄倎优乗云俠偄侖乞伷傟亹伷侘偄书亍侘价仳倁伈停位亘佖何佞伣佑偄优仳五伸亸乖乳俲予亪倥京仿仪京伭佞侊侶佌俐佊伪俅侰亡俠佽侪乞侢停侲乩乷伺人伉伊偶侧仳乞享伈仮侊仂仳仳侉伳倨仞伈伈仄伶乳偛伶伶侲侲乞传仪俤伫侸俘俤亠侟佲乞亮从侯份亅京京倥乺仩伨仂侼侐亳仢伦乽价乳佈伭乗伦仂侖佘亅俪乳仨亠仳乸享仱仂伶倄伕伇乿享企企亍乗伋佝伦侏仱于伓仟侾乯倶书佧乘仒俅乞伆伭亪仺伅伣使停亘亓伟俞仁位亹倥伃亩倢亪乾伪侰亱佾佝俏乞乞佌傺傓余侽俒佞仭侖佟人伣俵佇亣佥互佌亡但份伨偛佉乳佗亰价伭乳二仟伷伧仟仟伕亃偌侐伃仃享仔亢佧仑俞伺亣五佑便亪佫乘倨亅亮伻京佳侐倇乗享伞亃伈亃佝倉侼侪俤俤乳京亘侐俹亳乘侪伾佫亂伉侼侥倁亅亘佄估乳仜伵侈仔乹偄侲仔什侩侍仃俪伈伟俐偛亪俆佤亙僒侈伧亴价們侍亳享偶侐佫亲乹亭亣佄俆伢乘乪佇云人仩伭亪佬乳俪乘伴价佷侏伃俜仢仢亇伻乗伙亸倣亪仉亘偌亪僒亏俔乒俫侤伻侟佌佉侊乹仔仕亟亻伶仪仒俓偀亷仒俓伧仧亓佔倥伣仿乳伅偌佘亠仵侰佯侗侮以佁俜伣仮仒亣亣仯体侼侼亃佲仔伃佃互伈伐亰伩仳佌伭亻但俰伴仉偋侔似乳低使乬俌俇伏倌仝伕亪俜佞亷佾仱俻亸仱伃亠仉偶俆侍亹倣企亰位乯仱侩仧交云伶俑伈乼併亙乓俠伨仂伴侴侕体价使估乯侗仂侊偛伭乴俫估伶乞俘仂佲們侸亀俔侠傻亭价乞亁佞佭乛亣亣亣伌仅乒伪乽佲京京乳侮仾仾仵們佁体伌京俅仟侩伅亭亣佣佣俹从亏亏俑佾偹亸佋侩佃伈乳仳仔佒予佇佇佂伶俜亘侐乽俪佑仹倢侯俐亟仉伵互云伈伭佞伭傟享伨佸伧俛人亻佧仜伭亀仈仪亲亸以仂亨侂人俞佉侏亙伃傍偀仁伺侉侒仈企俹乩伭倹仒侢乘以体以侏亀仿亂侊亪伥傱俞亪佌亸佽伓乸俜乻仮任亅俑你俓俞伓京伖亁仉仉倚偁亸倄侏俳伈享傓停偖侯佳伢亀便侢乸乻亸亰仿佫佱伵俓以亽亭亂侤仾亱人伞价侂侄亏俘們伡亨乴享亪亟仿京位亣偌仏俘仟侥伓侟侩侮佧亸偛乒俆体亠伭俈侲京乞侐來价仳乸佷侃亖侧习伶位享倱侄亷伃亓仳伀僅伃仐佄习佞伃俓俊亟仾伭伨于侯乩佢倁仝你俹侯佧仑亳俻乘伈侶亙乘似伻伨俫仨亅亄佸佖侧佬侮乼仨伫价亪伭享亅佗佞侊仌侉任佄俤伇伇亖京侍伓企伈乪侏佾仒佃仳亴亳伅伟乯伋俀伾亂倄仈倎伇侾乸乳伋偶乗互乜伌亸亢佘倥仂伈侏伢位京优佱享佇乜偠亖仾侏于亸佳佾佳伫伭亳亳享亃乽佲仐乞佪俹侣亟侧侮伪俞侈伟亽伺价伏伢伣伷乛乨亰乨亙伈佳佇仅乿佄人仼侢亙佄佼俴伭侽乬乪亂倱亹享俲伻亀什俒亣侔佧伌仂伾伈乸仈享俅仏侯亨俆停亩五伆伣來仌伣亓仳乞乸乨亪乞伩亖俤伃伦亱伯人偌估俟伷侢併俈五侍伭乻亳仌侔侏佾亪亙伓伫乼俲仾仱侗仮俔乗伇伇仂伜仳亓俈侊侏偛京佄享仲仾偌乒亓仲侟但佞傌乞伣京佌侮侮乘侧亣亢九企侷位佃人伷佉亷仈亨享偶习亖亖亳予伦伭仈伏侹亪享侯亖侹亭享仈仳伈仅伯亖仜伌乞侻倌伙伨伨仳傧仳乜伌亅伓伨乸俓乳乸乸仳伨京佳俤佌似佾伶伏伏仈俗亸亙伉乒仏享乒乛以优伋俊伀京亷侐佇亳侊佑仢优亮以乞亄乽亍伅伕仃亅佘佘伇佽仺侷侷亻仂侥乘仂侣俞伋亳仱仂倁侾佳侰仧倄倄书仯俲乳仁亠乳仃佬佾伣俒乷乒仒佥偛仃仒伴亷佌亪乳仁佥佝仺仺伣亘仏伙仭亰伏佃伀傻位亰乴亰亣亪亇佃倂佑亃亳亳侼乳介倔倇亘乞伣佣俤亪乞偛仂働伀乞仧偌五伆伞五伦习佤俊伧亗乜仂乹亠乒倥乾伧俈仕亱伅亷亙仾予亟亟乳伣俊乗乳亪仿价伓俞仒亠乴伶仪任俈亳佁伦俌乯佌侯仂仂京亻伩侊侧乜亸低亪亡俘侕俰亷亷京佽乯仺伭傀乞俞侤仜亅伇俒倢伭仞似佲互伅侘伃仧侣介亣似侉乛伩伪亠乨仪仟乸从京亠以仾俐伶俅偹伭乳俞佉伭乳亂乨仒乒仟优亣以伉亽亘侂伟乳俞仈侊伩仩伨乒亡亪佁侏佃仵乩体佫亣俹侘仿伸乜亸亃亸俞佱侮侢侘佫佫享乗佟亷仱乞价企亽乞仩侸伴伨伞亄便乞佘亣伯倁停侨仂习俘僅以侲仃伃于仳伭伦亽伻倱佃仺京伈亭乩仱倁乘俹偑佘伌佲俊俊亄亄似乻仟亸佧亪习伌使侃侼乽偌俀乜乒個伦侟侟俤佃伙來亁伞亸享傍俐乯佤伋伋亳乘侉俤侖亗伌乗伉佄乜伓亇偶亪乨侖乞仔侈侉仂亃乽伀亭仱亣亮亪僔仾侮亘佖乨侼乨仂佫伈侊佳亂仮二亠俴伴仐伷亖亠伩俏亪体亪乒但仳仩伌亘亢亪亢予佋仺侎亰俻亣亙亸侣佃仜仩侣习佃亠亘二伺俐供伡供乿倁乪什依仐亸乹伶佯俞佃位仾亙伣侥乽亠伣侾伨伭俠伉伭俠俯伜佃乞乞佷份京俟侪乞侖伻乳侄倄偑亠倚倁乴乞倁倁亠伦乨仁伦俪仱俆亻俞佉亮于仑亳仁伧俔位乷佾佭人亏价倥併佌伴伺佟亀乞傟佞伃倔乳侄伦伦仁亁乞仟俔倚佝仾俊佃亱京亸侯佞佞乳仃仃余俪俹仹伈佞亠什佑亂亘伞乘仝倇依乹僒偶乸俰偨仑亙伧俰亇亪俻亟伿佑乞京亀乻乒俕享乞佷僒倏俫俕亪侮侮余伈僋侉价俰侕俞位仃使乬何俟仞僅伡伡乯俞亭似伶仩伟伦佌乞仂似仡偨仂伟伟乳伉乨俅亡俰俛佟佟伴俞佾佾乳京倠伶亳亱伓仳佭乴侏今佝侈侹佫俞亂侸仲侤侘俈仃偸仑亣亠亅侹余侮亨亪俊以仳乞亡乨伣伭俟侲享侧倡佾乽价乳伈傍伈侴享乴俉伷佞乽乿伙亴习亨于佖伞侲仢偠侉侮价俆偶亙併价亨乳亂伦佼亙倔以仼乨佞伻侗亢亸伣亨俊乷佌伍以伈亁乞亨侾亸亸人予併乳僙乳伕伴享享伈偀俅伶伞伋伂仟侯侯仐以乜侉亭伋侯俘侮人伦亻亸侖伭亸乓京亨伅仩仱伸享便亣佝佃伏俆偀伊伈亭佃伈伭伋佃亭亨亟伃偀伈偀伶伞侯以侉亨伋享亸伃乓京佝俆佃俤乒俆佢伋伦偝享亰乴侐伃僅企仜佑以亠伞仯伓亠亲乒乹亓俒享仳伦佥价乹伨僅仯伦伺伓亸乞亪伋亸伶亸伶伶乛乳乒乒俤佇享伷佄仏佇亮侕乸亠乞俪佄乘侖仂俔享佄乘伅倄侾人俌亟乘乿伋伌伹伻仒伦乺亍乿偝伀伶仅俯乸乞乞亓仃伴亟伴乸亀亘俳佝侐侐伏亰乳伈亡位伃介亪亗亁云份乞佌人佥乞乞佃亾偛价乺佃伕侈俑侕亘亃俊乾乸佄乞俐伴以侪伌以偃侪佝伞仜亳亠企伵乽伭亟云侥侯伏便伅亳伶乺仡什仭俘乞亖亘井乖乗京伯享伦俪佢仿伅井傐以仪乴亱侉仒倘侍仱伲侩京伌亇亠伣乗乗侔俌佷亳仔偁亀偁仩企使倏亠伪佃佧伌仢仧伣乯仃今乞俒乘仏仺二侉伻俯享仂併作伭佌倢互俳佖伐亅二仞伈伓佳低亟俟企伂京亡乸伂以仾以亲企伅倁伃乨乳仉仪伈仂京侐傍亸亳乘侩伣仵伻予亘介伶俐仾佑乱仂倂佋伭乹伯云侖伈你仈俐仮佑亣侯伌侯亸侧伻伺伟亓佽仃亅以俹俞乨伴侕人人仳京俟佧倢亪偌偌僅俊僚伈佖亠侮乩侣仌侄亸二于于俆俊乞伨俹习偝亷企侉乸偺仄亸佥佼俳亗亨伅亣伋享傣俤佞亳傍乗偲佥以侍併偲仉佗仾俲併偶仢伣享俤仔伏侎乞伫伏仺亳企乞乞侖傌乢亅佼今伨云佳伫亣伈京伈亳仩俊仾伍亖亟伭侉亪乞俅俊伶伅乬伭乬人侉傌乘亨伻乨但估伍乞偶伏伶仩伶享乛乳俪享亠佇侕傌侖仂俔佄乞佄享俪俹亳仌佌侾伹乸伅低乺俌予伀亍伋俳亰伴偛俑以乺佥亓亀伃云亃佃亾价乞乞井亖以仡以亠亳亇亘亟企乴佝仜伞佄乞俳伵乽侪亲乸云亠乗京侍乗侔仒亳井偁俌傐倢亘伐乱仩二乯伪伭京僛亟仏侉仞俯仢併亟乞倂伻亡俐伈乨伺佋伭伅京仾侉侐侩伶伃侯伂乸偌偶亓乨人佽以亅侯俆习俊伈僚併偲侍亨仉伋伶亅伏伻亰亅佇优享佇亷佇亸亸仮來亷仩亢佬俹仂仃亪伊佲价亙伣予伦伦伶伶以伓亳佈乞佈乞伈伕佂伅伓乽估伈偨伵佌乳亸俗佳京亘伧倄亸佞佘估俗伃侂倄乞伦佾亮侩仺倚仺佝倚仒仏偌乜佟估俰伴佳偌侩仟亪俒价京伧倠仟仺亸乞佌偌伓併估伋亱亀俞乳仝仯個乞书佲俴仮伷併偀佖伦什亘以价侐什伞伂俅乪乷佗井乯傻乞仃仟伴价仳乼亳伵伂侐伧乸僔俤伵佸伈亣佄亀伀俗俗乒伀偄佸云侗伍亃伻僅乓伡倣伣乪伈仢乳併佧佧伦享侃仩俆乺体侏佾偋侗予停享佗乞傍乳佝众佖來乞仼伻佲伦作俟侏偺乴伍伶仉侖佲亣俆份伣佸价仩亙伶僅仾亢份佸亱亀乳俞仯仝佖伣仼侃仮伦伷併俴俅佝亘偀什伈俵以傻伞井乷仟乯伴乞僔伦伧亳侐乼仳佸侐伵俆乒亀侗伀乳仩享亙僅亃价云倣伡乴侗予作乳傍众佖伶伍侏偺侖亣份仃亸伀仵侥亸亇伴亇俊优亽伐伐亪侠乳亾份仂侖五乘伣侐伋仱仃亃伻伻亡佌偝伃亸伏伋侷佃享仃伓仡伺侐俘何倇份侤佢亸亾亓乘佌伈伥亽侚侴仳佃偶乒侐伟佃仃俐侍侍俤俲伟什伍伍俑傟佾余伪傀伋乳伻伈亍伦今侷伕仂侷侧俔亹乞侶位佉伕亡余俔伧亃佭仹亘佌任伦乳亁佌侖佞俒佌亪倨乞享何伣俤何亘仜乖僖伞五仈乽仃仳伂伦伧俘仝伈侈侍价伣何享佌享亙俜伓仔但伌佷伺傑侰亙仞乾俤乬侍倂今伈仂佁伭侚亠享但佌但低仳佪侹佌仃佲仜伟佞俑伆乞佢侂仝侂侟伦俳任伦京何傀偄乾倁伃佥伻値伈仡亽佌乳俑亡伂偹乱伟侪俈伈俠俓仂今侧侶任伟享但亁乻伍价伉仳來佢亽乷亓亸仈享伦侧伃亁侂侮交俲侶伙俈佌伊俾伣伷伓倁傀佞佢佢伋伋乼今侍伋仉來傀俥偀俲侈价价亘佌伓侍傀乬享乗侷侶乼倇伦亪伦侉伓俛伭亢乼伣伭偧亨乨傌仅但今佃享俥俓亸仈伋乼亟仯乴倄佃伟何何仯仿俪亭伫享佌亽侙佤伶佉係佃乩佤何伦伶伟俠亣京仕侾伞亻伭侷乿乷仾伷俪侖井亙佈伻乷伅倚仂仟伄井亅傍佇伨佃井伃位乷于亀伷井介侟亱亰亰佭亘佫伅伕云伦人伪乞伦以偛什仯佌俤倉仳侒仜云偋伦伀仞京倥仒佲乘俊佲乳倢云俒佪俊伏仞侐亳仧侚似佯乞侟亅侄侶偛偀亱低倹仞伄偹享介伣偄傄体佑仒佇亙乳侐乳佘俵伏京佘侕亰亀优俞仳俤偝傍伭亲伺俊俤伏佷佤倄伷乼佑仄佯估乞享作什京伈佇亖伡亪亪仳乼仕侾伞仾乷俪傍伅低伄佇亰伪仳云伦乞伨亀亪人倢以偋伦俤云仜仳俤俊乳仞侶亱亳侄仧仞侚侐傄乳享佘亙伡俞优伏仳俊乼乿亰亃亃仺俀俅伩伩亃伺侘俅俅俅伺俅侘亃俅俅伻亂偠偠侉侚侚乞倶俅俅以京來侈侉份亅京京仂佄乞似乪仂俉仧俜俯亣侈侏俆书侾伷乗侈伅侺俊侈俆俞伭侮仃仕俒俘伦乞仲伧伻乷什伃你亘亡佖侕亙俔佃仔亳互仒侯交享侸乞亠作倇佄俈俌以侕伸佂俒傀仲仾佄佷仒伌乒九亘乒伃伃俜仔伟佬乞俊侥倉乗以亇亓俲俕予侮侤亳亪亰侗俵俓伋交估乷仳仒云俆京侚仈伭伟乞侈俞亭价乱京偶仢傀仢伶偄仃伟京以亀仒侏伅俅似伅优俐乒俠侈伭仵乞佝人乬乻佄今伃仃俞亓今亅亄人偀侃于以傂仃亓俲俊傀伃乩仃俓乼傣亴亅仾京乞伅來佌以价人乪乨仢侺伏伯什亩俅俅伩亪俞人亭亪乞仪伊仂乾侖亷京侼亂五亸井乳係俗亍乹倚乿亟佽俞傑仮乨佽乗佌仒亷亹乒价仺仭倥亱倔伃伐佋乼井伞亘以余京伵伴伆伦享估佂乹俤亸伞乱仿伧伖俳仿侏伶亇佬亸仳乳乗乳侔佳仿伧倣亻亣佞亸亱亪侏佷伌仂仺倢似云併伐偛侗俒伻仒佷乽乴佌乾侍乞佬伶佉傓亱伅亙俻京侏佂仈乽乽侢亽便亸亂伓侐伐佋乗乽侏佳乾价仟偝乳來乘傍伨侍伶侃习侍乸伊价佄价偺伭俳仟侖乼你乴侊佋侲伖予侊伐井侮伍侉仒享伶侉伍位估亸予伍亪仒乛乒二伡云乞份京侠伶俀仟亀乸佬亀倄俞乳侏亹乓仹俔亏亷亰亓你乬偋便佤侚乬仒侥伦伣俹亇乘俜俤佉余傱亖仉俀侺伶以傦伭仳亨伶侕伡伏体併俀作佢俰伟伣仩伨乸乹併乒体侏你伪侢侯仜乬俓侏乾值佥侺亽俹倱伻京亪俲佤乞俹佷俤亸併伾偠乞亪佌伶乞傦亂佄乬伶位侯侯傦乿俤倜侯伶俅仝以仒以以亪倁佋仞亸俆俆像乞來俠亾乛你乒伕乳亀伦伕侻乳侸仏侖侍仨偄侐伷企企亷佦仂侼備伃乜亸乞亮以俜亸供亅乒伈仺佋俆伕亍伻乹佬侷亅乳佷倚乿伅伋傀佝乘亅侘仅俪偝佔倄侏乞仱仺似佇乘亻仏乞倁亸伵備仮亹係俞仳伅仱何侐俒俜以俏亰伪位仭乜亰佞仺京乜亏佷仒乓伧亀以以伦佌侉以以仾亾佾伴价佗伓以佞亘仃俉你侥亅乳亿仟亅乳亪侷仺介侘佞亠佝亙俳侰亸亸伃伧侰併估乞乜井依亱伈侥乹佇俤仃什佑仭以倂伧乘亻云伉乽侥偌亖享京乸俪傣伦五侖仃伣乹仜仺傻亘乽便乖人伣伣佟亻侪佤享仺亂侯乞乘倉侩僆仒仄偦亅侻乜伫仏亷伇以倘乒伌俊佟佸伟俓仡佇倁九仳佉仿佲乿侏亱乗亓京侉乛佞亷伧佇俥予侉佲伦乜仾企京俘井二亼乹仱亟亷亼佋伓偺佌伣伅侼仉亪亁伇亇侔亪個仭亘亀俜乻俀佌使俞伈佦仏侕使低似位仺仳亪侧伿俻俏俀侟侩仺伣侾作亖僊侙今俰仩了俇侐俳俵但侂体併乛仂亅作享京俆偀仟使乓亸侮侕亰俓亙亀仳侊仳企俟像侗偨亍乗侸佲伍伨俄伣伂仮仞伾倌侒亣伃侮似伣仩俜伭侂乳偹享伅亻伻伟佥伨介俛优京倘佗俐伭乳亾侪伆以佇仈乓倂侍侍佂九佧估佋俏伈俛伈俌仈伨仾俊亠亀俅倁侐佟佋佉倹伫亠亅佉侤侈佽优侮侤侒乻人佋乢佱佫亽侤侧亪偁俇佞亁侈价偸佦侐乗亣俐俘乻侒伢俫侢佲佳亀亀仿乞俞亽但亸伧佑亄俻俌俑侤优予佘倚仳侤仌俑倠佟偀仾侮佊于习偌亭价伭乻伃俼侂乞仳于倘侧侴仂使亽习乾侉予仔俟亙乩佟佧亢伍伈侲亪优亸係伳交侃亅亇仳企享仉亳侧你乼仄佟俼亇仈乜乻亗俐傺仢伷侍仜介亽乽伋俤傣來伆佤佼乿伍享伈倁伊侾亣佼伋乢伍仉傻伷亇乛侖侒伈乯仢仳俻亳京侮二侍伈二亖价傻估佋何似偶佌倄侈亱乞伫侂佄仏亘伜作享但伴仮倢俗亣仈侽乸伈伈亅侪伦仐亪亖享偧井僅侟伩仩偁侚仳俟佾仳伣假亢伅仳乿伈亨佞伈人侉乽伈亸偀停但亖俥佃亁亭偧侻俲但伋亽亘亨俆像乞亀乛亾你來俜亅偄侖仅伷仏倌供介亮乹伵佷亹佌傀偝倁倚亱佦侘亅人仱亻乗佝係亍仮佬佔伕京亅俳亅亰佞伪你佷佞侷偧侰併伧任仒傻佞位偁亅仟佾以仾今价俒仺何乹偦佤什侼侾仒亇伧佋亗伦偶侥仳仏乘侒佥亘亸仪僆伣企仜俫働仏佑便俳仄俤乞侉伉亽侩乘亂亘佤仉乗侗個侮倘伌侤亪偺伓似侔伅佟俓亼予乿乻侒伈伇伟仿仱佌僊侧俊乱俓仟俵仂俄伪俰使亸亰亭俇作俆伦伣俻仮伡併乛伈佌侊侐伆亣侒侧乜伅侪侍倁俛侢俐估伫仩佉乩侐乯佉偌亀佞佑但亽俻但倚乻侔佽乞伧俗佫俟亽习亭交乾仔伃俑仾乻侉伋來仉仳傀亨仉俥侧伊仮亖估二侮乞侪俟伩侉乽侃使侠于亡佃來侯侃倌亄傿侖仮倌伶价亷价侖侒係交佇俣俼伣伣伈俏优倏佬佥亗伏侟优位俅价俣伫偀佑佑伾伓佇伞俏仄俰仿仳仪俫佌侷侷侉佃乼使倜俰伶佘伶伅亲京佘佇佾佇佃人佘侘侩伭乘佣伥亨仩仜予乓但今侒伴伥俱偀佬仂仈亽偀倱佯亸亳侉仺偶估今佘今倌傿侖伶亷价佘俱俣伭伣佇伈俏係倌佥亗伞佘今俏仳侒伾佑伴俰侠侷仿仩京伶使亸佘亲伶伶侉亨佃亳佣伥伴乓今伥佯估乳乳传佼乿亅乗伵伦乘介佬伅佗侘伡倘侏伄伦仺仔亍介乘亀亠亇伅佃伃俑亏任位僊俔俔仺仭乳享仳亢伻乹何乩偌俹亙何伣什伞京伵侖亻侍乹体乳价优侖佗伦仉佬俞亀伓伣俠但侏伣伡乯伐乞佼低乘佌俇伻仺位侕伣仳佗伣乘亘介倶优伉伶乘亙伃京亢伭伭但佼仢侩俐亠仢乘伵伶亳佑侏乗伭伫亸亽享侃俠于亸乘仅亴乼俈伊俤仢仢于伣倄俒什享俠亸乘伦亳亢亸亪亪亪作伴伦伢俻仵乞伥伶仱亅乺侾享亰估伦佝俻亃乾佌伓伨俉亭京乬仏仢亷佁伳偀伓俉乾享亸乬乻亪仵伺俉享享京京伺倚僋仄侰佘倄伸侏亪仃介位亖侩佾乗任偶伨乗仏乸享侰伻伌佥仪亀伡佉位仂云仮俫乯佇伏乘俒亘佈乼位互亣乗位伳位优佇乘乪乪侏乻侊俗乗伭佣乘亸乞伫乴伯伣京仳亢乷享伸介伕仺伭予亸享乪侊侊亖亪仮伫乯乷亢位伫予亪佾伴伴伴仭倢倢仔乓亀仔亇倢仔仔任仔乓乯乯偦侯从从佾佋乓亳佋佑乛侪亅俪伃仩乗俪仱俆伺佔伕乘仅倚偌俑侈侘乞人侕亱亠佇佭介仭乘佑侕亠乨侩侩偃仯仹侈侍仪习亣仢俘侍仾侙交今僅仭佣佌伩乨偹佽僜乒乒伴侍侰佌伈俅伃伈佘侕佝今亱乨亁佑价佣亽乩伞侍伺享伈俹侉侈伨伣亅仩倔伈亨伭俪乳佉仜佑伭侍亷使佣偹侏伀伭佑仼侕佝侏侔价伭仢仩倔仩伭俪乳亷伭侏侕侠侠伣乨伣享乘俉侏倥传侟俐亣侏侟侩乘乽伨佋乛倢仈乽倎亷乸乞乸伅俌仈仂书京佲侘傀伃乴亁你位仕仔亖伴侍伅伅伭乨佣亟乞乞侺佼京偛亖乳伧九亳仈伧亭仪亇亣侏伨亷仔俈俈俴侗俈侐侐俇乛侗併亷亅伪侴仾仱乞众伟伅伅伶佘佯乾傍伶伣乿乞俞偸任任俹仈亖佤倱伤习佢人佳侍亰佄伶亳侉亂侊俗伣俴仳亨但仜佋乛倢亷乽倎乸乸佲亰傀仂侘俌书京仳位你仔亠伧仪伴亣仲伪乞俴亳俈亷亣亣伪伟乾伅傍伶伅但习任偸佳亖侉亂俴仜予俟仡乳优伏俟仅伕亹倇仡仾倥佌俟乜伭介人侢侒侢伷乻亸乻倱倱乻俟俟俟來俟仄予佟予介伏俟仅佌乜侢人乻倱俟俟乯伷乯乯以以侣享乛乜俔伏伢乽佈俪京俻仃乘伷伷伢乘九乞亏价亠侕佾亃傻乜佾以何侺俪乓俤伧仭人侥亃乽介俻什伶传亸侣佞了伅佷亻佬亓京以人亲似以伈作仭伣佷佋併乯侃伭偀伅倯侏伨俐傻亳伈佂伫亽倄伭亰侪俌亽佞侔亸仈乻侢侕佋佘偌亽习价京佟俆俼仈傍侖仃乴乞享亴亇乾侕伭乽伏倄侺侊伶偌侉乽亭伍侎以乛享俔乹佈亸俪京仃伷乘伈以佾乜何乞什亴乽伴传俤亸仭佞佬伅京了亻似亲伣偀侪仈亰侢侉佋偌佞乻佟俆习俼傍侎佊仈似乽倄佞俒价佞俜亷乯伈侩伫乳伣侏乿倄俴乿亄京予亷伃俔俊仃佄亘伦伡乿備仅侏佘伦乴仳仒佞佾伋俔乞佃佘佃仲你亾俞伡云佌亘供佌仺佸伧位亀亹乳介以价俔俔乜乻亄伂侕伦佫伯互佄仜亟仲什侺佞亘乘亭云乴侺乻佌俌仱侼仿亷俜仾俈亻伅亇乹伫仳作云伀伂俰侕侗侂伪仂仂伶乯侨伶佑人乗伂佧伂亅乯俐亅仮京伟仜优侂仈偹乜仡俔伞侢亅亇伦乻侟伯亸侲仩伶俞伐侨侖仂伦伳仳亸亭侃偌于侣俟佧佃价伦京乸企佞亓伌乼伏傀乻俔俾任俤傻伶亭伏仔乞佋俔俴云伶亢仳伯乽享伳佌亸估亪俟亄京俔佄仃佃備佞仳佸以乜乳佌伐亘俔供伧乞乷伌亄乘俤企亭侺伂俟亪亇伶乹仱亻仂仂伪作侂亓侣伂伦仈侨乗于乻亅侖俟亭佧侉云享伳乽亰伭伭伭京份乞值九亠佾亱亃伟伃余侺侍佂乖佑俈倣伂价伪仹京仢乩佞伌佽佞亃假俗偌來乩伌仩佸仢伟俗假仳侔侔侍偦侍佤侨俟俰俰伃亍佟仁仟乴俰俗伾俘仺侐伾仁伟佾价仟乳什佫佃仯佟佣享侟僕倥侤伟亪俗侂伃侟俌俳仜侂倎伈俔伨伩侠仂侮亀俗侟亄俼习习傘乸倇亅亅侎估佣侽俗倇傌佬佬亗佇亸佬亷佬佬侠使京京佑伶乳仱伞侂乻伞僅京伞佉享仂像仈亲伕你佉乸伶伌仞京俈仂仧仞伭份仃倱价偌享乸乬伶伏京俠俪亠伕佇俔仏享乸伅伅俫书佈偌亠亟侘俞仺仳佘伨仳俉亍倄倚仒伂偌伴优佃亷仺位俔佞乒偛乳价亃伭佌仏伕仒侄仺侶乹亹佾乳佥佌亰以互乷今亠亙佂乽什侩伭亾亘乘倇亭侥伟乞仭伭俤余伞伣佑亳佤乳偦佟何亻伟从倥佥侤仱京了俊侄倣亓乗乒侖仉估俘亪俫俫偦侊亇亪伐亸乾亟侐仂俳乽了体享仏伆亰云互侗乯俒乞俰仳侠使仔低位伐亪侊侂伦侶伨京伃以亟估伟佂乹亘伩侂僔俅俅估仜僔伭伭京体偹亡俐侮伶乒乒伈价伅介乳众份优俔伨以傓仾佘亅佳乗亍侨乻亄以以偀侐伯今人伅乾亅仂佘傓亟侮于传亳俏享俘佃伈亟习亸乒俟享享亘俹佟傍乾侃係伺伙京佃乽佞俤佄亓俐傣侖侖伷伞乼佄亩亸偺乽倄偀佂伖僔侨伏份伞亣亪使亖亙伫亂享乸伨亙亪倇亪仐亀乽伅仳偀亪伣京俠享仒佈仳亍伕伴伕偛侶仳仒佥乳佞佾佂仺亹伞亠偦伭什侥僔佂伖享俤伣佥乽佄倣亪侮伈亪以俘侄俫估亻享乾倢位仂伐乯俰使亰俒侶仏仔亟以侐倄亡价使伟佘伭众伅乒乳俐仜俹俅侨于仂今偀人伸伈传俟伺伙习俏乾伭亸伞侖乼傣伨份亪伏偀仑乞乳亪侠佷伶乳仏享予亂份以予便佾俞伦伨仱乳侘佘伈以京僋人伋伋仺估亀佾伶侾俳亍予佘仌乷佑亂位仐乳俔俏亪俅伦佑俞亃佃伌仃乴佌人亰倁京介京侾傻京乓亣佼乗什仡伫伦伶伜伌伧倇亘介伟佇亭亂倂佑俪俤佟云仃亭伜侶伅侻伧享俜估俔佷乗俻京佞亻亻价亸亻佌俜仔伟伅伅井伨乗亟侗俤亁仳仺亙乳侩二侟仱亅亱仏仳伥伈佌俜侾俞仂亪佋作侙何俰佗仂仔乞乞仔侐侗互仂体倣佌伋乞傣享亙亣仃亩偹侩乒伟伨伟伅亠仟乳体俜伶伴俞伂俰佉伨亣偄乗佌互停亍伴亣俞伣佱以伴伓亽优傓乻享亰伈伢亷亃亃乞人伶享亪乓仨伟伟乞俜亄伌侔乓伻享倠俊于人乞仌仃伦乻乾仳价伳二京乗伋乘伟乜俤乞企价亣亓俐伷俤來伶侔侠伣伣俜乪傣京亣仳倠伣伺乞仺亙亭亸乞享佖京伏佋介仺侽伨侯亣侊伃侷京亖佷仳伴亢伳侷亣偀佃亪侻仑侠享俞便以仌侾停佾亀亰互仳侾伌介位仃佃俞伺俔乜伦什仡佟伜云佑侻佇乗佞亪俻亰伅京伣伟乗伥亩侩俰亱侟亅体倣俞亓伨伴伅亰乒亃佉乗乞人佱乻享乞伈伴乞亣俊乻來俤侠京仳估伏亣伨侊偀伳仳俆位伈伣俓伈伈伶俓仳仒佢享佭佢佭亘亻亘伈侯侯京乻伻亻乼俒仂仳侠亻仔亪乽伣伧侯亪伀侃乼仔仂位伶佢乪乪伴偝乳从从乳佭佃佃倂乳伣侗佃从仃予乳佃从亄僇偌亳偌伐僝倄俐俐俆倉乓九佇企井佇亙亪侶仃侌侌乞亅乴亸佈偌偌亅乷伓仒任乞优伶佃佉伶倢侷亪偶仩侣伶伶伶乴侩亀乷侣乞佉伏伶仩仳伦倄乳乳从俏俞佢佃偝倔亘伦侊于伙俔价俞偝俔乛侯侸乛侐亰亰互倄侕俞仺使侔仂俞亽伯亙亙倄乯佘伕仏俔倁佃佗以仒以仪乗佌仔亲佌伶俜乜亸伣伶亖价人乒亷乗乗佂乨伅佥佟佱佥偠侎仂亿享侐享享仂享仃伻伻伴侾乘乨佾佖乨亮仃伶佌俘位位伓仜乨偨但侠人侚侏京伓乞俒佖伐佃侏伶仌伅佁乞亃伐任伓俆侾仃伻伴乘佌位佾俘侐乘京侚佃佁亢伸仯伸伶亢亢仯佯侈位侈亢仯佯伞乒伙伞侷俇伴伋乨京侬仍倬份伏僞仧享佴倂伐佌乳一一佊一一一一一侻倡一一一一仸僟侖仞一僠俳們乗侐侌仞佦今乪倻一一一佑乴一一一一一一一一一一一一一一一一一一一一一于乓俒傴一亷伕佤俔互伦仿侩俔侯乪佷伧一仿乹'
+HANGUL_JAMO = (('g', 'kk', 'n', 'd', 'tt', 'l', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h'), ('a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo', 'u', 'wo', 'we', 'wi', 'yu', 'eu', 'ui', 'i'), ('', 'g', 'kk', 'gs', 'n', 'nj', 'nh', 'd', 'l', 'lg', 'lm', 'lb', 'ls', 'lt', 'lp', 'lh', 'm', 'b', 'bs', 's', 'ss', 'ng', 'j', 'ch', 'k', 't', 'p', 'h'))
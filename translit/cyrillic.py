@@ -0,0 +1,7 @@
+# translit/cyrillic.py
+# Sinh bởi translit/_build.py từ anyascii 0.3.3 (ISC License, xem
+# translit/ANYASCII_LICENSE). Không sửa tay.
+RANGES = ((1024, 1328),)
+CODE_BASE = 0x4e00
+VALUES = ('', 'E', 'Dj', 'G', 'Ie', 'Dz', 'I', 'J', 'Lj', 'Nj', 'C', 'K', 'U', 'Dzh', 'A', 'B', 'V', 'D', 'Zh', 'Z', 'Y', 'L', 'M', 'N', 'O', 'P', 'R', 'S', 'T', 'F', 'Kh', 'Ts', 'Ch', 'Sh', 'Shch', "'", 'Yu', 'Ya', 'a', 'b', 'v', 'g', 'd', 'e', 'zh', 'z', 'i', 'y', 'k', 'l', 'm', 'n', 'o', 'p', 'r', 's', 't', 'u', 'f', 'kh', 'ts', 'ch', 'sh', 'shch', 'yu', 'ya', 'dj', 'ie', 'dz', 'j', 'lj', 'nj', 'c', 'dzh', 'Io', 'io', 'Ks', 'ks', 'Ps', 'ps', 'Ot', 'ot', 'Q', 'q', '1000', '.', '100000', '1000000', 'Jh', 'jh', 'Rh', 'rh', 'Gh', 'gh', 'Ng', 'ng', 'Ph', 'ph', 'W', 'w', 'Th', 'th', 'H', 'h', 'Gi', 'gi', 'Lh', 'lh', 'Nh', 'nh', 'Mh', 'mh', 'Ae', 'ae', 'Tsh', 'tsh', 'Xh', 'xh', 'X', 'x', 'Zj', 'zj', 'Sj', 'sj', 'Tj', 'tj', 'Lkh', 'lkh', 'Rkh', 'rkh', 'Ny', 'ny', 'Dch', 'dch')
+CODES = '丁丁丂七丄丅丆丆万丈三上下丆丌不与丏丐七丑丁丒专丆且下丕世丗丘丙业丛东丌丝丞丟丠両丢丣且丣丁两严並丧丨丩个丫丬中丮丯丰丱串丳临丵丶丷丸丹为主丼丽举丿丣丯丣丫乀乁丫丫乂丩乃乄丮丮久乆乇么丰丮丹义丘临丁丫丄乃丁丫丄乃丘临乊之乌乍乎乏丝为且丯且丯丌丹丘临丘临乐乑乒乓乔乕一一一乕乖乗乘乙丣丣乚乛七丩乜九乜九万久专中乒乓七丩乒乓乒乓乞也乞也习乡乢乣丛丷乤乥丌丹丌丹书乧丟丼万久上么书乧丠丽丠丽书乨乩乒乓乪乫乞也乬乭不义乮乯乧与並与並买乱丁丫与並丁丫不义万久丅乄丆丮丆丮丘临丘临且丯与並丌丹丌丹丌丹乲乳乜九且丯乴乵乶乷书乧丑个丂乂乸乹丅乄丈乆三乇乺乻乼乽与並丕丱乾乿亀亁与並乒乓乢乣乒乓丕丱丗丳习乡丣丣亂亃不义亄亅丕丱'
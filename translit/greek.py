@@ -0,0 +1,7 @@
+# translit/greek.py
+# Sinh bởi translit/_build.py từ anyascii 0.3.3 (ISC License, xem
+# translit/ANYASCII_LICENSE). Không sửa tay.
+RANGES = ((880, 1024), (7936, 8192))
+CODE_BASE = 0x4e00
+VALUES = ('', 'H', 'h', 'S', 's', "'", ',', 'W', 'w', 'i', 's.', ';', 'J', '"\'', 'A', 'E', 'I', 'O', 'Y', 'V', 'G', 'D', 'Z', 'Th', 'K', 'L', 'M', 'N', 'X', 'P', 'R', 'T', 'F', 'Ch', 'Ps', 'a', 'e', 'y', 'v', 'g', 'd', 'z', 'th', 'k', 'l', 'm', 'n', 'x', 'o', 'p', 'r', 't', 'f', 'ch', 'ps', '&', 'b', 'ph', 'Q', 'q', 'St', 'st', 'Sh', 'sh', 'j', 'C', 'c', 'Ti', 'ti', 'r.', 'S.', 'ha', 'Ha', 'he', 'He', 'hi', 'Hi', 'ho', 'Ho', 'hy', 'Hy', '~', '"~', "'`", "''", "'~", 'h`', "h'", 'h~', 'rh', 'Rh', '"`', '`')
+CODES = '丁丂七丄丅丆万丈一一三丄上上下丌一一一一丅不与下丏丐丐一丑一丒丑三与专且丕丏世丐丗丐丘丙业丛东丑丝丞一七丟丒丠両丢丑丐丒丣两三三严丣並丧丨两丩三个三丫丬中丮丯丰丱串丄丄丳严临丵丶丰三严丰严丰丷丸个丒丒丒丹丱丷为主丼丽万丈为主七丄举丿丠临东丯丁丂丌乀乁乂乃乄丫串丄乀丗两两举丿七七丄久七乆乆丣乇丣乇丣乇丣乇与么与么与么与么两义两义两义一一丏乊丏乊丏乊一一三之三之三之三之丐乌丐乌丐乌丐乌三之三之三之三之丐乌丐乌丐乌丐乌丰乍丰乍丰乍一一丑乎丑乎丑乎一一严乏严乏严乏严乏一乐一乐一乐一乐丰乍丰乍丰乍丰乍丑乎丑乎丑乎丑乎丣丣两两三三三三丰丰严严丰丰一一丣乇丣乇丣乇丣乇与么与么与么与么三之三之三之三之丐乌丐乌丐乌丐乌丰乍丰乍丰乍丰乍丑乎丑乎丑乎丑乎丣丣丣丣丣一丣丣与与与与与丅三丅乑乒三三三一三三丏丏丐丐丐乓乔乕三三三三一一三三丐丐丐丐一乖乗乘严严严严串乙严严丒丒丒丒乚乛不乜一一丰丰丰一丰丰丑丑丑丑丑丅丂一'
@@ -0,0 +1,7 @@
+# translit/latin.py
+# Sinh bởi translit/_build.py từ anyascii 0.3.3 (ISC License, xem
+# translit/ANYASCII_LICENSE). Không sửa tay.
+RANGES = ((192, 592), (7680, 7936))
+CODE_BASE = 0x4e00
+VALUES = ('', 'Ae', 'D', 'O', 'Th', 'ss', 'ae', 'd', 'o', 'th', 'H', 'h', 'i', 'q', 'L', 'l', 'Ng', 'ng', 'Oe', 'oe', 'T', 't', 'b', 'B', '6', 'C', 'c', 'z', 'E', 'F', 'f', 'G', 'hw', 'I', 'K', 'k', 'W', 'N', 'n', 'Gh', 'gh', 'P', 'p', 'R', '2', 'Sh', 'sh', 'U', 'V', 'Y', 'y', 'Z', 'Zh', '`', 'zh', 'dz', '5', 'ts', 'w', 'x', 'qc', 'e', 'g', 'Hw', 'Ou', 'ou', 'j', 'db', 'qp', 'A', 's', "'", 'J', 'Q', 'r', 's.', 'Ss', 'Ll', 'll', 'v')
+CODES = '一一一一一一丁一一一一一一一一一丂一一一一一一一七一一一一一丄丅一一一一一一丆一一一一一一一一一万一一一一一一一丈一一一一一三一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一上下一一一一一一一一一丌一一一一一一不一一一一一一一一与丏一一一一一一一丐丑一一一一一一丒专一一一一一一一一一一一一一一一一一一且丕一一一一一一一一一一一一一一一一一一一一一一一一世丗丗世丘丘七丙业丂丂丂万丛东东东丝丞丟丟丠両両丢丣丏丏两严並七一一丧丨丩个丫丬丬中丮丕且丕且一一丯丰丱串丳丛临丵丵丶丷丸丸丹为业主丼不一一一一一一一一一一一一一一一一一一一一一一一一一丽一一一一丁丆丟举一一一一一一一一临丶一一一一一一丿两一一一一丁丆七丈一一一一一一一一一一一一一一一一一一一一一一一一一一一一丱串一一严万乀乁丳丛一一一一一一一一一一一一一一丏並丕乂乃乄久丙业与且乆丛乇乇丗丯久东丽么乂义不丫乊丱串一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一之之乌万一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一一乍乎丰乏丱串'
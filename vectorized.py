@@ -0,0 +1,106 @@
+# vectorized.py
+"""
+Slugify cả cột thay cho .apply từng dòng.
+
+    from vectorized import slugify_array
+    slugify_array(np.array(titles, dtype=object), max_len=80)  # ndarray cùng shape
+    slugify_array(df["title"])                                 # pandas Series, giữ index
+    slugify_array(pa.array(titles))                            # pyarrow (Chunked)Array
+
+NumPy/pandas/pyarrow là tùy chọn: module vẫn import được khi thiếu, khi đó
+nhận list/tuple và trả về list. Giá trị không phải str (None, NaN, pd.NA)
+được giữ nguyên, chuỗi rỗng cho chuỗi rỗng.
+"""
+from __future__ import annotations
+from typing import Any, List, Optional, Sequence
+
+from slugify import _BATCH_CHUNKSIZE, Slugifier, _get_slugifier
+
+try:
+    import numpy as np
+except ImportError:  # numpy là tùy chọn
+    np = None
+
+def _slugify_values(values: List[Any], slugifier: Slugifier, chunksize: int) -> List[Any]:
+    """Slugify các phần tử str theo batch (chuẩn hóa/gộp token trên cả chunk), giữ nguyên phần còn lại."""
+    if all(type(v) is str for v in values):
+        return slugifier.many(values, chunksize)
+    idx = [i for i, v in enumerate(values) if isinstance(v, str)]
+    out = list(values)
+    for i, slug in zip(idx, slugifier.many([values[i] for i in idx], chunksize)):
+        out[i] = slug
+    return out
+
+def _slugify_ndarray(arr, slugifier: Slugifier, chunksize: int):
+    flat = arr.ravel().tolist()
+    kind = arr.dtype.kind
+    if kind == "S":
+        # Chuỗi bytes cố định độ dài: đi đường UTF-8 không decode
+        out = [slugifier.slugify_bytes(b) for b in flat]
+        return np.array(out, dtype="S").reshape(arr.shape)
+    out = _slugify_values(flat, slugifier, chunksize)
+    if kind == "U":
+        return np.array(out, dtype="U").reshape(arr.shape)
+    if kind == "T":  # StringDType (NumPy 2): giữ dtype (và na_object) gốc
+        return np.array(out, dtype=arr.dtype).reshape(arr.shape)
+    result = np.empty(len(out), dtype=object)
+    result[:] = out
+    return result.reshape(arr.shape)
+
+def _slugify_arrow(values, slugifier: Slugifier, chunksize: int):
+    import pyarrow as pa
+    if isinstance(values, pa.ChunkedArray):
+        chunks = [_slugify_arrow(chunk, slugifier, chunksize) for chunk in values.chunks]
+        return pa.chunked_array(chunks, type=values.type)
+    out = _slugify_values(values.to_pylist(), slugifier, chunksize)
+    return pa.array(out, type=values.type)
+
+def _slugify_categorical(values, slugifier: Slugifier, chunksize: int):
+    """
+    Series category: slugify mỗi category một lần rồi ánh xạ lại code (slug trùng thì gộp).
+
+    Chỉ dùng khi suffix tất định (none, hash, date/datetime trong cùng lời gọi).
+    """
+    cat = values.array
+    slugs = _slugify_values(cat.categories.tolist(), slugifier, chunksize)
+    new_index: dict = {}
+    remap = [new_index.setdefault(slug, len(new_index)) for slug in slugs]
+    # Code -1 (giá trị thiếu) trỏ vào phần tử cuối, vẫn là -1
+    codes = np.asarray(remap + [-1], dtype=cat.codes.dtype)[cat.codes]
+    out = type(cat).from_codes(codes, list(new_index), ordered=cat.ordered)
+    return type(values)(out, index=values.index, name=values.name)
+
+def slugify_array(
+    values: Sequence[Any],
+    /,
+    *,
+    max_len: Optional[int] = None,
+    suffix_mode: str = "none",
+    chunksize: int = _BATCH_CHUNKSIZE,
+):
+    """
+    Slugify cả cột, trả về cột cùng kiểu và shape.
+
+    Nhận ndarray (object/str/bytes/StringDType, mọi số chiều), pandas
+    Series, pyarrow Array/ChunkedArray hoặc sequence thường (trả về list).
+    Mỗi phần tử str cho kết quả giống hệt slugify_tieng_viet.
+    """
+    slugifier = _get_slugifier(max_len, suffix_mode)
+    if np is not None and isinstance(values, np.ndarray):
+        return _slugify_ndarray(values, slugifier, chunksize)
+    module = type(values).__module__
+    if module.startswith("pyarrow"):
+        return _slugify_arrow(values, slugifier, chunksize)
+    if module.startswith("pandas"):
+        # Series: không import pandas, dựng lại cùng kiểu với index/name gốc
+        dtype = values.dtype
+        if dtype.name == "category" and not slugifier.suffix_mode.startswith("random"):
+            # Suffix ngẫu nhiên phải khác nhau từng dòng: đi đường từng phần tử bên dưới
+            return _slugify_categorical(values, slugifier, chunksize)
+        out = _slugify_values(values.tolist(), slugifier, chunksize)
+        # Chỉ giữ dtype chuỗi (object/string); dtype khác (kể cả category) không chứa được slug
+        keep = dtype == object or dtype.name.startswith("str")
+        return type(values)(out, index=values.index, name=values.name, dtype=dtype if keep else None)
+    return _slugify_values(list(values), slugifier, chunksize)
+
+__all__ = ["slugify_array"]